@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Asset manifest for the images a .pen design references.
+
+    python assets.py build website.pen     # writes website.assets.json
+    python assets.py check website.pen     # exit 1 on missing/stale assets
+
+The manifest sits next to the design and records, per image URL, its
+repository-relative path (None for remote URLs), size, content hash and
+pixel dimensions, plus the node ids that use it. Paths are relative to
+the repository, so tools resolve "./images/generated-*.png" the same way
+on any checkout; pen_html.py maps image URLs through resolve().
+
+Modification times differ on every checkout, so they are not committed:
+check() keeps the (size, mtime) at which each file last matched its hash
+in the local cache (.cache/asset-stats.json). A missing or resized file
+is caught from os.stat alone, and a same-size file is re-hashed only
+when its mtime is not the one cached.
+"""
+
+import json
+import os
+import sys
+
+from PIL import Image
+
+import penfile
+from buildcache import cache_path, file_hash
+from pen_journal import load_current
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_VERSION = 2
+STATS = "asset-stats.json"
+REMOTE = ("http://", "https://")
+
+
+def repo_path(path):
+    """Repository-relative POSIX form of ``path``."""
+    rel = os.path.relpath(os.path.abspath(path), REPO_ROOT)
+    return rel.replace(os.sep, "/")
+
+
+def manifest_path(pen_path):
+    return os.path.splitext(pen_path)[0] + ".assets.json"
+
+
+def image_refs(doc):
+    """Map image URL -> ids of the nodes whose fill or stroke uses it."""
+    refs = {}
+    stack = list(doc.get("children", ()))
+    while stack:
+        node = stack.pop()
+        for key in penfile.FILL_KEYS:
+            value = node.get(key)
+            if key == "stroke" and isinstance(value, dict):
+                value = value.get("fill")
+            for fill in value if isinstance(value, list) else [value]:
+                if isinstance(fill, dict) and fill.get("type") == "image":
+                    refs.setdefault(fill["url"], []).append(node["id"])
+        stack.extend(node.get("children", ()))
+    return {url: sorted(ids) for url, ids in sorted(refs.items())}
+
+
+class AssetManifest:
+    def __init__(self, pen_path, entries=None):
+        self.pen_path = pen_path
+        self.path = manifest_path(pen_path)
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, pen_path):
+        """Read the manifest for ``pen_path``, building it if absent."""
+        path = manifest_path(pen_path)
+        if not os.path.exists(path):
+            return cls.build(pen_path)
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != MANIFEST_VERSION:
+            return cls.build(pen_path)
+        return cls(pen_path, data["assets"])
+
+    @classmethod
+    def build(cls, pen_path, doc=None):
+        """Manifest for the images ``doc`` (default: the design) uses."""
+        manifest = cls(pen_path)
+        base = os.path.dirname(os.path.abspath(pen_path))
+        if doc is None:
+            doc = load_current(pen_path)
+        for url, nodes in image_refs(doc).items():
+            entry = {"path": None, "nodes": nodes}
+            if not url.startswith(REMOTE):
+                entry["path"] = repo_path(os.path.join(base, url))
+                entry.update(describe(os.path.join(REPO_ROOT, entry["path"])))
+            manifest.entries[url] = entry
+        return manifest
+
+    def save(self):
+        data = {"version": MANIFEST_VERSION,
+                "pen": repo_path(self.pen_path), "assets": self.entries}
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        os.replace(tmp, self.path)
+
+    def resolve(self, url):
+        """Absolute local path for ``url`` (None for remote assets)."""
+        entry = self.entries[url]
+        if entry["path"] is None:
+            return None
+        return os.path.join(REPO_ROOT, *entry["path"].split("/"))
+
+    def check(self):
+        """Return [(url, problem)] for missing or stale local assets.
+
+        Files whose size matches the manifest and whose mtime matches the
+        local stat cache are not opened; otherwise the content hash
+        decides, and a match is recorded in the cache for next time.
+        """
+        problems = []
+        stats = read_stats()
+        seen = dict(stats)
+        for url, entry in self.entries.items():
+            local = self.resolve(url)
+            if local is None:
+                continue
+            try:
+                st = os.stat(local)
+            except FileNotFoundError:
+                problems.append((url, "missing"))
+                continue
+            stat = [st.st_size, st.st_mtime_ns, entry.get("sha256")]
+            if st.st_size != entry.get("bytes"):
+                problems.append((url, "stale"))
+            elif stats.get(local) != stat:
+                if file_hash(local) != entry.get("sha256"):
+                    problems.append((url, "stale"))
+                else:
+                    stats[local] = stat
+        if stats != seen:
+            write_stats(stats)
+        return problems
+
+
+def describe(path):
+    """Size, hash and pixel size of a local image (or missing)."""
+    if not os.path.exists(path):
+        return {"missing": True}
+    with Image.open(path) as im:  # reads the header only
+        width, height = im.size
+    return {"bytes": os.path.getsize(path), "sha256": file_hash(path),
+            "width": width, "height": height}
+
+
+def read_stats():
+    """Local path -> [size, mtime_ns, sha256] last seen matching."""
+    try:
+        with open(cache_path(STATS), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def write_stats(stats):
+    path = cache_path(STATS)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(stats, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def main(argv):
+    if len(argv) != 2 or argv[0] not in ("build", "check"):
+        print(__doc__, file=sys.stderr)
+        sys.exit(2)
+    command, pen_path = argv
+    if command == "build":
+        manifest = AssetManifest.build(pen_path)
+        manifest.save()
+        remote = sum(e["path"] is None for e in manifest.entries.values())
+        print(f"Wrote {manifest.path}: {len(manifest.entries)} assets "
+              f"({remote} remote)")
+        return
+    problems = AssetManifest.load(pen_path).check()
+    for url, problem in problems:
+        print(f"{problem}: {url}")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,36 @@
+"""Shared on-disk cache location and content hashing for build stages.
+
+Set BLOCKTRACE_CACHE_DIR to move the cache (default: ./.cache).
+"""
+
+import hashlib
+import os
+
+CACHE_DIR = os.environ.get("BLOCKTRACE_CACHE_DIR", ".cache")
+
+_file_hashes = {}
+
+
+def cache_path(*parts):
+    """Return a path under the cache dir, creating its parent directory."""
+    path = os.path.join(CACHE_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def bytes_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path):
+    """SHA-256 of a file, memoised on (path, size, mtime) for this process."""
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+    digest = _file_hashes.get(key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = _file_hashes[key] = h.hexdigest()
+    return digest
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Full-text search over .pen text nodes and PPTX text frames.
+
+    python deck_search.py index pitch-deck.pen website.pen *.pptx
+    python deck_search.py query "token packs"
+    python deck_search.py query 'certif* NOT expiry' -n 5
+
+Text is stored in an SQLite FTS5 table in the shared cache
+(.cache/search.sqlite). Indexing is incremental: each file's content hash
+is recorded (for a .pen, snapshot plus journal), and a file is re-read
+only when its hash changes (the hash itself is memoised on size and mtime,
+see buildcache.py). Hits carry the file, the node id (the .pen node id, or
+the PPTX shape id) and the slide name (for a PPTX, "NN - Title", titled as
+pptx_inspect.py does it), so a result can be opened with pen_query.py or
+pen_journal.py. FTS5 cannot index the path column, so a side table maps
+each path to its rowids and a file's old rows are deleted by rowid.
+Queries use FTS5 syntax: words, "phrases", prefix*, AND/OR/NOT.
+"""
+
+import argparse
+import collections
+import os
+import sqlite3
+import sys
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from buildcache import cache_path, file_hash
+from pen_journal import current_hash, load_current
+
+INDEX_VERSION = 2
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, hash TEXT,
+                                  entries INTEGER);
+CREATE TABLE IF NOT EXISTS text_rows (id INTEGER PRIMARY KEY,
+                                      path TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS text_rows_path ON text_rows (path);
+CREATE VIRTUAL TABLE IF NOT EXISTS texts USING fts5(
+    content, path UNINDEXED, node UNINDEXED, slide UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2');
+"""
+
+# Font sizes pptx_inspect weighs when no title placeholder is present
+_SIZES = ".//a:rPr/@sz | .//a:endParaRPr/@sz | .//a:defRPr/@sz"
+
+Hit = collections.namedtuple("Hit", "path node slide snippet")
+
+
+def default_db():
+    return cache_path("search.sqlite")
+
+
+def pen_texts(path):
+    """Yield (node id, slide name, text) for every text node in a .pen."""
+    for slide in load_current(path).get("children", ()):
+        name = slide.get("name", "")
+        stack = [slide]
+        while stack:
+            node = stack.pop()
+            if node.get("type") == "text" and node.get("content"):
+                yield node["id"], name, node["content"]
+            stack.extend(reversed(node.get("children", ())))
+
+
+def pptx_texts(path):
+    """Yield (shape id, slide name, text) for every PPTX text frame."""
+    def walk(shapes):
+        for shape in shapes:
+            if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+                yield from walk(shape.shapes)
+            elif shape.has_text_frame and shape.text_frame.text.strip():
+                yield shape, shape.text_frame.text
+
+    for number, slide in enumerate(Presentation(path).slides, 1):
+        found = list(walk(slide.shapes))
+        title = slide_title(slide, found).split("\n")[0].strip()
+        name = (f"{number:02d} - {title}" if title
+                else slide.name or f"Slide {number:02d}")
+        for shape, text in found:
+            yield str(shape.shape_id), name, text
+
+
+def slide_title(slide, texts):
+    """Title as pptx_inspect finds it: a title placeholder's text, else the
+    first of ``texts`` ((shape, text) pairs) with the largest font size."""
+    placeholder = slide.shapes.title
+    if placeholder is not None and placeholder.text_frame.text.strip():
+        return placeholder.text_frame.text
+    title, title_size = "", None
+    for shape, text in texts:
+        size = max((int(sz) for sz in shape._element.xpath(_SIZES)),
+                   default=0)
+        if title_size is None or size > title_size:
+            title, title_size = text, size
+    return title
+
+
+class SearchIndex:
+    def __init__(self, db_path=None):
+        self.db = sqlite3.connect(db_path or default_db())
+        version, = self.db.execute("PRAGMA user_version").fetchone()
+        if version != INDEX_VERSION:
+            self.db.executescript("DROP TABLE IF EXISTS files;"
+                                  "DROP TABLE IF EXISTS text_rows;"
+                                  "DROP TABLE IF EXISTS texts;")
+            self.db.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        self.db.executescript(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def _forget(self, path):
+        """Delete the rows of ``path`` by rowid (path is not indexed)."""
+        self.db.execute("DELETE FROM texts WHERE rowid IN "
+                        "(SELECT id FROM text_rows WHERE path = ?)", (path,))
+        self.db.execute("DELETE FROM text_rows WHERE path = ?", (path,))
+
+    def update(self, paths):
+        """Index ``paths``; returns the paths that were (re)read."""
+        changed = []
+        with self.db:
+            for path in paths:
+                key = os.path.abspath(path)
+                digest = (current_hash(path) if path.endswith(".pen")
+                          else file_hash(path))
+                row = self.db.execute("SELECT hash FROM files WHERE path = ?",
+                                      (key,)).fetchone()
+                if row and row[0] == digest:
+                    continue
+                texts = pen_texts if path.endswith(".pen") else pptx_texts
+                self._forget(key)
+                first, = self.db.execute(
+                    "SELECT coalesce(max(id), 0) + 1 FROM text_rows"
+                ).fetchone()
+                rows = [(rowid, text, key, node, slide) for rowid, (
+                    node, slide, text) in enumerate(texts(path), first)]
+                self.db.executemany("INSERT INTO texts (rowid, content, path, "
+                                    "node, slide) VALUES (?, ?, ?, ?, ?)",
+                                    rows)
+                self.db.executemany("INSERT INTO text_rows VALUES (?, ?)",
+                                    [(row[0], key) for row in rows])
+                self.db.execute("INSERT OR REPLACE INTO files "
+                                "VALUES (?, ?, ?)", (key, digest, len(rows)))
+                changed.append(path)
+        return changed
+
+    def prune(self):
+        """Drop files that no longer exist; returns how many were dropped."""
+        gone = [path for (path,) in self.db.execute("SELECT path FROM files")
+                if not os.path.exists(path)]
+        with self.db:
+            for path in gone:
+                self._forget(path)
+                self.db.execute("DELETE FROM files WHERE path = ?", (path,))
+        return len(gone)
+
+    def search(self, query, limit=20):
+        """Best-ranked hits for an FTS5 ``query``."""
+        rows = self.db.execute(
+            "SELECT path, node, slide, snippet(texts, 0, '[', ']', '…', 12) "
+            "FROM texts WHERE texts MATCH ? ORDER BY rank LIMIT ?",
+            (query, limit))
+        return [Hit(os.path.relpath(path), node, slide, snippet)
+                for path, node, slide, snippet in rows]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db",
+                        help="index file (default: .cache/search.sqlite)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ix = sub.add_parser("index", help="add or refresh .pen/.pptx files")
+    ix.add_argument("paths", nargs="+")
+    qy = sub.add_parser("query", help="search the indexed text")
+    qy.add_argument("query")
+    qy.add_argument("-n", "--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    index = SearchIndex(args.db)
+    try:
+        if args.command == "index":
+            changed = index.update(args.paths)
+            pruned = index.prune()
+            print(f"Indexed {len(changed)} of {len(args.paths)} files "
+                  f"({len(args.paths) - len(changed)} unchanged, "
+                  f"{pruned} removed)")
+            return
+        try:
+            hits = index.search(args.query, args.limit)
+        except sqlite3.OperationalError as exc:
+            sys.exit(f"bad query {args.query!r}: {exc}")
+        for hit in hits:
+            print(f"{hit.path}\t{hit.node}\t{hit.slide}\t{hit.snippet}")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
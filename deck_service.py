@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""Local HTTP service that renders decks from a pool of warm workers.
+
+Worker processes import python-pptx and build a throwaway deck at start-up,
+so requests pay neither interpreter start nor template parsing.
+
+    python deck_service.py --port 8765 --workers 4
+
+    POST /deck      body: deck spec JSON (see deck_spec.py), or {} for the
+                    pitch deck built from pitch-deck.pen  ->  PPTX bytes
+    POST /pen       body: {"document": {...}, "edits": [{"id": node_id,
+                    "set": {field: value}}]}  ->  edited .pen JSON
+    GET  /healthz
+
+Backpressure: at most --workers renders run at once and --queue more may
+wait; anything beyond that gets 503 with Retry-After. Requests exceeding
+--timeout get 504 (the worker finishes the abandoned job in the
+background). A crashed worker breaks the whole process pool, so the pool
+is replaced and the request that hit it gets 500. Identical deck requests
+are served from a small LRU cache, which is safe because rendering is
+byte-reproducible. A POST without a Content-Length gets 411.
+"""
+
+import argparse
+import asyncio
+import collections
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from pen_content import DEFAULT_PEN
+from pen_journal import current_hash
+
+PPTX_TYPE = ("application/vnd.openxmlformats-officedocument."
+             "presentationml.presentation")
+MAX_BODY = 16 * 1024 * 1024
+CHUNK = 64 * 1024
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 411: "Length Required",
+           413: "Payload Too Large",
+           500: "Internal Server Error", 503: "Service Unavailable",
+           504: "Gateway Timeout"}
+
+
+# ── Worker side ─────────────────────────────────────────────────────────
+def _warm_worker():
+    import generate_pptx
+    generate_pptx.build_presentation()
+
+
+def render_deck(spec):
+    from deck_writer import presentation_bytes
+
+    if spec.get("slides"):
+        from deck_spec import build_from_spec
+        prs = build_from_spec(spec)
+    else:
+        from generate_pptx import build_presentation
+        from pen_content import load_content
+        prs = build_presentation(content=load_content())
+    return presentation_bytes(prs)
+
+
+def apply_pen_edits(document, edits):
+    import penfile
+
+    doc = penfile.expand_styles(document)
+    index = {}
+    stack = list(doc.get("children", ()))
+    while stack:
+        node = stack.pop()
+        index[node["id"]] = node
+        stack.extend(node.get("children", ()))
+    for edit in edits:
+        node = index.get(edit.get("id"))
+        if node is None:
+            raise KeyError(f"unknown node id {edit.get('id')!r}")
+        node.update(edit.get("set", {}))
+    return penfile.dumps(doc).encode("utf-8")
+
+
+# ── Server side ─────────────────────────────────────────────────────────
+def _pen_version():
+    return current_hash(DEFAULT_PEN) if os.path.exists(DEFAULT_PEN) else ""
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message=""):
+        super().__init__(message)
+        self.status = status
+
+
+def content_length(method, headers):
+    """Body length from the headers; POST bodies must declare one."""
+    value = headers.get("content-length")
+    if value is None:
+        if method == "POST":
+            raise HTTPError(411, "Content-Length required")
+        return 0
+    if not value.isdigit():
+        raise HTTPError(400, f"bad Content-Length {value!r}")
+    return int(value)
+
+
+def check_pen_payload(payload):
+    """Reject /pen bodies apply_pen_edits cannot apply safely (400)."""
+    if not isinstance(payload.get("document"), dict):
+        raise HTTPError(400, '"document" must be a JSON object')
+    edits = payload.get("edits", [])
+    if not isinstance(edits, list):
+        raise HTTPError(400, '"edits" must be a list')
+    for n, edit in enumerate(edits):
+        if not isinstance(edit, dict) or not isinstance(edit.get("set", {}),
+                                                        dict):
+            raise HTTPError(400, f'edit {n} must be {{"id": ..., "set": '
+                                 '{...}}')
+        # As in PenSession.apply: these would break the node index
+        for field in ("id", "children"):
+            if field in edit.get("set", {}):
+                raise HTTPError(400, f"edit {n} cannot set {field!r}")
+
+
+class DeckService:
+    def __init__(self, workers=4, queue=16, timeout=30.0, cache_size=32):
+        self.workers = workers
+        self.pool = self._new_pool()
+        self.slots = asyncio.Semaphore(workers)
+        self.max_pending = workers + queue
+        self.pending = 0
+        self.timeout = timeout
+        self.cache = collections.OrderedDict()
+        self.cache_size = cache_size
+
+    def _new_pool(self):
+        return ProcessPoolExecutor(max_workers=self.workers,
+                                   initializer=_warm_worker)
+
+    def _replace_pool(self, broken):
+        # Several requests can see the same broken pool; replace it once
+        if self.pool is broken:
+            self.pool = self._new_pool()
+            broken.shutdown(wait=False, cancel_futures=True)
+
+    async def warm_up(self, workers):
+        loop = asyncio.get_running_loop()
+        # One no-op per worker forces every process (and its initializer)
+        # to start before we accept traffic
+        await asyncio.gather(*(loop.run_in_executor(self.pool, int)
+                               for _ in range(workers)))
+
+    async def run(self, fn, *args):
+        if self.pending >= self.max_pending:
+            raise HTTPError(503, "render queue full")
+        self.pending += 1
+        pool = None
+        try:
+            async with self.slots:
+                loop = asyncio.get_running_loop()
+                pool = self.pool
+                return await asyncio.wait_for(
+                    loop.run_in_executor(pool, fn, *args), self.timeout)
+        except asyncio.TimeoutError:
+            raise HTTPError(504, f"render exceeded {self.timeout:g}s")
+        except BrokenProcessPool:
+            self._replace_pool(pool)
+            raise HTTPError(500, "render worker crashed; workers restarted")
+        finally:
+            self.pending -= 1
+
+    async def render(self, spec):
+        key = hashlib.sha256(
+            json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+        if not spec.get("slides"):
+            # The pitch deck follows pitch-deck.pen, so edits must miss
+            key += _pen_version()
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        data = await self.run(render_deck, spec)
+        self.cache[key] = data
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return data
+
+    async def dispatch(self, method, path, body):
+        if path == "/healthz":
+            return 200, "text/plain", b"ok\n"
+        if path not in ("/deck", "/pen"):
+            raise HTTPError(404)
+        if method != "POST":
+            raise HTTPError(405)
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError as e:
+            raise HTTPError(400, f"invalid JSON: {e}")
+        if not isinstance(payload, dict):
+            raise HTTPError(400, "body must be a JSON object")
+        if path == "/deck":
+            slides = payload.get("slides", [])
+            if not (isinstance(slides, list)
+                    and all(isinstance(x, dict) for x in slides)):
+                raise HTTPError(400, '"slides" must be a list of objects')
+            return 200, PPTX_TYPE, await self.render(payload)
+        check_pen_payload(payload)
+        try:
+            data = await self.run(apply_pen_edits, payload["document"],
+                                  payload.get("edits", []))
+        except KeyError as e:
+            raise HTTPError(400, str(e))
+        return 200, "application/json", data
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, _ = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                # Until the body is read, the next request's start is unknown
+                framed = False
+                try:
+                    length = content_length(method, headers)
+                    if length > MAX_BODY:
+                        raise HTTPError(413)
+                    body = await reader.readexactly(length) if length else b""
+                    framed = True
+                    status, ctype, data = await self.dispatch(
+                        method, path.split("?", 1)[0], body)
+                except HTTPError as e:
+                    status, ctype = e.status, "text/plain"
+                    data = f"{REASONS[status]}: {e}\n".encode("utf-8")
+                except Exception as e:  # worker crash or bad spec
+                    status, ctype = 500, "text/plain"
+                    data = f"{type(e).__name__}: {e}\n".encode("utf-8")
+
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and framed)
+                head = [f"HTTP/1.1 {status} {REASONS[status]}",
+                        f"Content-Type: {ctype}",
+                        f"Content-Length: {len(data)}",
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                if status == 503:
+                    head.append("Retry-After: 1")
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+                # Stream in chunks so slow clients push back on us
+                for i in range(0, len(data), CHUNK):
+                    writer.write(data[i:i + CHUNK])
+                    await writer.drain()
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+async def serve(host, port, workers, queue, timeout):
+    service = DeckService(workers, queue, timeout)
+    await service.warm_up(workers)
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"Deck service on http://{host}:{port} ({workers} warm workers)",
+          file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue", type=int, default=16,
+                        help="requests allowed to wait for a worker")
+    parser.add_argument("--timeout", type=float, default=30.0,
+                        help="per-request render timeout in seconds")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.queue,
+                          args.timeout))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Render a JSON deck spec into a PPTX using the generate_pptx helpers.
+
+A spec is a list of generic content slides in the pitch-deck style:
+
+    {"slides": [{"label": "THE PROBLEM",
+                 "title": "Traceability Is Broken",
+                 "description": "...",
+                 "cards": [{"icon": "*", "title": "...", "desc": "..."}],
+                 "images": ["images/chart.png"],
+                 "section": "Appendix A"}]}
+
+"section" is optional and only used to group slides when splitting very
+large decks (see deck_split.py).
+
+    python deck_spec.py spec.json -o deck.pptx
+"""
+
+import argparse
+import functools
+import json
+
+from pptx.util import Inches
+
+import tracing
+from deck_writer import save_presentation
+from generate_pptx import (SLIDE_W, add_card, add_description,
+                           add_section_label, add_slide_number, add_title,
+                           new_presentation, set_slide_bg)
+from layout import fit_grid
+
+MARGIN = Inches(0.83)
+GRID_TOP = Inches(3.0)
+GRID_BOTTOM = Inches(6.8)
+GAP = Inches(0.2)
+MAX_COLUMNS = 4
+IMAGE_W = Inches(3.2)
+
+
+@functools.lru_cache(maxsize=256)
+def slide_layout(n_cards, n_images):
+    """(card boxes, image boxes) for a slide; appendix slides share shapes."""
+    grid_w = SLIDE_W - 2 * MARGIN
+    images = None
+    if n_images:
+        # Images take a column on the right of the card grid
+        grid_w -= IMAGE_W + GAP
+        images = fit_grid(n_images, MARGIN + grid_w + GAP, GRID_TOP, IMAGE_W,
+                          GRID_BOTTOM - GRID_TOP, columns=1, gap=GAP)
+    cards = None
+    if n_cards:
+        cards = fit_grid(n_cards, MARGIN, GRID_TOP, grid_w,
+                         GRID_BOTTOM - GRID_TOP, columns=MAX_COLUMNS, gap=GAP)
+    return cards, images
+
+
+def add_spec_slide(prs, layout, spec, number):
+    slide = prs.slides.add_slide(layout)
+    set_slide_bg(slide)
+    if spec.get("label"):
+        add_section_label(slide, spec["label"])
+    if spec.get("title"):
+        add_title(slide, spec["title"], width=Inches(10))
+    if spec.get("description"):
+        add_description(slide, spec["description"], width=Inches(6.5))
+
+    images = spec.get("images", [])
+    cards = spec.get("cards", [])
+    card_boxes, image_boxes = slide_layout(len(cards), len(images))
+    if images:
+        with tracing.span("images", count=len(images)):
+            for path, (x, y, w, h) in zip(images, image_boxes or ()):
+                slide.shapes.add_picture(path, x, y, w, h)
+    for card, (x, y, w, h) in zip(cards, card_boxes or ()):
+        add_card(slide, x, y, w, h,
+                 card.get("title", ""), card.get("desc", ""),
+                 icon_text=card.get("icon", "*"))
+    add_slide_number(slide, number)
+    return slide
+
+
+def build_from_spec(spec, prs=None, first_number=None):
+    prs = prs or new_presentation()
+    layout = prs.slide_layouts[6]
+    first_number = first_number or len(prs.slides) + 1
+    for n, slide_spec in enumerate(spec["slides"], first_number):
+        add_spec_slide(prs, layout, slide_spec, n)
+    return prs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("spec")
+    parser.add_argument("-o", "--output", default="deck.pptx")
+    args = parser.parse_args(argv)
+    with open(args.spec, encoding="utf-8") as f:
+        spec = json.load(f)
+    prs = build_from_spec(spec)
+    written = save_presentation(prs, args.output)
+    print(f"{'Saved' if written else 'Unchanged'} {args.output} "
+          f"— {len(prs.slides)} slides")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Split a very large deck spec into PPTX parts built in parallel.
+
+Slides are packed in order into parts that stay under a size budget
+(and, with --by-section, never straddle a section boundary). Each part is
+built and written to disk by its own worker process, which hands back
+only the part's file name, slide range and size; a small index deck links
+the parts by relative file name:
+
+    python deck_split.py spec.json -o build/register/deck.pptx \\
+        --max-mb 20 --by-section -j 8
+
+writes build/register/deck.pptx (the index) plus deck.part001.pptx, ...
+
+Part sizes are estimated up front from text length and image bytes, then
+checked after saving; a part that still comes out over the limit is halved
+and rebuilt in the same worker. Slide numbers continue across parts.
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from pptx.util import Inches
+
+from deck_spec import build_from_spec
+from deck_writer import (presentation_bytes, replace_if_changed,
+                         save_presentation)
+from generate_pptx import (ACCENT, GRAY_LIGHT, add_description,
+                           add_section_label, add_slide_number, add_text_box,
+                           add_title, new_presentation, set_slide_bg)
+from layout import stack
+
+# Rough compressed cost of the template, a card slide and a text character,
+# measured on scale_gen output; only used to plan parts before building
+BASE_BYTES = 32 * 1024
+SLIDE_BYTES = 1200
+TEXT_BYTES = 0.4
+INDEX_ROWS = 12
+
+
+def section_of(slide):
+    return slide.get("section") or ""
+
+
+def estimate_bytes(slide, seen_images=()):
+    """Planned cost of ``slide`` in a part already holding ``seen_images``."""
+    size = SLIDE_BYTES
+    size += TEXT_BYTES * sum(len(slide.get(k, "")) for k in
+                             ("label", "title", "description"))
+    for card in slide.get("cards", ()):
+        size += 200 + TEXT_BYTES * (len(card.get("title", ""))
+                                    + len(card.get("desc", "")))
+    # python-pptx stores each distinct image once per package
+    for path in set(slide.get("images", ())) - set(seen_images):
+        size += os.path.getsize(path)
+    return int(size)
+
+
+def plan_parts(slides, max_bytes, max_slides=None, by_section=False):
+    """Pack consecutive slides into parts; returns lists of slide indexes."""
+    parts, current, size, seen = [], [], BASE_BYTES, set()
+    for i, slide in enumerate(slides):
+        cost = estimate_bytes(slide, seen)
+        boundary = (by_section and current
+                    and section_of(slide) != section_of(slides[current[-1]]))
+        full = current and (size + cost > max_bytes
+                            or (max_slides and len(current) >= max_slides))
+        if boundary or full:
+            parts.append(current)
+            current, size, seen = [], BASE_BYTES, set()
+            cost = estimate_bytes(slide)
+        current.append(i)
+        seen.update(slide.get("images", ()))
+        size += cost
+    if current:
+        parts.append(current)
+    return parts
+
+
+def part_path(output, n):
+    root, ext = os.path.splitext(output)
+    return f"{root}.part{n:03d}{ext or '.pptx'}"
+
+
+def _render(slides, first_number):
+    return presentation_bytes(build_from_spec({"slides": slides},
+                                              first_number=first_number))
+
+
+def _render_under(slides, first_number, max_bytes):
+    """[(slides, data)] for ``slides``, halving until each fits max_bytes."""
+    data = _render(slides, first_number)
+    if len(data) <= max_bytes or len(slides) == 1:
+        return [(slides, data)]
+    half = len(slides) // 2
+    return (_render_under(slides[:half], first_number, max_bytes)
+            + _render_under(slides[half:], first_number + half, max_bytes))
+
+
+def _write_part(path, data):
+    """Write a finished part next to its final name, flushed to disk."""
+    with open(path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def build_part(job):
+    """Worker: render one planned part, splitting it further if needed, and
+    write each resulting file to ``<output>.jobNNN.K.tmp``.
+
+    Returns [{"tmp", "first", "slides", "sections", "bytes"}]; the part
+    bytes never travel back to the parent.
+    """
+    slides, first_number, max_bytes, tmp_root = job
+    out = []
+    for k, (chunk, data) in enumerate(
+            _render_under(slides, first_number, max_bytes)):
+        sections = list(dict.fromkeys(section_of(s) for s in chunk if
+                                      section_of(s)))
+        tmp = f"{tmp_root}.{k}.tmp"
+        _write_part(tmp, data)
+        out.append({"tmp": tmp, "first": first_number, "slides": len(chunk),
+                    "sections": sections, "bytes": len(data)})
+        first_number += len(chunk)
+    return out
+
+
+def build_index(parts, output, title="Deck Index"):
+    """Small deck with one linked row per part file."""
+    prs = new_presentation()
+    layout = prs.slide_layouts[6]
+    total = sum(p["slides"] for p in parts)
+    for page in range(0, len(parts), INDEX_ROWS):
+        rows = parts[page:page + INDEX_ROWS]
+        slide = prs.slides.add_slide(layout)
+        set_slide_bg(slide)
+        add_section_label(slide, "INDEX")
+        add_title(slide, title, width=Inches(10))
+        add_description(slide, f"{total:,} slides in {len(parts)} parts",
+                        width=Inches(6.5))
+        boxes = stack(len(rows), Inches(0.83), Inches(2.6), Inches(11.5),
+                      Inches(0.36), gap=Inches(0.02))
+        for part, (x, y, w, h) in zip(rows, boxes):
+            last = part["first"] + part["slides"] - 1
+            box = add_text_box(slide, x, y, Inches(4.2), h,
+                               os.path.basename(part["path"]), font_size=12,
+                               color=ACCENT, font_name="JetBrains Mono")
+            box.text_frame.paragraphs[0].runs[0].hyperlink.address = (
+                os.path.relpath(part["path"], os.path.dirname(output)
+                                or "."))
+            label = f"Slides {part['first']}\u2013{last}"
+            if part["sections"]:
+                label += "  \u00b7  " + ", ".join(part["sections"])
+            add_text_box(slide, x + Inches(4.4), y, w - Inches(4.4), h,
+                         label, font_size=12, color=GRAY_LIGHT)
+        add_slide_number(slide, len(prs.slides))
+    return save_presentation(prs, output)
+
+
+def split_deck(spec, output, max_bytes, max_slides=None, by_section=False,
+               jobs=None):
+    """Build ``spec`` as part files next to ``output`` plus an index deck.
+
+    Returns the part records written to the index.
+    """
+    slides = spec["slides"]
+    plan = plan_parts(slides, max_bytes, max_slides, by_section)
+    job_list = [([slides[i] for i in idx], idx[0] + 1, max_bytes,
+                 f"{output}.job{j:03d}")
+                for j, idx in enumerate(plan)]
+    out_dir = os.path.dirname(os.path.abspath(output))
+    os.makedirs(out_dir, exist_ok=True)
+
+    parts = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # Largest parts first so the pool's tail is short
+        order = sorted(range(len(job_list)),
+                       key=lambda j: -len(job_list[j][0]))
+        results = dict(zip(order, pool.map(build_part,
+                                           [job_list[j] for j in order])))
+    # A part may have been halved in its worker, so final numbers are only
+    # known now; moving the finished files into place is a rename each
+    for j in range(len(job_list)):
+        for part in results[j]:
+            part["path"] = part_path(output, len(parts) + 1)
+            replace_if_changed(part.pop("tmp"), part["path"])
+            parts.append(part)
+
+    # Drop parts left over from an earlier, longer split
+    n = len(parts) + 1
+    while os.path.exists(part_path(output, n)):
+        os.remove(part_path(output, n))
+        n += 1
+    build_index(parts, output, spec.get("title", "Deck Index"))
+    return parts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("spec")
+    parser.add_argument("-o", "--output", default="deck.pptx",
+                        help="index deck; parts are written alongside it")
+    parser.add_argument("--max-mb", type=float, default=20.0,
+                        help="size limit per part file")
+    parser.add_argument("--max-slides", type=int, default=None)
+    parser.add_argument("--by-section", action="store_true",
+                        help="start a new part at every section change")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    with open(args.spec, encoding="utf-8") as f:
+        spec = json.load(f)
+
+    parts = split_deck(spec, args.output, int(args.max_mb * 1024 * 1024),
+                       args.max_slides, args.by_section, args.jobs)
+    for p in parts:
+        print(f"{p['path']}: slides {p['first']}\u2013"
+              f"{p['first'] + p['slides'] - 1}, {p['bytes'] / 1024:,.0f} KiB")
+    print(f"Index {args.output} \u2014 {len(parts)} parts", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Byte-reproducible PPTX saving that skips unchanged outputs.
+
+python-pptx already emits parts, relationships and shape ids in a stable
+order; what varies between runs is the zip metadata (member timestamps)
+and the core properties' modified date. Both are pinned here, to
+SOURCE_DATE_EPOCH when set, so identical inputs give identical bytes.
+"""
+
+import datetime
+import io
+import os
+import zipfile
+
+import tracing
+from buildcache import bytes_hash, file_hash
+
+# Zip timestamps cannot predate 1980
+_DEFAULT_EPOCH = 315532800  # 1980-01-01T00:00:00Z
+_CONTENT_TYPES = "[Content_Types].xml"
+
+
+def build_time():
+    epoch = int(os.environ.get("SOURCE_DATE_EPOCH", _DEFAULT_EPOCH))
+    return datetime.datetime.fromtimestamp(
+        max(epoch, _DEFAULT_EPOCH), datetime.timezone.utc
+    ).replace(tzinfo=None)
+
+
+def write_zip(members, when=None):
+    """Zip bytes for {name: data} with sorted members and fixed metadata."""
+    when = when or build_time()
+    date_time = when.timetuple()[:6]
+    names = sorted(members, key=lambda n: (n != _CONTENT_TYPES, n))
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as dst:
+        for name in names:
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 0
+            info.external_attr = 0
+            dst.writestr(info, members[name], compresslevel=6)
+    return out.getvalue()
+
+
+def normalize_zip(data, when=None):
+    """Rewrite zip bytes with sorted members and fixed metadata."""
+    src = zipfile.ZipFile(io.BytesIO(data))
+    return write_zip({name: src.read(name) for name in src.namelist()}, when)
+
+
+def presentation_bytes(prs):
+    when = build_time()
+    core = prs.core_properties
+    core.created = when
+    core.modified = when
+    core.last_modified_by = "BlockTrace"
+    core.revision = 1
+    with tracing.span("serialize") as sp:
+        buf = io.BytesIO()
+        prs.save(buf)
+        sp.set(bytes=buf.tell())
+    with tracing.span("normalize_zip") as sp:
+        data = normalize_zip(buf.getvalue(), when)
+        sp.set(bytes=len(data))
+    return data
+
+
+def write_if_changed(path, data):
+    """Atomically write ``data`` unless ``path`` already has the same content
+    hash. Returns True if the file was written."""
+    with tracing.span("write", path=path, bytes=0) as sp:
+        if (os.path.exists(path) and os.path.getsize(path) == len(data)
+                and file_hash(path) == bytes_hash(data)):
+            return False
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        sp.set(bytes=len(data))
+        return True
+
+
+def replace_if_changed(tmp, path):
+    """Move the finished file ``tmp`` onto ``path`` unless ``path`` already
+    has the same content hash, in which case ``tmp`` is removed. Returns
+    True if ``path`` was replaced."""
+    if (os.path.exists(path) and os.path.getsize(path) == os.path.getsize(tmp)
+            and file_hash(path) == file_hash(tmp)):
+        os.remove(tmp)
+        return False
+    os.replace(tmp, path)
+    return True
+
+
+def save_presentation(prs, path):
+    return write_if_changed(path, presentation_bytes(prs))
@@ -0,0 +1,215 @@
+"""Subset and embed the deck fonts (Inter, JetBrains Mono, Outfit) in a PPTX.
+
+Glyphs are collected from every text box, each font face is subset once
+per distinct glyph set, and subsets are cached on disk by
+(font hash, glyph set hash) so batch variant builds reuse them.
+
+Font files are looked up by family name in BLOCKTRACE_FONT_DIRS
+(os.pathsep-separated, default: ./fonts), e.g. fonts/Inter-Regular.ttf,
+fonts/JetBrainsMono-Bold.ttf. Requires fontTools.
+
+PowerPoint stores embedded fonts as Embedded OpenType: each
+/ppt/fonts/fontN.fntdata part is an EOT header (version 0x00020001,
+uncompressed, not XOR-obfuscated) followed by the subset TrueType data,
+as eot_wrap() builds it. Parts are numbered from the first free N, so
+embedding into a deck that already has fonts adds to them.
+"""
+
+import io
+import os
+import struct
+import sys
+
+from lxml import etree
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part
+from pptx.opc.packuri import PackURI
+from pptx.oxml.ns import qn
+
+from buildcache import bytes_hash, cache_path, file_hash
+
+FONT_DIRS = os.environ.get("BLOCKTRACE_FONT_DIRS", "fonts").split(os.pathsep)
+FONT_EXTS = (".ttf", ".otf")
+
+# Elements that must follow p:embeddedFontLst in p:presentation
+_AFTER_FONT_LST = ("p:custShowLst", "p:photoAlbum", "p:custDataLst",
+                   "p:kinsoku", "p:defaultTextStyle", "p:modifyVerifier",
+                   "p:extLst")
+
+EOT_VERSION = 0x00020001
+EOT_MAGIC = 0x504C
+TTEMBED_SUBSET = 0x00000001
+# name table ids for the EOT family, style, version and full name strings
+_EOT_NAMES = (1, 2, 5, 4)
+
+_subset_memo = {}
+
+
+def _text_frames(shapes):
+    """Text frames of ``shapes``, inside groups and table cells too."""
+    for shape in shapes:
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            yield from _text_frames(shape.shapes)
+        elif shape.has_text_frame:
+            yield shape.text_frame
+        elif getattr(shape, "has_table", False) and shape.has_table:
+            for row in shape.table.rows:
+                for cell in row.cells:
+                    yield cell.text_frame
+
+
+def collect_glyphs(prs, default_font="Calibri"):
+    """Map (family, bold) -> set of characters used across all text boxes."""
+    used = {}
+    for slide in prs.slides:
+        for frame in _text_frames(slide.shapes):
+            for p in frame.paragraphs:
+                for run in p.runs:
+                    family = run.font.name or p.font.name or default_font
+                    bold = bool(run.font.bold if run.font.bold is not None
+                                else p.font.bold)
+                    used.setdefault((family, bold), set()).update(run.text)
+    return used
+
+
+def find_font_file(family, bold):
+    stem = family.replace(" ", "")
+    names = [f"{stem}-Bold", f"{stem}Bold"] if bold else \
+        [f"{stem}-Regular", stem]
+    for directory in FONT_DIRS:
+        for name in names:
+            for ext in FONT_EXTS:
+                path = os.path.join(directory, name + ext)
+                if os.path.isfile(path):
+                    return path
+    return None
+
+
+def subset_font(path, chars):
+    """Return subset font bytes for ``chars``, using the on-disk cache."""
+    text = "".join(sorted(set(chars) | {" "}))
+    key = (file_hash(path), bytes_hash(text.encode("utf-8")))
+    if key in _subset_memo:
+        return _subset_memo[key]
+
+    cached = cache_path("fonts", f"{key[0][:16]}-{key[1][:16]}.ttf")
+    if os.path.exists(cached):
+        with open(cached, "rb") as f:
+            data = f.read()
+    else:
+        from fontTools import subset
+
+        options = subset.Options()
+        options.name_IDs = ["*"]
+        options.notdef_outline = True
+        options.layout_features = ["*"]
+        font = subset.load_font(path, options)
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(text=text)
+        subsetter.subset(font)
+        buf = io.BytesIO()
+        subset.save_font(font, buf, options)
+        data = buf.getvalue()
+        tmp = cached + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, cached)
+
+    _subset_memo[key] = data
+    return data
+
+
+def eot_wrap(data):
+    """Wrap TrueType ``data`` in an uncompressed EOT 0x00020001 header."""
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(io.BytesIO(data))
+    os2, head, names = font["OS/2"], font["head"], font["name"]
+    p = os2.panose
+    panose = bytes([p.bFamilyType, p.bSerifStyle, p.bWeight,
+                    p.bProportion, p.bContrast, p.bStrokeVariation,
+                    p.bArmStyle, p.bLetterForm, p.bMidline, p.bXHeight])
+    strings = b""
+    for name_id in _EOT_NAMES:
+        record = names.getName(name_id, 3, 1, 0x409)
+        text = record.toUnicode().encode("utf-16-le") if record else b""
+        strings += struct.pack("<HH", 0, len(text)) + text
+    # Padding5 plus an empty RootString: the font is not URL-bound
+    strings += struct.pack("<HH", 0, 0)
+    fixed = struct.pack(
+        "<LLLL10sBBLHH4L2LL4L", 0, len(data), EOT_VERSION, TTEMBED_SUBSET,
+        panose, 1, os2.fsSelection & 1, os2.usWeightClass, os2.fsType,
+        EOT_MAGIC, os2.ulUnicodeRange1, os2.ulUnicodeRange2,
+        os2.ulUnicodeRange3, os2.ulUnicodeRange4,
+        getattr(os2, "ulCodePageRange1", 0),
+        getattr(os2, "ulCodePageRange2", 0), head.checkSumAdjustment,
+        0, 0, 0, 0)
+    size = len(fixed) + len(strings) + len(data)
+    return struct.pack("<L", size) + fixed[4:] + strings + data
+
+
+def _free_font_numbers(package):
+    """Yield N for /ppt/fonts/fontN.fntdata names not yet in ``package``."""
+    taken = {str(part.partname) for part in package.iter_parts()}
+    n = 1
+    while True:
+        if f"/ppt/fonts/font{n}.fntdata" not in taken:
+            yield n
+        n += 1
+
+
+def embed_fonts(prs):
+    """Embed subset fonts for every face used in ``prs``; returns the list of
+    (family, bold) faces that were found and embedded."""
+    faces = {}
+    missing = []
+    for (family, bold), chars in sorted(collect_glyphs(prs).items()):
+        path = find_font_file(family, bold)
+        if path is None:
+            missing.append(f"{family}{' Bold' if bold else ''}")
+            continue
+        faces.setdefault(family, {})[bold] = subset_font(path, chars)
+    if missing:
+        print(f"font_embed: no font file for {', '.join(missing)}; "
+              "left unembedded", file=sys.stderr)
+    if not faces:
+        return []
+
+    pres_part = prs.part
+    package = pres_part.package
+    pres = pres_part._element
+
+    font_lst = pres.find(qn("p:embeddedFontLst"))
+    if font_lst is None:
+        font_lst = etree.SubElement(pres, qn("p:embeddedFontLst"))
+        for tag in _AFTER_FONT_LST:
+            successor = pres.find(qn(tag))
+            if successor is not None:
+                successor.addprevious(font_lst)
+                break
+
+    embedded = []
+    numbers = _free_font_numbers(package)
+    for family, by_weight in faces.items():
+        entry = etree.SubElement(font_lst, qn("p:embeddedFont"))
+        etree.SubElement(entry, qn("p:font"), typeface=family)
+        # Schema order: regular, bold, italic, boldItalic
+        for bold in (False, True):
+            if bold not in by_weight:
+                continue
+            part = Part.load(
+                partname=PackURI(f"/ppt/fonts/font{next(numbers)}.fntdata"),
+                content_type=CT.X_FONTDATA,
+                package=package,
+                blob=eot_wrap(by_weight[bold]),
+            )
+            r_id = pres_part.relate_to(part, RT.FONT)
+            etree.SubElement(entry, qn("p:bold" if bold else "p:regular"),
+                             {qn("r:id"): r_id})
+            embedded.append((family, bold))
+
+    pres.set("embedTrueTypeFonts", "1")
+    pres.set("saveSubsetFonts", "1")
+    return embedded
@@ -1,11 +1,33 @@
 #!/usr/bin/env python3
-"""Generate a 14-slide BlockTrace investor pitch deck as PPTX."""
+"""Generate the BlockTrace investor pitch deck as PPTX.
+
+Copy and slide order come from pitch-deck.pen (see pen_content.py); the
+literals in each builder are fallbacks used when a node is missing or the
+deck is built with --no-pen. Slide numbers follow the final order.
+
+Pass --embed-fonts to subset and embed the deck fonts (see font_embed.py),
+--pdf to render a PDF alongside (see pdf_export.py), --profile-memory
+for a per-stage tracemalloc report (see memprof.py) and --trace PATH for
+a timeline of nested build spans (see tracing.py).
+"""
+
+import argparse
+import copy
+import re
 
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.shared import ElementProxy
+
+import tracing
+from deck_writer import save_presentation
+from layout import brickwork, centered_row, row, stack
+from memprof import NULL_PROFILER, MemoryProfiler
+from pen_content import DEFAULT_PEN, EMPTY, load_content
 
 # Dimensions
 SLIDE_W = Inches(13.333)
@@ -22,6 +44,9 @@ GRAY_MED = RGBColor(0x94, 0xA3, 0xB8)
 GRAY_DARK = RGBColor(0x72, 0x81, 0x97)
 BLACK = RGBColor(0x0A, 0x0F, 0x1C)
 
+# Text boxes whose copy comes from the .pen are named TEXT_NAME_PREFIX + id
+TEXT_NAME_PREFIX = "Text: "
+
 
 def set_slide_bg(slide, color=BG_DARK):
     bg = slide.background
@@ -45,6 +70,10 @@ def add_text_box(slide, left, top, width, height, text, font_size=18,
     p.alignment = alignment
     if line_spacing:
         p.line_spacing = Pt(line_spacing)
+    node_id = getattr(text, "node_id", None)
+    if node_id:
+        # localize.py keys translations by the .pen node the copy came from
+        txBox.name = f"{TEXT_NAME_PREFIX}{node_id}"
     return txBox
 
 
@@ -71,12 +100,17 @@ def add_accent_line(slide, left, top, width, height=Pt(3)):
     return shape
 
 
+SLIDE_NUMBER_NAME = "Slide Number"
+
+
 def add_slide_number(slide, number):
-    add_text_box(
+    box = add_text_box(
         slide, Inches(12.4), Inches(6.95), Inches(0.8), Inches(0.4),
         f"{number:02d}", font_size=10, color=GRAY_DARK,
         font_name="JetBrains Mono", alignment=PP_ALIGN.RIGHT
     )
+    # reflow.py finds the footer by name when slides are reordered
+    box.name = SLIDE_NUMBER_NAME
 
 
 def add_section_label(slide, text, left=Inches(0.83), top=Inches(0.55)):
@@ -104,13 +138,16 @@ def add_description(slide, text, left=Inches(0.83), top=Inches(1.55),
 
 
 def add_card(slide, left, top, width, height, title, desc,
-             icon_text="*", title_size=14, desc_size=11):
+             icon_text="*", title_size=14, desc_size=11, icon_name=None):
     add_rounded_rect(slide, left, top, width, height)
-    add_text_box(
+    icon_box = add_text_box(
         slide, left + Inches(0.25), top + Inches(0.25),
         Inches(0.4), Inches(0.35),
         icon_text, font_size=18, color=ACCENT, bold=True
     )
+    if icon_name:
+        # Lucide icon from the .pen design, kept for downstream renderers
+        icon_box.name = f"Icon: {icon_name}"
     add_text_box(
         slide, left + Inches(0.25), top + Inches(0.6),
         width - Inches(0.5), Inches(0.35),
@@ -190,862 +227,1116 @@ def add_connector_line(slide, left, top, width, height, color=ACCENT):
     shape.line.fill.background()
 
 
-# ── Build Presentation ─────────────────────────────────────────────────
-prs = Presentation()
-prs.slide_width = SLIDE_W
-prs.slide_height = SLIDE_H
-blank_layout = prs.slide_layouts[6]
+def add_tree_level(slide, names, center_x, hbar_y, width, height, gap,
+                   drop=Inches(0.2), **node_style):
+    """One row of tree nodes hung from a bar centred under ``center_x``."""
+    boxes = centered_row(len(names), center_x, hbar_y + Inches(0.2),
+                         width, height, gap)
+    centers, _ = boxes.centers()
+    add_connector_line(slide, int(centers[0]), hbar_y,
+                       int(centers[-1] - centers[0]), Pt(2))
+    for name, cx, (x, y, w, h) in zip(names, centers.tolist(), boxes):
+        add_connector_line(slide, cx, hbar_y, Pt(2), drop)
+        add_tree_node(slide, x, y, w, h, name, **node_style)
+    return boxes
+
+
+# Brickwork grid (3 over 2) shared by slides 06, 07, 09 and 11
+BRICK_W = Inches(3.67)
+BRICK_H = Inches(2.5)
+BRICK_GAP = Inches(0.2)
+BRICK_Y_TOP = Inches(3.0)
+BRICKS = brickwork((3, 2), Inches(0.83), BRICK_Y_TOP, BRICK_W, BRICK_H,
+                   BRICK_GAP)
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # SLIDE 01 - Title
 # ═══════════════════════════════════════════════════════════════════════
-s1 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s1)
-add_accent_line(s1, Inches(0), Inches(0), SLIDE_W, Pt(3))
-add_text_box(s1, Inches(2), Inches(2.2), Inches(9.333), Inches(0.9),
-             "BlockTrace", font_size=48, color=WHITE, bold=True,
-             alignment=PP_ALIGN.CENTER)
-add_text_box(s1, Inches(3.5), Inches(3.1), Inches(6.333), Inches(0.6),
-             "Composable Token Infrastructure for Real-World Assets",
-             font_size=20, color=ACCENT, alignment=PP_ALIGN.CENTER)
-add_accent_line(s1, Inches(6), Inches(3.8), Inches(1.333), Pt(2))
-add_text_box(s1, Inches(3), Inches(4.1), Inches(7.333), Inches(1),
-             "Turn physical assets into verifiable digital structures with "
-             "complete lifecycle traceability.",
-             font_size=14, color=GRAY_LIGHT, alignment=PP_ALIGN.CENTER,
-             line_spacing=22)
-add_slide_number(s1, 1)
+def build_title(prs, blank_layout, c=EMPTY):
+    s1 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s1)
+    add_accent_line(s1, Inches(0), Inches(0), SLIDE_W, Pt(3))
+    add_text_box(s1, Inches(2), Inches(2.2), Inches(9.333), Inches(0.9),
+                 c.text("ADtqg", "BlockTrace"), font_size=48, color=WHITE, bold=True,
+                 alignment=PP_ALIGN.CENTER)
+    add_text_box(s1, Inches(3.5), Inches(3.1), Inches(6.333), Inches(0.6),
+                 c.text("W2AxD",
+                        "Composable Token Infrastructure for Real-World Assets"),
+                 font_size=20, color=ACCENT, alignment=PP_ALIGN.CENTER)
+    add_accent_line(s1, Inches(6), Inches(3.8), Inches(1.333), Pt(2))
+    add_text_box(s1, Inches(3), Inches(4.1), Inches(7.333), Inches(1),
+                 c.text("MBSis",
+                        "Turn physical assets into verifiable digital structures "
+                        "with complete lifecycle traceability."),
+                 font_size=14, color=GRAY_LIGHT, alignment=PP_ALIGN.CENTER,
+                 line_spacing=22)
+    add_slide_number(s1, len(prs.slides))
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # SLIDE 02 - The Problem
 # ═══════════════════════════════════════════════════════════════════════
-s2 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s2)
-add_section_label(s2, "THE PROBLEM")
-add_title(s2, "Traceability Is Broken")
-add_description(s2,
-    "Enterprise asset data lives in fragmented silos. Compliance is manual. "
-    "Cross-organisation trust is non-existent. Bills of materials are "
-    "unverifiable.")
-
-problem_cards = [
-    ("*", "Siloed Databases",
-     "Siloed enterprise databases with no interoperability. Traceability data "
-     "lives across dozens of disconnected ERPs, spreadsheets, and legacy "
-     "databases."),
-    ("*", "No Cross-Org Trust",
-     "No cross-organisation trust layer. Partners, auditors, and regulators "
-     "cannot independently verify claims about asset provenance."),
-    ("*", "Unverifiable BOMs",
-     "Non-verifiable bills of materials. Component history is easily lost or "
-     "falsified across supply chain handoffs."),
-    ("*", "Manual Compliance",
-     "Manual compliance and audit processes. Regulatory compliance is handled "
-     "through costly, unscalable manual processes."),
-    ("*", "Fragmented Lifecycle",
-     "Fragmented asset lifecycle records. No single source of truth for an "
-     "asset's complete history across organisations."),
-]
-
-card_w = Inches(2.35)
-card_h = Inches(2.8)
-x_start = Inches(0.83)
-y_cards = Inches(3.0)
-card_gap = Inches(0.2)
+def build_problem(prs, blank_layout, c=EMPTY):
+    s2 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s2)
+    add_section_label(s2, c.text("ufwNd", "THE PROBLEM"))
+    add_title(s2, c.text("crdGA", "Traceability Is Broken"))
+    add_description(s2, c.text("yl2KO",
+        "Enterprise asset data lives in fragmented silos. Compliance is manual. "
+        "Cross-organisation trust is non-existent. Bills of materials are "
+        "unverifiable."))
+
+    problem_cards = [
+        (c.icon("SiI65"), c.text("N53x1", "Siloed Databases"),
+         c.text("mccEr",
+         "Siloed enterprise databases with no interoperability. Traceability data "
+         "lives across dozens of disconnected ERPs, spreadsheets, and legacy "
+         "databases.")),
+        (c.icon("hD7Lc"), c.text("W9Zdc", "No Cross-Org Trust"),
+         c.text("Td9Lh",
+         "No cross-organisation trust layer. Partners, auditors, and regulators "
+         "cannot independently verify claims about asset provenance.")),
+        (c.icon("t734T"), c.text("aswdv", "Unverifiable BOMs"),
+         c.text("fd31x",
+         "Non-verifiable bills of materials. Component history is easily lost or "
+         "falsified across supply chain handoffs.")),
+        (c.icon("zWzDV"), c.text("O58lj", "Manual Compliance"),
+         c.text("wZpWf",
+         "Manual compliance and audit processes. Regulatory compliance is handled "
+         "through costly, unscalable manual processes.")),
+        (c.icon("fTvnr"), c.text("GCfro", "Fragmented Lifecycle"),
+         c.text("Irq74",
+         "Fragmented asset lifecycle records. No single source of truth for an "
+         "asset's complete history across organisations.")),
+    ]
+
+    boxes = row(len(problem_cards), Inches(0.83), Inches(3.0),
+                Inches(2.35), Inches(2.8), gap=Inches(0.2))
+    for (icon, title, desc), (x, y, w, h) in zip(problem_cards, boxes):
+        add_card(s2, x, y, w, h, title, desc, icon_name=icon)
+    add_slide_number(s2, len(prs.slides))
 
-for i, (icon, title, desc) in enumerate(problem_cards):
-    x = x_start + i * (card_w + card_gap)
-    add_card(s2, x, y_cards, card_w, card_h, title, desc, icon_text=icon)
-add_slide_number(s2, 2)
 
 # ═══════════════════════════════════════════════════════════════════════
 # SLIDE 03 - The Opportunity
 # ═══════════════════════════════════════════════════════════════════════
-s3 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s3)
-add_section_label(s3, "THE OPPORTUNITY")
-add_title(s3, "Three Forces Converging")
-add_description(s3,
-    "Regulatory pressure, enterprise SaaS maturity, and RWA tokenisation "
-    "are creating an infrastructure-level opportunity.", width=Inches(5.5))
-
-pill_w = Inches(2.8)
-pill_h = Inches(1.6)
-pill_y = Inches(3.0)
-pills = [
-    ("Blockchain\nInfrastructure",),
-    ("Verifiable\nAsset Infrastructure",),
-    ("Enterprise SaaS\nMaturity",),
-]
-pill_positions = [Inches(0.83), Inches(5.27), Inches(9.7)]
-
-for i in range(3):
-    text = pills[i][0]
-    px = pill_positions[i]
-    is_center = (i == 1)
-    h = pill_h + Inches(0.3) if is_center else pill_h
-    y = pill_y - Inches(0.15) if is_center else pill_y
-    shape = add_rounded_rect(s3, px, y, pill_w, h, fill_color=CARD_BG)
-    if is_center:
-        shape.line.color.rgb = ACCENT
-        shape.line.width = Pt(2)
-    add_text_box(s3, px + Inches(0.3), y + Inches(0.4),
-                 pill_w - Inches(0.6), Inches(0.8),
-                 text, font_size=14 if not is_center else 16,
-                 color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
-
-for ax in [Inches(3.63), Inches(8.07)]:
-    add_text_box(s3, ax, pill_y + Inches(0.5), Inches(1.64), Inches(0.5),
-                 "\u2192", font_size=24, color=ACCENT, bold=True,
-                 alignment=PP_ALIGN.CENTER)
+def build_opportunity(prs, blank_layout, c=EMPTY):
+    s3 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s3)
+    add_section_label(s3, c.text("cpaLg", "THE OPPORTUNITY"))
+    add_title(s3, c.text("RNV7A", "Three Forces Converging"))
+    add_description(s3, c.text("YTaNe",
+        "Regulatory pressure, enterprise SaaS maturity, and RWA tokenisation "
+        "are creating an infrastructure-level opportunity."), width=Inches(5.5))
+
+    pill_w = Inches(2.8)
+    pill_h = Inches(1.6)
+    pill_y = Inches(3.0)
+    pills = [
+        (c.text("oUzsf", "Blockchain\nInfrastructure"),),
+        (c.text("H4xGA", "Verifiable\nAsset Infrastructure"),),
+        (c.text("rSiVZ", "Enterprise SaaS\nMaturity"),),
+    ]
+    pill_positions = [Inches(0.83), Inches(5.27), Inches(9.7)]
+
+    for i in range(3):
+        text = pills[i][0]
+        px = pill_positions[i]
+        is_center = (i == 1)
+        h = pill_h + Inches(0.3) if is_center else pill_h
+        y = pill_y - Inches(0.15) if is_center else pill_y
+        shape = add_rounded_rect(s3, px, y, pill_w, h, fill_color=CARD_BG)
+        if is_center:
+            shape.line.color.rgb = ACCENT
+            shape.line.width = Pt(2)
+        add_text_box(s3, px + Inches(0.3), y + Inches(0.4),
+                     pill_w - Inches(0.6), Inches(0.8),
+                     text, font_size=14 if not is_center else 16,
+                     color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
+
+    for ax in [Inches(3.63), Inches(8.07)]:
+        add_text_box(s3, ax, pill_y + Inches(0.5), Inches(1.64), Inches(0.5),
+                     "\u2192", font_size=24, color=ACCENT, bold=True,
+                     alignment=PP_ALIGN.CENTER)
+
+    stats = [
+        (c.text("zOXyP", "$16T+"),
+         c.text("9Y8Fl", "Projected RWA tokenisation market by 2030")),
+        (c.text("r326s", "80%"),
+         c.text("EMG1Z", "Of enterprises cite supply chain visibility as "
+                "critical priority")),
+        (c.text("CEvpS", "47+"),
+         c.text("oq4S2", "New supply chain due diligence regulations enacted "
+                "globally since 2020")),
+    ]
+    boxes = row(len(stats), Inches(0.83), Inches(5.2), Inches(3.5),
+                Inches(0.6), gap=Inches(0.65))
+    for (val, label), (sx, sy, sw, sh) in zip(stats, boxes):
+        add_text_box(s3, sx, sy, sw, sh,
+                     val, font_size=30, color=ACCENT, bold=True,
+                     font_name="JetBrains Mono")
+        add_text_box(s3, sx, sy + sh, sw, sh,
+                     label, font_size=11, color=GRAY_LIGHT, line_spacing=17)
+    add_slide_number(s3, len(prs.slides))
 
-stats = [
-    ("$16T+", "Projected RWA tokenisation market by 2030"),
-    ("80%", "Of enterprises cite supply chain visibility as critical priority"),
-    ("47+", "New supply chain due diligence regulations enacted globally "
-     "since 2020"),
-]
-stat_w = Inches(3.5)
-stat_y = Inches(5.2)
-for i, (val, label) in enumerate(stats):
-    sx = Inches(0.83) + i * (stat_w + Inches(0.65))
-    add_text_box(s3, sx, stat_y, stat_w, Inches(0.6),
-                 val, font_size=30, color=ACCENT, bold=True,
-                 font_name="JetBrains Mono")
-    add_text_box(s3, sx, stat_y + Inches(0.6), stat_w, Inches(0.6),
-                 label, font_size=11, color=GRAY_LIGHT, line_spacing=17)
-add_slide_number(s3, 3)
 
 # ═══════════════════════════════════════════════════════════════════════
 # SLIDE 04 - The Solution (Tree Diagrams)
 # ═══════════════════════════════════════════════════════════════════════
-s4 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s4)
-add_section_label(s4, "THE SOLUTION")
-add_title(s4, "From Flat Records to Composable Asset Graphs", width=Inches(9))
-add_description(s4,
-    "A real-world asset becomes a root token. Each certificate, component, "
-    "or document is a sub-token. Each sub-token can itself contain "
-    "sub-tokens \u2014 forming a verifiable, composable structure.",
-    width=Inches(5))
-
-# Real Estate Example
-re_x = Inches(0.83)
-re_y = Inches(3.0)
-add_text_box(s4, re_x, re_y - Inches(0.3), Inches(3), Inches(0.25),
-             "REAL ESTATE EXAMPLE", font_size=9, color=GRAY_DARK,
-             bold=True, font_name="JetBrains Mono")
-
-root_w, root_h = Inches(2.6), Inches(0.45)
-root_x = re_x + Inches(1.3)
-add_tree_node(s4, root_x, re_y, root_w, root_h,
-              "House Token", fill=ACCENT, text_color=BLACK,
-              font_size=13, bold=True)
-
-trunk_x = root_x + root_w // 2
-add_connector_line(s4, trunk_x, re_y + root_h, Pt(2), Inches(0.3))
-
-children_re = ["Survey Token", "Electrical Certificate",
-               "Renovation Record", "Insurance Policy"]
-child_w, child_h, child_gap = Inches(1.4), Inches(0.38), Inches(0.12)
-total_children_w = len(children_re) * child_w + (len(children_re) - 1) * child_gap
-children_start_x = root_x + root_w // 2 - total_children_w // 2
-hbar_y = re_y + root_h + Inches(0.3)
-add_connector_line(s4, children_start_x + child_w // 2, hbar_y,
-                   total_children_w - child_w, Pt(2))
-
-child_y = hbar_y + Inches(0.2)
-for i, name in enumerate(children_re):
-    cx = children_start_x + i * (child_w + child_gap)
-    add_connector_line(s4, cx + child_w // 2, hbar_y, Pt(2), Inches(0.2))
-    add_tree_node(s4, cx, child_y, child_w, child_h, name,
-                  fill=CARD_BG, text_color=WHITE, font_size=10,
-                  border_color=ACCENT)
-
-sub_trunk_x = children_start_x + child_w // 2
-add_connector_line(s4, sub_trunk_x, child_y + child_h, Pt(2), Inches(0.35))
-
-sub_names = ["Site Plan", "Boundary Report"]
-sub_w, sub_h, sub_gap = Inches(1.1), Inches(0.32), Inches(0.1)
-total_sub_w = len(sub_names) * sub_w + (len(sub_names) - 1) * sub_gap
-sub_start_x = sub_trunk_x - total_sub_w // 2
-sub_hbar_y = child_y + child_h + Inches(0.3)
-add_connector_line(s4, sub_start_x + sub_w // 2, sub_hbar_y,
-                   total_sub_w - sub_w, Pt(2))
-
-sub_y = child_y + child_h + Inches(0.5)
-for i, sn in enumerate(sub_names):
-    sx = sub_start_x + i * (sub_w + sub_gap)
-    add_connector_line(s4, sx + sub_w // 2, sub_hbar_y, Pt(2), Inches(0.18))
-    add_tree_node(s4, sx, sub_y, sub_w, sub_h, sn,
-                  fill=DARKER_BG, text_color=GRAY_LIGHT, font_size=9,
-                  border_color=ACCENT)
-
-# Manufacturing Example
-mfg_x = Inches(7)
-mfg_y = Inches(3.0)
-add_text_box(s4, mfg_x, mfg_y - Inches(0.3), Inches(3), Inches(0.25),
-             "MANUFACTURING EXAMPLE", font_size=9, color=GRAY_DARK,
-             bold=True, font_name="JetBrains Mono")
-
-m_root_x = mfg_x + Inches(1.3)
-add_tree_node(s4, m_root_x, mfg_y, root_w, root_h,
-              "Finished Product", fill=CARD_BG, text_color=WHITE,
-              font_size=13, bold=True, border_color=ACCENT)
-
-add_connector_line(s4, m_root_x + root_w // 2, mfg_y + root_h,
-                   Pt(2), Inches(0.3))
-
-children_mfg = ["Sub-Assembly A", "Quality Certificate", "Shipping Manifest"]
-m_child_w, m_child_gap = Inches(1.55), Inches(0.15)
-m_total_w = len(children_mfg) * m_child_w + (len(children_mfg) - 1) * m_child_gap
-m_children_start = m_root_x + root_w // 2 - m_total_w // 2
-m_hbar_y = mfg_y + root_h + Inches(0.3)
-add_connector_line(s4, m_children_start + m_child_w // 2, m_hbar_y,
-                   m_total_w - m_child_w, Pt(2))
-
-m_child_y = m_hbar_y + Inches(0.2)
-for i, name in enumerate(children_mfg):
-    cx = m_children_start + i * (m_child_w + m_child_gap)
-    add_connector_line(s4, cx + m_child_w // 2, m_hbar_y, Pt(2), Inches(0.2))
-    add_tree_node(s4, cx, m_child_y, m_child_w, child_h, name,
-                  fill=CARD_BG, text_color=WHITE, font_size=10,
-                  border_color=ACCENT)
-
-# Sub-Assembly A sub-tokens
-sa_trunk_x = m_children_start + m_child_w // 2
-add_connector_line(s4, sa_trunk_x, m_child_y + child_h, Pt(2), Inches(0.35))
-sa_subs = ["Component A1", "Component A2"]
-sa_sub_hbar_y = m_child_y + child_h + Inches(0.3)
-sa_sub_start = sa_trunk_x - total_sub_w // 2
-add_connector_line(s4, sa_sub_start + sub_w // 2, sa_sub_hbar_y,
-                   total_sub_w - sub_w, Pt(2))
-sa_sub_y = m_child_y + child_h + Inches(0.5)
-for i, sn in enumerate(sa_subs):
-    sx = sa_sub_start + i * (sub_w + sub_gap)
-    add_connector_line(s4, sx + sub_w // 2, sa_sub_hbar_y, Pt(2), Inches(0.18))
-    add_tree_node(s4, sx, sa_sub_y, sub_w, sub_h, sn,
-                  fill=DARKER_BG, text_color=GRAY_LIGHT, font_size=9,
-                  border_color=ACCENT)
-
-# Quality Certificate sub-tokens
-qc_trunk_x = m_children_start + m_child_w + m_child_gap + m_child_w // 2
-add_connector_line(s4, qc_trunk_x, m_child_y + child_h, Pt(2), Inches(0.35))
-qc_subs = ["Lab Test Report", "Compliance Cert"]
-qc_sub_start = qc_trunk_x - total_sub_w // 2
-add_connector_line(s4, qc_sub_start + sub_w // 2, sa_sub_hbar_y,
-                   total_sub_w - sub_w, Pt(2))
-for i, sn in enumerate(qc_subs):
-    sx = qc_sub_start + i * (sub_w + sub_gap)
-    add_connector_line(s4, sx + sub_w // 2, sa_sub_hbar_y, Pt(2), Inches(0.18))
-    add_tree_node(s4, sx, sa_sub_y, sub_w, sub_h, sn,
-                  fill=DARKER_BG, text_color=GRAY_LIGHT, font_size=9,
-                  border_color=ACCENT)
-add_slide_number(s4, 4)
+def build_solution(prs, blank_layout, c=EMPTY):
+    s4 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s4)
+    add_section_label(s4, c.text("zyP3U", "THE SOLUTION"))
+    add_title(s4, c.text("iQ0ep", "From Flat Records to Composable Asset Graphs"),
+              width=Inches(9))
+    add_description(s4, c.text("rP1av",
+        "A real-world asset becomes a root token. Each certificate, component, "
+        "or document is a sub-token. Each sub-token can itself contain "
+        "sub-tokens \u2014 forming a verifiable, composable structure."),
+        width=Inches(5))
+
+    # Real Estate Example
+    re_x = Inches(0.83)
+    re_y = Inches(3.0)
+    add_text_box(s4, re_x, re_y - Inches(0.3), Inches(3), Inches(0.25),
+                 c.text("LyIOQ", "Real Estate Example").upper(), font_size=9, color=GRAY_DARK,
+                 bold=True, font_name="JetBrains Mono")
+
+    root_w, root_h = Inches(2.6), Inches(0.45)
+    root_x = re_x + Inches(1.3)
+    add_tree_node(s4, root_x, re_y, root_w, root_h,
+                  c.text("cBrB7", "House Token"), fill=ACCENT, text_color=BLACK,
+                  font_size=13, bold=True)
+
+    trunk_x = root_x + root_w // 2
+    add_connector_line(s4, trunk_x, re_y + root_h, Pt(2), Inches(0.3))
+
+    children_re = [c.text("4ji4p", "Survey Token"),
+                   c.text("fkvth", "Electrical Certificate"),
+                   c.text("0NSia", "Renovation Record"), "Insurance Policy"]
+    child_w, child_h, child_gap = Inches(1.4), Inches(0.38), Inches(0.12)
+    child_style = dict(fill=CARD_BG, text_color=WHITE, font_size=10,
+                       border_color=ACCENT)
+    hbar_y = re_y + root_h + Inches(0.3)
+    children = add_tree_level(s4, children_re, trunk_x, hbar_y,
+                              child_w, child_h, child_gap, **child_style)
+
+    sub_trunk_x, _ = children.centers()
+    child_y = int(children.y[0])
+    add_connector_line(s4, int(sub_trunk_x[0]), child_y + child_h, Pt(2),
+                       Inches(0.35))
+
+    sub_names = [c.text("EL6hO", "Site Plan"),
+                 c.text("ciYUf", "Boundary Report")]
+    sub_w, sub_h, sub_gap = Inches(1.1), Inches(0.32), Inches(0.1)
+    sub_style = dict(fill=DARKER_BG, text_color=GRAY_LIGHT, font_size=9,
+                     border_color=ACCENT)
+    add_tree_level(s4, sub_names, int(sub_trunk_x[0]),
+                   child_y + child_h + Inches(0.3), sub_w, sub_h, sub_gap,
+                   drop=Inches(0.18), **sub_style)
+
+    # Manufacturing Example
+    mfg_x = Inches(7)
+    mfg_y = Inches(3.0)
+    add_text_box(s4, mfg_x, mfg_y - Inches(0.3), Inches(3), Inches(0.25),
+                 c.text("MzBt6", "Manufacturing Example").upper(), font_size=9, color=GRAY_DARK,
+                 bold=True, font_name="JetBrains Mono")
+
+    m_root_x = mfg_x + Inches(1.3)
+    add_tree_node(s4, m_root_x, mfg_y, root_w, root_h,
+                  c.text("yyMZ2", "Finished Product"), fill=CARD_BG, text_color=WHITE,
+                  font_size=13, bold=True, border_color=ACCENT)
+
+    add_connector_line(s4, m_root_x + root_w // 2, mfg_y + root_h,
+                       Pt(2), Inches(0.3))
+
+    children_mfg = [c.text("R3ybQ", "Sub-Assembly A"),
+                    c.text("EJW4U", "Quality Certificate"), "Shipping Manifest"]
+    m_children = add_tree_level(s4, children_mfg, m_root_x + root_w // 2,
+                                mfg_y + root_h + Inches(0.3), Inches(1.55),
+                                child_h, Inches(0.15), **child_style)
+
+    # Sub-Assembly A and Quality Certificate sub-tokens
+    m_trunk_x, _ = m_children.centers()
+    m_child_y = int(m_children.y[0])
+    sa_subs = [c.text("Sib1j", "Component A1"), c.text("ik7Zg", "Component A2")]
+    qc_subs = ["Lab Test Report", "Compliance Cert"]
+    for trunk, names in zip(m_trunk_x.tolist(), (sa_subs, qc_subs)):
+        add_connector_line(s4, trunk, m_child_y + child_h, Pt(2),
+                           Inches(0.35))
+        add_tree_level(s4, names, trunk, m_child_y + child_h + Inches(0.3),
+                       sub_w, sub_h, sub_gap, drop=Inches(0.18), **sub_style)
+    add_slide_number(s4, len(prs.slides))
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # SLIDE 05 - How It Works
 # ═══════════════════════════════════════════════════════════════════════
-s5 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s5)
-add_section_label(s5, "HOW IT WORKS")
-add_title(s5, "A Layered Architecture Built for Enterprise", width=Inches(10))
-add_description(s5,
-    "Five purpose-built layers work together to tokenise, anchor, and query "
-    "your asset data \u2014 without replacing existing systems.",
-    width=Inches(5.5))
-
-layers = [
-    ("1", "Integration Layer",
-     "REST APIs, ERP connectors, webhooks, batch import. Enterprise systems "
-     "push asset data in.",
-     ["REST API", "ERP", "Webhooks"], True),
-    ("2", "Tokenisation Engine",
-     "Hierarchical token pack creation, versioning, composition. Schema "
-     "validation and lifecycle event tracking.",
-     ["Core"], True),
-    ("3", "Off-Chain Indexed Data Layer",
-     "Structured storage, fast retrieval, selective disclosure. Full asset "
-     "graph traversal.",
-     ["Indexed"], False),
-    ("4", "On-Chain Hash Anchoring",
-     "Immutable proof on any blockchain, chain-agnostic. Tamper-evident, "
-     "cryptographic audit trail.",
-     ["Chain-Agnostic"], False),
-    ("5", "Query & Analytics Dashboard",
-     "Real-time asset insights, dependency maps, lifecycle views. Compliance "
-     "reporting and event monitoring.",
-     ["Dashboard"], False),
-]
-
-layer_w = Inches(10.5)
-layer_h = Inches(0.75)
-layer_x = Inches(1.4)
-layer_start_y = Inches(2.8)
-layer_gap = Inches(0.12)
-
-for i, (num, ltitle, ldesc, tags, highlight) in enumerate(layers):
-    ly = layer_start_y + i * (layer_h + layer_gap)
-    shape = add_rounded_rect(s5, layer_x, ly, layer_w, layer_h,
-                             fill_color=CARD_BG)
-    if highlight and i == 1:
-        shape.line.color.rgb = ACCENT
-        shape.line.width = Pt(1)
-
-    badge_sz = Inches(0.35)
-    add_rounded_rect(s5, layer_x + Inches(0.3),
+def build_how_it_works(prs, blank_layout, c=EMPTY):
+    s5 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s5)
+    add_section_label(s5, c.text("D7Xys", "HOW IT WORKS"))
+    add_title(s5, c.text("aM5UU", "A Layered Architecture Built for Enterprise"),
+              width=Inches(10))
+    add_description(s5, c.text("1XSe2",
+        "Five purpose-built layers work together to tokenise, anchor, and query "
+        "your asset data \u2014 without replacing existing systems."),
+        width=Inches(5.5))
+
+    layers = [
+        (c.text("4xyTk", "1"), c.text("p3DNf", "Integration Layer"),
+         c.text("UaTQz",
+         "REST APIs, ERP connectors, webhooks, batch import. Enterprise systems "
+         "push asset data in."),
+         [c.text("G4DNu", "REST API"), c.text("F2Ft3", "ERP"),
+          c.text("0v4S6", "Webhooks")], True),
+        (c.text("xuQbs", "2"), c.text("idovm", "Tokenisation Engine"),
+         c.text("noAVV",
+         "Hierarchical token pack creation, versioning, composition. Schema "
+         "validation and lifecycle event tracking."),
+         [c.text("vTFog", "Core")], True),
+        (c.text("4F1sY", "3"), c.text("x40Ju", "Off-Chain Indexed Data Layer"),
+         c.text("JMXOK",
+         "Structured storage, fast retrieval, selective disclosure. Full asset "
+         "graph traversal."),
+         [c.text("snVVs", "Indexed")], False),
+        (c.text("KJJ8E", "4"), c.text("FoYNU", "On-Chain Hash Anchoring"),
+         c.text("FhlGB",
+         "Immutable proof on any blockchain, chain-agnostic. Tamper-evident, "
+         "cryptographic audit trail."),
+         [c.text("aK83C", "Chain-Agnostic")], False),
+        (c.text("xOuPo", "5"), c.text("GTtCs", "Query & Analytics Dashboard"),
+         c.text("qePd8",
+         "Real-time asset insights, dependency maps, lifecycle views. Compliance "
+         "reporting and event monitoring."),
+         [c.text("Yi0kJ", "Dashboard")], False),
+    ]
+
+    layer_w = Inches(10.5)
+    layer_h = Inches(0.75)
+    layer_x = Inches(1.4)
+    layer_start_y = Inches(2.8)
+    layer_gap = Inches(0.12)
+
+    boxes = stack(len(layers), layer_x, layer_start_y, layer_w, layer_h,
+                  layer_gap)
+    for i, ((num, ltitle, ldesc, tags, highlight), (_, ly, _, _)) in \
+            enumerate(zip(layers, boxes)):
+        shape = add_rounded_rect(s5, layer_x, ly, layer_w, layer_h,
+                                 fill_color=CARD_BG)
+        if highlight and i == 1:
+            shape.line.color.rgb = ACCENT
+            shape.line.width = Pt(1)
+
+        badge_sz = Inches(0.35)
+        add_rounded_rect(s5, layer_x + Inches(0.3),
+                         ly + (layer_h - badge_sz) / 2,
+                         badge_sz, badge_sz, fill_color=ACCENT)
+        add_text_box(s5, layer_x + Inches(0.3),
                      ly + (layer_h - badge_sz) / 2,
-                     badge_sz, badge_sz, fill_color=ACCENT)
-    add_text_box(s5, layer_x + Inches(0.3),
-                 ly + (layer_h - badge_sz) / 2,
-                 badge_sz, badge_sz,
-                 num, font_size=14, color=BLACK, bold=True,
-                 font_name="JetBrains Mono", alignment=PP_ALIGN.CENTER)
-    add_text_box(s5, layer_x + Inches(0.8), ly + Inches(0.08),
-                 Inches(3), Inches(0.3),
-                 ltitle, font_size=14, color=WHITE, bold=True)
-    add_text_box(s5, layer_x + Inches(0.8), ly + Inches(0.38),
-                 Inches(6), Inches(0.35),
-                 ldesc, font_size=11, color=GRAY_LIGHT)
-
-    tag_x = layer_x + Inches(8.5)
-    for j, tag in enumerate(tags):
-        tw = Inches(1.0)
-        tx = tag_x + j * Inches(1.1)
-        add_rounded_rect(s5, tx, ly + Inches(0.22), tw, Inches(0.3),
-                         fill_color=DARKER_BG)
-        add_text_box(s5, tx, ly + Inches(0.22), tw, Inches(0.3),
-                     tag, font_size=9, color=ACCENT,
-                     font_name="JetBrains Mono",
-                     alignment=PP_ALIGN.CENTER)
-add_slide_number(s5, 5)
+                     badge_sz, badge_sz,
+                     num, font_size=14, color=BLACK, bold=True,
+                     font_name="JetBrains Mono", alignment=PP_ALIGN.CENTER)
+        add_text_box(s5, layer_x + Inches(0.8), ly + Inches(0.08),
+                     Inches(3), Inches(0.3),
+                     ltitle, font_size=14, color=WHITE, bold=True)
+        add_text_box(s5, layer_x + Inches(0.8), ly + Inches(0.38),
+                     Inches(6), Inches(0.35),
+                     ldesc, font_size=11, color=GRAY_LIGHT)
+
+        tag_boxes = row(len(tags), layer_x + Inches(8.5), ly + Inches(0.22),
+                        Inches(1.0), Inches(0.3), gap=Inches(0.1))
+        for tag, (tx, ty, tw, th) in zip(tags, tag_boxes):
+            add_rounded_rect(s5, tx, ty, tw, th, fill_color=DARKER_BG)
+            add_text_box(s5, tx, ty, tw, th,
+                         tag, font_size=9, color=ACCENT,
+                         font_name="JetBrains Mono",
+                         alignment=PP_ALIGN.CENTER)
+    add_slide_number(s5, len(prs.slides))
+
 
 # ═══════════════════════════════════════════════════════════════════════
-# SLIDE 06 - Why Token Packs Matter (Brickwork)
+# SLIDE 06 - The Platform (Brickwork)
 # ═══════════════════════════════════════════════════════════════════════
-s6 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s6)
-add_section_label(s6, "WHY IT MATTERS")
-add_title(s6, "Why Hierarchical Token Packs Matter", width=Inches(8))
-add_description(s6,
-    "Hierarchical Token Packs enable capabilities that flat tokenisation "
-    "systems simply cannot deliver.", width=Inches(5.5))
-
-brick_w = Inches(3.67)
-brick_h = Inches(2.5)
-brick_gap = Inches(0.2)
-brick_y_top = Inches(3.0)
-brick_y_bot = brick_y_top + brick_h + brick_gap
-
-bricks6_top = [
-    ("*", "Recursive Provenance",
-     "Trace any component back through its full history, across every "
-     "level of assembly."),
-    ("*", "Component-Level Recall",
-     "Identify and isolate affected assets instantly when a component "
-     "is recalled."),
-    ("*", "Full Lifecycle Versioning",
-     "Every change to an asset or sub-token is versioned, timestamped, "
-     "and immutable."),
-]
-bricks6_bot = [
-    ("*", "Verifiable BOM",
-     "Cryptographically verify every bill of materials down to the "
-     "component level."),
-    ("*", "Audit-Ready Assets",
-     "Generate compliance reports instantly with cryptographic proof of "
-     "every claim."),
-]
+def build_platform(prs, blank_layout, c=EMPTY):
+    sp = prs.slides.add_slide(blank_layout)
+    set_slide_bg(sp)
+    add_section_label(sp, c.text("0JiGT", "THE PLATFORM"))
+    add_title(sp, c.text("ASx2i", "Enterprise-Grade Asset Intelligence"),
+              width=Inches(9))
+    add_description(sp, c.text("HwTIp",
+        "A modern SaaS dashboard built for data-heavy workflows. Explore asset "
+        "graphs, track lifecycles, and monitor certifications in real time."),
+        width=Inches(6))
+
+    platform_top = [
+        (c.icon("YekOr"), c.text("YNE7q", "Asset Graph Explorer"),
+         c.text("LdVQW",
+         "Visualise complex relationships and dependencies across your entire "
+         "asset portfolio.")),
+        (c.icon("MN3F9"), c.text("tlQ1b", "Timeline View"),
+         c.text("JFOfW",
+         "Track full lifecycle events and mutable history in a linear, "
+         "auditable timeline.")),
+        (c.icon("bXkqC"), c.text("UJIgZ", "Component Dependency Map"),
+         c.text("pATuq",
+         "Trace sub-assemblies and verify BOMs down to the raw material "
+         "level.")),
+    ]
+    platform_bot = [
+        (c.icon("Niavy"), c.text("FWcSf", "Certification Validity Alerts"),
+         c.text("YbHW2",
+         "Proactive monitoring of certification expiry and compliance "
+         "violations across your portfolio.")),
+        (c.icon("VbKLr"), c.text("USYSA", "Built for Enterprise Trust"),
+         c.text("m9vs9",
+         "Security isn\u2019t a feature \u2014 it\u2019s the foundation. "
+         "Every token is hash-verified, tamper-evident. Selective disclosure, "
+         "role-based permissions, chain-agnostic anchoring, and a hybrid "
+         "on/off-chain model.")),
+    ]
+
+    for (icon, t, d), (bx, by, bw, bh) in zip(platform_top, BRICKS[:3]):
+        add_card(sp, bx, by, bw, bh, t, d, icon_name=icon)
+    for (icon, t, d), (bx, by, bw, bh) in zip(platform_bot, BRICKS[3:]):
+        add_card(sp, bx, by, bw, bh, t, d, icon_name=icon, desc_size=10)
+    add_slide_number(sp, len(prs.slides))
 
-for i, (icon, t, d) in enumerate(bricks6_top):
-    bx = Inches(0.83) + i * (brick_w + brick_gap)
-    add_card(s6, bx, brick_y_top, brick_w, brick_h, t, d, icon_text=icon)
-
-bot_total = 2 * brick_w + brick_gap
-bot_start = Inches(0.83) + (3 * brick_w + 2 * brick_gap - bot_total) / 2
-for i, (icon, t, d) in enumerate(bricks6_bot):
-    bx = bot_start + i * (brick_w + brick_gap)
-    add_card(s6, bx, brick_y_bot, brick_w, brick_h, t, d, icon_text=icon)
-add_slide_number(s6, 6)
 
 # ═══════════════════════════════════════════════════════════════════════
-# SLIDE 07 - Use Cases
+# SLIDE 07 - Why Token Packs Matter (Brickwork)
 # ═══════════════════════════════════════════════════════════════════════
-s7 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s7)
-add_section_label(s7, "USE CASES")
-add_title(s7, "Built for Asset-Heavy Industries")
-
-use_cases = [
-    ("Manufacturing", True,
-     "Track sub-assemblies, components, and certifications across complex "
-     "production lines.",
-     [("Engine Assembly", ACCENT), ("\u251C\u2500 Cylinder Block", GRAY_LIGHT),
-      ("\u251C\u2500 Crankshaft", GRAY_LIGHT),
-      ("\u2514\u2500 QC Report", GRAY_MED)]),
-    ("Real Estate", False,
-     "Compose property tokens from surveys, certificates, and renovation "
-     "records.",
-     [("Property Token", ACCENT), ("\u251C\u2500 Title Deed", GRAY_LIGHT),
-      ("\u251C\u2500 Survey Report", GRAY_LIGHT),
-      ("\u2514\u2500 Energy Rating", GRAY_MED)]),
-    ("Pharmaceuticals", False,
-     "Full chain-of-custody from raw material to patient delivery with "
-     "regulatory compliance.",
-     [("Drug Batch", ACCENT), ("\u251C\u2500 Raw Material Cert", GRAY_LIGHT),
-      ("\u251C\u2500 Lab Analysis", GRAY_LIGHT),
-      ("\u2514\u2500 Chain of Custody", GRAY_MED)]),
-    ("Energy & Carbon", False,
-     "Verifiable carbon credits and energy asset provenance with embedded "
-     "compliance.",
-     [("Carbon Credit", ACCENT), ("\u251C\u2500 Project Audit", GRAY_LIGHT),
-      ("\u251C\u2500 Measurement Data", GRAY_LIGHT),
-      ("\u2514\u2500 Retirement Record", GRAY_MED)]),
-]
+def build_why_it_matters(prs, blank_layout, c=EMPTY):
+    s6 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s6)
+    add_section_label(s6, c.text("nobgW", "WHY IT MATTERS"))
+    add_title(s6, c.text("mTiEa", "Why Hierarchical Token Packs Matter"),
+              width=Inches(8))
+    add_description(s6, c.text("F7R0c",
+        "Hierarchical Token Packs enable capabilities that flat tokenisation "
+        "systems simply cannot deliver."), width=Inches(5.5))
+
+    bricks6_top = [
+        (c.icon("L0UG2"), c.text("zuM1f", "Recursive Provenance"),
+         c.text("hrsOB",
+         "Trace any component back through its full history, across every "
+         "level of assembly.")),
+        (c.icon("0mvlg"), c.text("fFOav", "Component-Level Recall"),
+         c.text("f23yc",
+         "Identify and isolate affected assets instantly when a component "
+         "is recalled.")),
+        (c.icon("TCvU1"), c.text("mzKKS", "Full Lifecycle Versioning"),
+         c.text("7amWQ",
+         "Every change to an asset or sub-token is versioned, timestamped, "
+         "and immutable.")),
+    ]
+    bricks6_bot = [
+        (c.icon("0QetK"), c.text("QfsPw", "Verifiable BOM"),
+         c.text("rj6Qd",
+         "Cryptographically verify every bill of materials down to the "
+         "component level.")),
+        (c.icon("gi4n0"), c.text("qtvnk", "Audit-Ready Assets"),
+         c.text("HCKzy",
+         "Generate compliance reports instantly with cryptographic proof of "
+         "every claim.")),
+    ]
+
+    for (icon, t, d), (bx, by, bw, bh) in zip(bricks6_top + bricks6_bot,
+                                              BRICKS):
+        add_card(s6, bx, by, bw, bh, t, d, icon_name=icon)
+    add_slide_number(s6, len(prs.slides))
 
-uc_w = Inches(2.85)
-uc_gap = Inches(0.2)
-uc_x = Inches(0.83)
-uc_y = Inches(2.0)
-
-for i, (name, is_primary, desc, tree) in enumerate(use_cases):
-    cx = uc_x + i * (uc_w + uc_gap)
-    header_h = Inches(0.45)
-    hdr_fill = ACCENT if is_primary else DARKER_BG
-    hdr_color = BLACK if is_primary else WHITE
-    add_rounded_rect(s7, cx, uc_y, uc_w, header_h, fill_color=hdr_fill)
-    add_text_box(s7, cx + Inches(0.2), uc_y, uc_w - Inches(0.4), header_h,
-                 name, font_size=13, color=hdr_color, bold=True)
-
-    body_h = Inches(4.5)
-    add_rounded_rect(s7, cx, uc_y + header_h, uc_w, body_h, fill_color=CARD_BG)
-    add_text_box(s7, cx + Inches(0.2), uc_y + header_h + Inches(0.15),
-                 uc_w - Inches(0.4), Inches(0.9),
-                 desc, font_size=11, color=GRAY_LIGHT, line_spacing=17)
-
-    tree_y = uc_y + header_h + Inches(1.1)
-    tree_h = Inches(1.8)
-    add_rounded_rect(s7, cx + Inches(0.15), tree_y,
-                     uc_w - Inches(0.3), tree_h, fill_color=DARKER_BG)
-    for j, (line_text, line_color) in enumerate(tree):
-        add_text_box(s7, cx + Inches(0.3),
-                     tree_y + Inches(0.15) + j * Inches(0.35),
-                     uc_w - Inches(0.6), Inches(0.3),
-                     line_text, font_size=10, color=line_color,
-                     font_name="JetBrains Mono", bold=(j == 0))
-add_slide_number(s7, 7)
 
 # ═══════════════════════════════════════════════════════════════════════
-# SLIDE 08 - Why Integrate (Brickwork)
+# SLIDE 08 - Use Cases
 # ═══════════════════════════════════════════════════════════════════════
-s8 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s8)
-add_section_label(s8, "INTEGRATION")
-add_title(s8, "Already Have Traceability? Even Better.", width=Inches(8))
-add_description(s8,
-    "BlockTrace doesn\u2019t replace your existing systems \u2014 it makes them "
-    "provable, composable, and trusted across your entire supply chain.",
-    width=Inches(6.5))
-
-int8_top = [
-    ("*", "Complement, Not Replace",
-     "Works alongside SAP, Oracle, or custom ERP systems. No "
-     "rip-and-replace \u2014 just a trust layer on top of what you "
-     "already have."),
-    ("*", "Cryptographic Proof Layer",
-     "Add tamper-evident, hash-verified proof on top of your existing "
-     "records. Anchor to any blockchain without changing your workflow."),
-    ("*", "API-First Integration",
-     "REST APIs, webhooks, ERP connectors, and batch import. Connect "
-     "your existing systems in days, not months."),
-]
-int8_bot = [
-    ("*", "Cross-Organisation Trust",
-     "Your internal system tracks your data. BlockTrace proves it to "
-     "partners, regulators, and customers \u2014 without exposing "
-     "sensitive details."),
-    ("*", "From Flat to Composable",
-     "Transform siloed, flat records into hierarchical token packs with "
-     "recursive provenance \u2014 turning your data into a verifiable "
-     "asset graph."),
-]
-
-for i, (icon, t, d) in enumerate(int8_top):
-    bx = Inches(0.83) + i * (brick_w + brick_gap)
-    add_card(s8, bx, brick_y_top, brick_w, brick_h, t, d, icon_text=icon)
+def build_use_cases(prs, blank_layout, c=EMPTY):
+    s7 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s7)
+    add_section_label(s7, c.text("N3F2m", "USE CASES"))
+    add_title(s7, c.text("cNidZ", "Built for Asset-Heavy Industries"))
+
+    use_cases = [
+        (c.text("NBw8L", "Manufacturing"), True,
+         c.text("v2cVp",
+         "Track sub-assemblies, components, and certifications across complex "
+         "production lines."),
+         [(c.text("eiEyT", "Engine Assembly"), ACCENT),
+          (c.text("qDMJN", "\u251C\u2500 Cylinder Block"), GRAY_LIGHT),
+          (c.text("ts3Cr", "\u251C\u2500 Crankshaft"), GRAY_LIGHT),
+          (c.text("UrpaE", "\u2514\u2500 QC Report"), GRAY_MED)]),
+        (c.text("201q5", "Real Estate"), False,
+         c.text("Uu9jI",
+         "Compose property tokens from surveys, certificates, and renovation "
+         "records."),
+         [(c.text("jIA9t", "Property Token"), ACCENT),
+          (c.text("FPdm0", "\u251C\u2500 Title Deed"), GRAY_LIGHT),
+          (c.text("JsJ4j", "\u251C\u2500 Survey Report"), GRAY_LIGHT),
+          (c.text("Y6l1m", "\u2514\u2500 Energy Rating"), GRAY_MED)]),
+        (c.text("VjKmg", "Pharmaceuticals"), False,
+         c.text("t1rFe",
+         "Full chain-of-custody from raw material to patient delivery with "
+         "regulatory compliance."),
+         [(c.text("cgCcn", "Drug Batch"), ACCENT),
+          (c.text("HxWza", "\u251C\u2500 Raw Material Cert"), GRAY_LIGHT),
+          (c.text("grVmJ", "\u251C\u2500 Lab Analysis"), GRAY_LIGHT),
+          (c.text("3gQbP", "\u2514\u2500 Chain of Custody"), GRAY_MED)]),
+        (c.text("EMpZe", "Energy & Carbon"), False,
+         c.text("jBkVR",
+         "Verifiable carbon credits and energy asset provenance with embedded "
+         "compliance."),
+         [(c.text("44D9e", "Carbon Credit"), ACCENT),
+          (c.text("Riahp", "\u251C\u2500 Project Audit"), GRAY_LIGHT),
+          (c.text("k3X5N", "\u251C\u2500 Measurement Data"), GRAY_LIGHT),
+          (c.text("wFz93", "\u2514\u2500 Retirement Record"), GRAY_MED)]),
+    ]
+
+    uc_w = Inches(2.85)
+    uc_gap = Inches(0.2)
+    uc_x = Inches(0.83)
+    uc_y = Inches(2.0)
+
+    boxes = row(len(use_cases), uc_x, uc_y, uc_w, Inches(0.45), uc_gap)
+    for (name, is_primary, desc, tree), (cx, _, _, _) in zip(use_cases,
+                                                             boxes):
+        header_h = Inches(0.45)
+        hdr_fill = ACCENT if is_primary else DARKER_BG
+        hdr_color = BLACK if is_primary else WHITE
+        add_rounded_rect(s7, cx, uc_y, uc_w, header_h, fill_color=hdr_fill)
+        add_text_box(s7, cx + Inches(0.2), uc_y, uc_w - Inches(0.4), header_h,
+                     name, font_size=13, color=hdr_color, bold=True)
+
+        body_h = Inches(4.5)
+        add_rounded_rect(s7, cx, uc_y + header_h, uc_w, body_h, fill_color=CARD_BG)
+        add_text_box(s7, cx + Inches(0.2), uc_y + header_h + Inches(0.15),
+                     uc_w - Inches(0.4), Inches(0.9),
+                     desc, font_size=11, color=GRAY_LIGHT, line_spacing=17)
+
+        tree_y = uc_y + header_h + Inches(1.1)
+        tree_h = Inches(1.8)
+        add_rounded_rect(s7, cx + Inches(0.15), tree_y,
+                         uc_w - Inches(0.3), tree_h, fill_color=DARKER_BG)
+        for j, (line_text, line_color) in enumerate(tree):
+            add_text_box(s7, cx + Inches(0.3),
+                         tree_y + Inches(0.15) + j * Inches(0.35),
+                         uc_w - Inches(0.6), Inches(0.3),
+                         line_text, font_size=10, color=line_color,
+                         font_name="JetBrains Mono", bold=(j == 0))
+    add_slide_number(s7, len(prs.slides))
 
-for i, (icon, t, d) in enumerate(int8_bot):
-    bx = bot_start + i * (brick_w + brick_gap)
-    add_card(s8, bx, brick_y_bot, brick_w, brick_h, t, d, icon_text=icon)
-add_slide_number(s8, 8)
 
 # ═══════════════════════════════════════════════════════════════════════
-# SLIDE 09 - Competitive Landscape
+# SLIDE 09 - Why Integrate (Brickwork)
 # ═══════════════════════════════════════════════════════════════════════
-s9 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s9)
-add_section_label(s9, "COMPETITIVE LANDSCAPE")
-add_title(s9, "Infrastructure, Not Another Token Platform", width=Inches(8))
-
-columns = ["Capability", "Simple NFT\nPlatforms", "Traditional\nERP Systems",
-           "Single-Layer\nRWA Platforms", "BlockTrace"]
-rows = [
-    ("Hierarchical token structures", "\u2717", "\u2717", "\u2717", "\u2713"),
-    ("Cryptographic provenance", "Partial", "\u2717", "Partial", "\u2713"),
-    ("Enterprise ERP integration", "\u2717", "\u2713", "\u2717", "\u2713"),
-    ("Recursive BOM verification", "\u2717", "\u2717", "\u2717", "\u2713"),
-    ("Cross-org verifiable trust", "Partial", "\u2717", "Partial", "\u2713"),
-]
+def build_integration(prs, blank_layout, c=EMPTY):
+    s8 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s8)
+    add_section_label(s8, "INTEGRATION")
+    add_title(s8, "Already Have Traceability? Even Better.", width=Inches(8))
+    add_description(s8,
+        "BlockTrace doesn\u2019t replace your existing systems \u2014 it makes them "
+        "provable, composable, and trusted across your entire supply chain.",
+        width=Inches(6.5))
+
+    int8_top = [
+        ("*", "Complement, Not Replace",
+         "Works alongside SAP, Oracle, or custom ERP systems. No "
+         "rip-and-replace \u2014 just a trust layer on top of what you "
+         "already have."),
+        ("*", "Cryptographic Proof Layer",
+         "Add tamper-evident, hash-verified proof on top of your existing "
+         "records. Anchor to any blockchain without changing your workflow."),
+        ("*", "API-First Integration",
+         "REST APIs, webhooks, ERP connectors, and batch import. Connect "
+         "your existing systems in days, not months."),
+    ]
+    int8_bot = [
+        ("*", "Cross-Organisation Trust",
+         "Your internal system tracks your data. BlockTrace proves it to "
+         "partners, regulators, and customers \u2014 without exposing "
+         "sensitive details."),
+        ("*", "From Flat to Composable",
+         "Transform siloed, flat records into hierarchical token packs with "
+         "recursive provenance \u2014 turning your data into a verifiable "
+         "asset graph."),
+    ]
+
+    for (icon, t, d), (bx, by, bw, bh) in zip(int8_top + int8_bot, BRICKS):
+        add_card(s8, bx, by, bw, bh, t, d, icon_text=icon)
+    add_slide_number(s8, len(prs.slides))
+
 
-table_x = Inches(0.83)
-table_y = Inches(2.6)
-table_w = Inches(11.67)
-col_widths = [Inches(2.8)] + [Inches(2.2)] * 4
-header_h = Inches(0.55)
-row_h = Inches(0.45)
-
-add_rounded_rect(s9, table_x, table_y, table_w, header_h, fill_color=ACCENT)
-cx = table_x
-for j, col in enumerate(columns):
-    w = col_widths[j]
-    add_text_box(s9, cx + Inches(0.2), table_y, w, header_h,
-                 col, font_size=11, color=BLACK, bold=True,
-                 alignment=PP_ALIGN.CENTER if j > 0 else PP_ALIGN.LEFT)
-    cx += w
-
-for i, (cap, *vals) in enumerate(rows):
-    ry = table_y + header_h + i * row_h
-    row_fill = CARD_BG if i % 2 == 0 else DARKER_BG
-    add_rounded_rect(s9, table_x, ry, table_w, row_h, fill_color=row_fill)
+# ═══════════════════════════════════════════════════════════════════════
+# SLIDE 10 - Competitive Landscape
+# ═══════════════════════════════════════════════════════════════════════
+def build_competition(prs, blank_layout, c=EMPTY):
+    s9 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s9)
+    add_section_label(s9, c.text("JCoTm", "COMPETITIVE LANDSCAPE"))
+    add_title(s9, c.text("L5Pol", "Infrastructure, Not Another Token Platform"),
+              width=Inches(8))
+
+    columns = [c.text("JCppU", "Capability"),
+               c.text("oiKK8", "Simple NFT\nPlatforms"),
+               c.text("1J2zP", "Traditional\nERP Systems"),
+               c.text("GmO3l", "Single-Layer\nRWA Platforms"),
+               c.text("kLZhJ", "BlockTrace")]
+    row_ids = [
+        ("MuxsV", "N5ZGq", "mqC8b", "EnjRn", "yMERY"),
+        ("UrFxz", "Eo5rk", "HT61G", "bKm5e", "AEECE"),
+        ("XpbVT", "F0rv9", "7DXTH", "tnadn", "b7oSK"),
+        ("L9gHf", "bdB3T", "lkKAz", "OKJ2f", "nU8dh"),
+        ("5VPI8", "YllgM", "N0c7M", "9J7Nu", "KlHAl"),
+    ]
+    rows = [
+        ("Hierarchical token structures", "\u2717", "\u2717", "\u2717", "\u2713"),
+        ("Cryptographic provenance", "Partial", "\u2717", "Partial", "\u2713"),
+        ("Enterprise ERP integration", "\u2717", "\u2713", "\u2717", "\u2713"),
+        ("Recursive BOM verification", "\u2717", "\u2717", "\u2717", "\u2713"),
+        ("Cross-org verifiable trust", "Partial", "\u2717", "Partial", "\u2713"),
+    ]
+    rows = [tuple(c.text(node_id, val) for node_id, val in zip(ids, row))
+            for ids, row in zip(row_ids, rows)]
+
+    table_x = Inches(0.83)
+    table_y = Inches(2.6)
+    table_w = Inches(11.67)
+    col_widths = [Inches(2.8)] + [Inches(2.2)] * 4
+    header_h = Inches(0.55)
+    row_h = Inches(0.45)
+
+    add_rounded_rect(s9, table_x, table_y, table_w, header_h, fill_color=ACCENT)
     cx = table_x
-    for j, val in enumerate([cap] + list(vals)):
+    for j, col in enumerate(columns):
         w = col_widths[j]
-        if j == 0:
-            vc, fs, al = WHITE, 11, PP_ALIGN.LEFT
-        elif val == "\u2713" and j == 4:
-            vc, fs, al = ACCENT, 14, PP_ALIGN.CENTER
-        elif val == "\u2713":
-            vc, fs, al = GRAY_LIGHT, 14, PP_ALIGN.CENTER
-        elif val == "Partial":
-            vc, fs, al = GRAY_MED, 10, PP_ALIGN.CENTER
-        else:
-            vc, fs, al = GRAY_DARK, 14, PP_ALIGN.CENTER
-        add_text_box(s9, cx + Inches(0.15), ry, w, row_h,
-                     val, font_size=fs, color=vc,
-                     bold=(val == "\u2713" and j == 4),
-                     font_name="JetBrains Mono" if j > 0 else "Inter",
-                     alignment=al)
+        add_text_box(s9, cx + Inches(0.2), table_y, w, header_h,
+                     col, font_size=11, color=BLACK, bold=True,
+                     alignment=PP_ALIGN.CENTER if j > 0 else PP_ALIGN.LEFT)
         cx += w
-add_slide_number(s9, 9)
+
+    for i, (cap, *vals) in enumerate(rows):
+        ry = table_y + header_h + i * row_h
+        row_fill = CARD_BG if i % 2 == 0 else DARKER_BG
+        add_rounded_rect(s9, table_x, ry, table_w, row_h, fill_color=row_fill)
+        cx = table_x
+        for j, val in enumerate([cap] + list(vals)):
+            w = col_widths[j]
+            if j == 0:
+                vc, fs, al = WHITE, 11, PP_ALIGN.LEFT
+            elif val == "\u2713" and j == 4:
+                vc, fs, al = ACCENT, 14, PP_ALIGN.CENTER
+            elif val == "\u2713":
+                vc, fs, al = GRAY_LIGHT, 14, PP_ALIGN.CENTER
+            elif val == "Partial":
+                vc, fs, al = GRAY_MED, 10, PP_ALIGN.CENTER
+            else:
+                vc, fs, al = GRAY_DARK, 14, PP_ALIGN.CENTER
+            add_text_box(s9, cx + Inches(0.15), ry, w, row_h,
+                         val, font_size=fs, color=vc,
+                         bold=(val == "\u2713" and j == 4),
+                         font_name="JetBrains Mono" if j > 0 else "Inter",
+                         alignment=al)
+            cx += w
+    add_slide_number(s9, len(prs.slides))
+
 
 # ═══════════════════════════════════════════════════════════════════════
-# SLIDE 10 - Business Model (Brickwork)
+# SLIDE 11 - Business Model (Brickwork)
 # ═══════════════════════════════════════════════════════════════════════
-s10 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s10)
-add_section_label(s10, "BUSINESS MODEL")
-add_title(s10, "Revenue Architecture", width=Inches(8))
-add_description(s10,
-    "Five compounding revenue streams with built-in land-and-expand mechanics. "
-    "Every new asset deepens platform engagement across all streams.",
-    width=Inches(7))
-
-bm_w = Inches(3.67)
-bm_h = Inches(2.7)
-bm_y_top = Inches(3.0)
-bm_y_bot = bm_y_top + bm_h + brick_gap
-
-bm_top = [
-    ("RECURRING", True, "*", "SaaS Subscription",
-     "Tiered platform access: Starter, Growth, and Enterprise plans. "
-     "Predictable ARR base that grows with seat count and org adoption. "
-     "85%+ gross margins."),
-    ("USAGE-BASED", False, "*", "Token Minting Fees",
-     "Per-token fee for each asset or sub-token created. Revenue scales "
-     "linearly with asset volume \u2014 a single enterprise can mint "
-     "10K\u20131M+ tokens annually. Volume discounts drive lock-in."),
-    ("USAGE-BASED", False, "*", "On-Chain Anchoring Fees",
-     "Per-event fee for immutable proof anchoring. Batched for cost "
-     "efficiency. High-margin revenue stream \u2014 our cost per anchor "
-     "is a fraction of what customers pay."),
-]
-bm_bot = [
-    ("HIGH-VALUE", False, "*", "Enterprise Deployments",
-     "6-figure+ ACV for private cloud, on-premise, and hybrid "
-     "deployments with dedicated support and SLA guarantees. Custom "
-     "integrations create deep switching costs."),
-    ("ADD-ON", False, "*", "Analytics & Compliance",
-     "Premium add-on for asset graph analytics, automated compliance "
-     "reporting, and predictive insights. Expands ACV 30\u201350% per "
-     "enterprise account."),
-]
+def build_business_model(prs, blank_layout, c=EMPTY):
+    s10 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s10)
+    add_section_label(s10, c.text("Is7dl", "BUSINESS MODEL"))
+    add_title(s10, c.text("OXc3S", "Revenue Architecture"), width=Inches(8))
+    add_description(s10, c.text("RdzVQ",
+        "Five compounding revenue streams with built-in land-and-expand mechanics. "
+        "Every new asset deepens platform engagement across all streams."),
+        width=Inches(7))
+
+    bm_w = Inches(3.67)
+    bm_h = Inches(2.7)
+    bm_y_top = Inches(3.0)
+
+    bm_top = [
+        (c.text("66Mgv", "RECURRING"), True, "*",
+         c.text("sVdww", "SaaS Subscription"),
+         c.text("TpDWm",
+         "Tiered platform access: Starter, Growth, and Enterprise plans. "
+         "Predictable ARR base that grows with seat count and org adoption. "
+         "85%+ gross margins.")),
+        (c.text("28YgC", "USAGE-BASED"), False, "*",
+         c.text("jBA37", "Token Minting Fees"),
+         c.text("m0SMc",
+         "Per-token fee for each asset or sub-token created. Revenue scales "
+         "linearly with asset volume \u2014 a single enterprise can mint "
+         "10K\u20131M+ tokens annually. Volume discounts drive lock-in.")),
+        (c.text("pAy7O", "USAGE-BASED"), False, "*",
+         c.text("mcoEA", "On-Chain Anchoring Fees"),
+         c.text("avC5f",
+         "Per-event fee for immutable proof anchoring. Batched for cost "
+         "efficiency. High-margin revenue stream \u2014 our cost per anchor "
+         "is a fraction of what customers pay.")),
+    ]
+    bm_bot = [
+        (c.text("ykIOl", "HIGH-VALUE"), False, "*",
+         c.text("LAexM", "Enterprise Deployments"),
+         c.text("IrJyv",
+         "6-figure+ ACV for private cloud, on-premise, and hybrid "
+         "deployments with dedicated support and SLA guarantees. Custom "
+         "integrations create deep switching costs.")),
+        (c.text("GZnce", "ADD-ON"), False, "*",
+         c.text("EJJ7h", "Analytics & Compliance"),
+         c.text("iA6Ce",
+         "Premium add-on for asset graph analytics, automated compliance "
+         "reporting, and predictive insights. Expands ACV 30\u201350% per "
+         "enterprise account.")),
+    ]
+
+    boxes = brickwork((len(bm_top), len(bm_bot)), Inches(0.83), bm_y_top,
+                      bm_w, bm_h, BRICK_GAP)
+    for (badge, ba, icon, t, d), (bx, by, bw, bh) in zip(bm_top + bm_bot,
+                                                         boxes):
+        add_card_brickwork(s10, bx, by, bw, bh, t, d,
+                           icon_text=icon, badge_text=badge,
+                           badge_accent=ba)
+    add_slide_number(s10, len(prs.slides))
 
-for i, (badge, ba, icon, t, d) in enumerate(bm_top):
-    bx = Inches(0.83) + i * (bm_w + brick_gap)
-    add_card_brickwork(s10, bx, bm_y_top, bm_w, bm_h, t, d,
-                       icon_text=icon, badge_text=badge,
-                       badge_accent=ba)
-
-bm_bot_start = Inches(0.83) + (3 * bm_w + 2 * brick_gap -
-                                (2 * bm_w + brick_gap)) / 2
-for i, (badge, ba, icon, t, d) in enumerate(bm_bot):
-    bx = bm_bot_start + i * (bm_w + brick_gap)
-    add_card_brickwork(s10, bx, bm_y_bot, bm_w, bm_h, t, d,
-                       icon_text=icon, badge_text=badge,
-                       badge_accent=ba)
-add_slide_number(s10, 10)
 
 # ═══════════════════════════════════════════════════════════════════════
-# SLIDE 11 - GTM & Expansion
+# SLIDE 12 - GTM & Expansion
 # ═══════════════════════════════════════════════════════════════════════
-s11 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s11)
-add_section_label(s11, "GO-TO-MARKET")
-add_title(s11, "Market Entry & Expansion Strategy", width=Inches(10))
-add_description(s11,
-    "Land in regulated industries where traceability is mandatory, then "
-    "expand through supply chain network effects and platform stickiness.",
-    width=Inches(6.5))
-
-# Left column
-left_x = Inches(0.83)
-left_y = Inches(2.4)
-left_w = Inches(5.8)
-add_text_box(s11, left_x, left_y, Inches(3), Inches(0.25),
-             "BEACHHEAD VERTICALS", font_size=9, color=ACCENT,
-             bold=True, font_name="JetBrains Mono")
-
-verticals = [
-    ("Manufacturing & Industrial",
-     "BOMs, quality certificates, component recall. EU Digital Product "
-     "Passport mandate creates forced adoption by 2027."),
-    ("Real Estate & Construction",
-     "Property tokens, surveys, certificates. \u00A3300B+ UK market "
-     "with fragmented, paper-heavy asset trails."),
-    ("Pharma & Life Sciences",
-     "Drug serialisation, cold-chain provenance, clinical trial audit "
-     "trails. FDA DSCSA compliance mandatory."),
-    ("Food & Agriculture",
-     "Farm-to-fork traceability, batch recall, sustainability "
-     "certification. EU regulation driving $2B+ in compliance spend."),
-]
+def build_gtm(prs, blank_layout, c=EMPTY):
+    s11 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s11)
+    add_section_label(s11, c.text("W7koF", "GO-TO-MARKET"))
+    add_title(s11, c.text("Y0rBF", "Market Entry & Expansion Strategy"),
+              width=Inches(10))
+    add_description(s11, c.text("h8Xwj",
+        "Land in regulated industries where traceability is mandatory, then "
+        "expand through supply chain network effects and platform stickiness."),
+        width=Inches(6.5))
+
+    # Left column
+    left_x = Inches(0.83)
+    left_y = Inches(2.4)
+    left_w = Inches(5.8)
+    add_text_box(s11, left_x, left_y, Inches(3), Inches(0.25),
+                 c.text("NgM0k", "BEACHHEAD VERTICALS"), font_size=9, color=ACCENT,
+                 bold=True, font_name="JetBrains Mono")
+
+    verticals = [
+        (c.text("NDADf", "Manufacturing & Industrial"),
+         c.text("YVZUK",
+         "BOMs, quality certificates, component recall. EU Digital Product "
+         "Passport mandate creates forced adoption by 2027.")),
+        (c.text("JQwmZ", "Real Estate & Construction"),
+         c.text("BrPTK",
+         "Property tokens, surveys, certificates. \u00A3300B+ UK market "
+         "with fragmented, paper-heavy asset trails.")),
+        (c.text("w98la", "Pharma & Life Sciences"),
+         c.text("Bjplm",
+         "Drug serialisation, cold-chain provenance, clinical trial audit "
+         "trails. FDA DSCSA compliance mandatory.")),
+        ("Food & Agriculture",
+         "Farm-to-fork traceability, batch recall, sustainability "
+         "certification. EU regulation driving $2B+ in compliance spend."),
+    ]
+
+    vert_y = left_y + Inches(0.4)
+    vert_h = Inches(0.8)
+    vert_gap = Inches(0.12)
+    boxes = stack(len(verticals), left_x, vert_y, left_w, vert_h, vert_gap)
+    for (vt, vd), (_, vy, _, _) in zip(verticals, boxes):
+        add_rounded_rect(s11, left_x, vy, left_w, vert_h, fill_color=CARD_BG)
+        add_text_box(s11, left_x + Inches(0.2), vy + Inches(0.1),
+                     left_w - Inches(0.4), Inches(0.25),
+                     vt, font_size=13, color=WHITE, bold=True)
+        add_text_box(s11, left_x + Inches(0.2), vy + Inches(0.38),
+                     left_w - Inches(0.4), Inches(0.4),
+                     vd, font_size=10, color=GRAY_LIGHT, line_spacing=15)
+
+    # Right column
+    right_x = Inches(7.0)
+    right_w = Inches(5.8)
+    add_text_box(s11, right_x, left_y, Inches(3), Inches(0.25),
+                 c.text("jonO5", "PRICING TIERS"), font_size=9, color=ACCENT,
+                 bold=True, font_name="JetBrains Mono")
+
+    tiers = [
+        (c.text("chlqK", "Starter"), "\u00A3500/mo",
+         c.text("20nkW",
+         "Up to 1,000 tokens/mo. Single user team. Shared infrastructure. "
+         "Ideal for pilots and POCs."), False),
+        (c.text("8Ro7f", "Growth"), "\u00A32,500/mo",
+         c.text("g1Rjd",
+         "Up to 25,000 tokens/mo. Multi-team access. Analytics module "
+         "included. Volume anchoring discounts."), False),
+        (c.text("PiQjm", "Enterprise"), "Custom",
+         c.text("sk4OF",
+         "Unlimited tokens. Private infrastructure. Dedicated SLA. Custom "
+         "integrations. White-glove onboarding. 6-figure ACV."), True),
+    ]
+
+    tier_y = left_y + Inches(0.4)
+    tier_h = Inches(0.78)
+    tier_gap = Inches(0.12)
+    tier_boxes = stack(len(tiers), right_x, tier_y, right_w, tier_h,
+                       tier_gap)
+    for (tname, tprice, tdesc, hi), (_, ty, _, _) in zip(tiers, tier_boxes):
+        shape = add_rounded_rect(s11, right_x, ty, right_w, tier_h,
+                                 fill_color=CARD_BG)
+        if hi:
+            shape.line.color.rgb = ACCENT
+            shape.line.width = Pt(1)
+        add_text_box(s11, right_x + Inches(0.2), ty + Inches(0.1),
+                     Inches(1.3), Inches(0.25),
+                     tname, font_size=13, color=WHITE, bold=True)
+        add_text_box(s11, right_x + Inches(0.2), ty + Inches(0.38),
+                     Inches(1.3), Inches(0.3),
+                     tprice, font_size=16, color=ACCENT, bold=True)
+        add_text_box(s11, right_x + Inches(1.6), ty + Inches(0.1),
+                     right_w - Inches(2), tier_h - Inches(0.2),
+                     tdesc, font_size=10, color=GRAY_LIGHT, line_spacing=15)
+
+    # Defensibility Moats
+    moat_y = tier_y + len(tiers) * (tier_h + tier_gap) + Inches(0.15)
+    add_text_box(s11, right_x, moat_y, Inches(3), Inches(0.25),
+                 "DEFENSIBILITY MOATS", font_size=9, color=ACCENT,
+                 bold=True, font_name="JetBrains Mono")
+
+    moats = [
+        ("*", "Data Gravity", "Cryptographic graphs are non-portable"),
+        ("*", "Network Effects", "Each partner deepens the ecosystem"),
+        ("*", "Regulatory Tailwinds",
+         "Compliance mandates drive forced adoption"),
+    ]
+
+    moat_card_w = Inches(1.8)
+    moat_card_h = Inches(1.1)
+    moat_card_gap = Inches(0.1)
+    moat_card_y = moat_y + Inches(0.35)
+    boxes = row(len(moats), right_x, moat_card_y, moat_card_w, moat_card_h,
+                moat_card_gap)
+    for (icon, mt, md), (mx, _, _, _) in zip(moats, boxes):
+        shape = add_rounded_rect(s11, mx, moat_card_y, moat_card_w,
+                                 moat_card_h, fill_color=DARKER_BG)
+        shape.line.color.rgb = ACCENT
+        shape.line.width = Pt(0.5)
+        add_text_box(s11, mx + Inches(0.15), moat_card_y + Inches(0.1),
+                     moat_card_w - Inches(0.3), Inches(0.25),
+                     mt, font_size=10, color=WHITE, bold=True)
+        add_text_box(s11, mx + Inches(0.15), moat_card_y + Inches(0.45),
+                     moat_card_w - Inches(0.3), Inches(0.5),
+                     md, font_size=9, color=GRAY_MED, line_spacing=14)
+    add_slide_number(s11, len(prs.slides))
 
-vert_y = left_y + Inches(0.4)
-vert_h = Inches(0.8)
-vert_gap = Inches(0.12)
-for i, (vt, vd) in enumerate(verticals):
-    vy = vert_y + i * (vert_h + vert_gap)
-    add_rounded_rect(s11, left_x, vy, left_w, vert_h, fill_color=CARD_BG)
-    add_text_box(s11, left_x + Inches(0.2), vy + Inches(0.1),
-                 left_w - Inches(0.4), Inches(0.25),
-                 vt, font_size=13, color=WHITE, bold=True)
-    add_text_box(s11, left_x + Inches(0.2), vy + Inches(0.38),
-                 left_w - Inches(0.4), Inches(0.4),
-                 vd, font_size=10, color=GRAY_LIGHT, line_spacing=15)
-
-# Right column
-right_x = Inches(7.0)
-right_w = Inches(5.8)
-add_text_box(s11, right_x, left_y, Inches(3), Inches(0.25),
-             "PRICING TIERS", font_size=9, color=ACCENT,
-             bold=True, font_name="JetBrains Mono")
-
-tiers = [
-    ("Starter", "\u00A3500/mo",
-     "Up to 1,000 tokens/mo. Single user team. Shared infrastructure. "
-     "Ideal for pilots and POCs.", False),
-    ("Growth", "\u00A32,500/mo",
-     "Up to 25,000 tokens/mo. Multi-team access. Analytics module "
-     "included. Volume anchoring discounts.", False),
-    ("Enterprise", "Custom",
-     "Unlimited tokens. Private infrastructure. Dedicated SLA. Custom "
-     "integrations. White-glove onboarding. 6-figure ACV.", True),
-]
 
-tier_y = left_y + Inches(0.4)
-tier_h = Inches(0.78)
-tier_gap = Inches(0.12)
-for i, (tname, tprice, tdesc, hi) in enumerate(tiers):
-    ty = tier_y + i * (tier_h + tier_gap)
-    shape = add_rounded_rect(s11, right_x, ty, right_w, tier_h,
-                             fill_color=CARD_BG)
-    if hi:
-        shape.line.color.rgb = ACCENT
-        shape.line.width = Pt(1)
-    add_text_box(s11, right_x + Inches(0.2), ty + Inches(0.1),
-                 Inches(1.3), Inches(0.25),
-                 tname, font_size=13, color=WHITE, bold=True)
-    add_text_box(s11, right_x + Inches(0.2), ty + Inches(0.38),
-                 Inches(1.3), Inches(0.3),
-                 tprice, font_size=16, color=ACCENT, bold=True)
-    add_text_box(s11, right_x + Inches(1.6), ty + Inches(0.1),
-                 right_w - Inches(2), tier_h - Inches(0.2),
-                 tdesc, font_size=10, color=GRAY_LIGHT, line_spacing=15)
-
-# Defensibility Moats
-moat_y = tier_y + 3 * (tier_h + tier_gap) + Inches(0.15)
-add_text_box(s11, right_x, moat_y, Inches(3), Inches(0.25),
-             "DEFENSIBILITY MOATS", font_size=9, color=ACCENT,
-             bold=True, font_name="JetBrains Mono")
-
-moats = [
-    ("*", "Data Gravity", "Cryptographic graphs are non-portable"),
-    ("*", "Network Effects", "Each partner deepens the ecosystem"),
-    ("*", "Regulatory Tailwinds",
-     "Compliance mandates drive forced adoption"),
-]
+# ═══════════════════════════════════════════════════════════════════════
+# SLIDE 13 - Roadmap
+# ═══════════════════════════════════════════════════════════════════════
+def build_roadmap(prs, blank_layout, c=EMPTY):
+    s12 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s12)
+    add_section_label(s12, c.text("mLdUz", "ROADMAP"))
+    add_title(s12, c.text("shG3l", "Building in Phases"))
+
+    phases = [
+        (c.text("FXE1B", "PHASE 1"), True, c.text("FSaJn", "Core Token Engine"),
+         [c.text("F7NFx", "Hierarchical token minting"),
+          c.text("MTQ50", "Pack assembly & validation"),
+          c.text("l2FCD", "On-chain anchoring MVP"),
+          c.text("uCB96", "REST API & basic dashboard")]),
+        (c.text("podRE", "PHASE 2"), True, c.text("pkoSl", "ERP Integrations"),
+         [c.text("b6wLu", "SAP & Oracle connectors"),
+          c.text("K2ElP", "Webhook event system"),
+          c.text("vi2Gr", "Compliance reporting")]),
+        (c.text("vpxvr", "PHASE 3"), False,
+         c.text("K08em", "Cross-Chain Interop"),
+         [c.text("ppQPv", "Multi-chain anchoring"),
+          c.text("BIYN2", "Cross-chain asset queries")]),
+        (c.text("uykcm", "PHASE 4"), False,
+         c.text("8nfzS", "AI-Driven Analytics"),
+         [c.text("BC6vl", "Predictive asset intelligence"),
+          c.text("LgnCp", "Automated compliance alerts")]),
+    ]
+
+    phase_w = Inches(2.85)
+    phase_gap = Inches(0.2)
+    phase_x = Inches(0.83)
+    phase_y = Inches(2.4)
+
+    boxes = row(len(phases), phase_x, phase_y, phase_w, Inches(0.45),
+                phase_gap)
+    for i, ((pname, is_active, ptitle, items), (px, _, _, _)) in \
+            enumerate(zip(phases, boxes)):
+        head_h = Inches(0.45)
+        head_fill = ACCENT if i == 0 else DARKER_BG
+        head_tc = BLACK if i == 0 else (ACCENT if is_active else GRAY_MED)
+        add_rounded_rect(s12, px, phase_y, phase_w, head_h,
+                         fill_color=head_fill)
+        add_text_box(s12, px + Inches(0.2), phase_y,
+                     phase_w - Inches(0.4), head_h,
+                     pname, font_size=10, color=head_tc, bold=True,
+                     font_name="JetBrains Mono")
+
+        body_h = Inches(4)
+        add_rounded_rect(s12, px, phase_y + head_h, phase_w, body_h,
+                         fill_color=CARD_BG)
+        add_text_box(s12, px + Inches(0.2), phase_y + head_h + Inches(0.15),
+                     phase_w - Inches(0.4), Inches(0.35),
+                     ptitle, font_size=16, color=WHITE, bold=True)
+
+        item_color = GRAY_LIGHT if is_active else GRAY_MED
+        dash_color = ACCENT if is_active else GRAY_DARK
+        for j, item in enumerate(items):
+            iy = phase_y + head_h + Inches(0.6) + j * Inches(0.35)
+            add_text_box(s12, px + Inches(0.2), iy,
+                         Inches(0.3), Inches(0.3),
+                         "\u2500", font_size=10, color=dash_color,
+                         font_name="JetBrains Mono")
+            add_text_box(s12, px + Inches(0.45), iy,
+                         phase_w - Inches(0.65), Inches(0.3),
+                         item, font_size=11, color=item_color)
+    add_slide_number(s12, len(prs.slides))
 
-moat_card_w = Inches(1.8)
-moat_card_h = Inches(1.1)
-moat_card_gap = Inches(0.1)
-moat_card_y = moat_y + Inches(0.35)
-for i, (icon, mt, md) in enumerate(moats):
-    mx = right_x + i * (moat_card_w + moat_card_gap)
-    shape = add_rounded_rect(s11, mx, moat_card_y, moat_card_w,
-                             moat_card_h, fill_color=DARKER_BG)
-    shape.line.color.rgb = ACCENT
-    shape.line.width = Pt(0.5)
-    add_text_box(s11, mx + Inches(0.15), moat_card_y + Inches(0.1),
-                 moat_card_w - Inches(0.3), Inches(0.25),
-                 mt, font_size=10, color=WHITE, bold=True)
-    add_text_box(s11, mx + Inches(0.15), moat_card_y + Inches(0.45),
-                 moat_card_w - Inches(0.3), Inches(0.5),
-                 md, font_size=9, color=GRAY_MED, line_spacing=14)
-add_slide_number(s11, 11)
 
 # ═══════════════════════════════════════════════════════════════════════
-# SLIDE 12 - Roadmap
+# SLIDE 14 - Long-Term Vision
 # ═══════════════════════════════════════════════════════════════════════
-s12 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s12)
-add_section_label(s12, "ROADMAP")
-add_title(s12, "Building in Phases")
-
-phases = [
-    ("PHASE 1", True, "Core Token Engine",
-     ["Hierarchical token minting", "Pack assembly & validation",
-      "On-chain anchoring MVP", "REST API & basic dashboard"]),
-    ("PHASE 2", True, "ERP Integrations",
-     ["SAP & Oracle connectors", "Webhook event system",
-      "Compliance reporting"]),
-    ("PHASE 3", False, "Cross-Chain Interop",
-     ["Multi-chain anchoring", "Cross-chain asset queries"]),
-    ("PHASE 4", False, "AI-Driven Analytics",
-     ["Predictive asset intelligence", "Automated compliance alerts"]),
-]
+def build_vision(prs, blank_layout, c=EMPTY):
+    s13 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s13)
+    add_section_label(s13, c.text("8jUAa", "LONG-TERM VISION"))
+    add_title(s13, c.text("M0MNv", "Version Control for Physical Assets"),
+              width=Inches(8))
+    add_description(s13, c.text("oMLcY",
+        "We\u2019re building the provenance layer for the physical world. A "
+        "future where every asset has a verifiable, composable digital twin."),
+        width=Inches(6.5))
+
+    vision_cards = [
+        (c.icon("7V6BR"), c.text("joo5p", "Global Asset\nProvenance Layer"),
+         c.text("7I1ur",
+         "A universal registry of verifiable asset histories across "
+         "industries and borders.")),
+        (c.icon("GnlDq"), c.text("sElht", "Embedded Finance\nEnablement"),
+         c.text("7SxTc",
+         "Tokenised assets become programmable collateral for lending, "
+         "insurance, and trade finance.")),
+        (c.icon("hm4ZX"), c.text("3vC4c", "Automated\nCompliance"),
+         c.text("mpaPx",
+         "Regulatory reporting generated automatically from verifiable "
+         "asset data.")),
+        (c.icon("rQ9Wm"), c.text("87zV0", "Cross-Industry\nComposability"),
+         c.text("xXT9W",
+         "Token packs from one industry interoperate with token packs "
+         "from another.")),
+    ]
+
+    vis_w = Inches(2.85)
+    vis_h = Inches(3.0)
+    vis_gap = Inches(0.2)
+    vis_y = Inches(3.6)
+
+    boxes = row(len(vision_cards), Inches(0.83), vis_y, vis_w, vis_h, vis_gap)
+    for i, ((icon, vt, vd), (vx, _, _, _)) in enumerate(zip(vision_cards,
+                                                           boxes)):
+        shape = add_rounded_rect(s13, vx, vis_y, vis_w, vis_h,
+                                 fill_color=CARD_BG)
+        if i == 3:
+            shape.line.color.rgb = ACCENT
+            shape.line.width = Pt(1)
+        icon_box = add_text_box(s13, vx, vis_y + Inches(0.35), vis_w,
+                                Inches(0.5), "*", font_size=30, color=ACCENT,
+                                alignment=PP_ALIGN.CENTER)
+        if icon:
+            icon_box.name = f"Icon: {icon}"
+        add_text_box(s13, vx + Inches(0.2), vis_y + Inches(0.9),
+                     vis_w - Inches(0.4), Inches(0.6),
+                     vt, font_size=14, color=WHITE, bold=True,
+                     alignment=PP_ALIGN.CENTER, line_spacing=20)
+        add_text_box(s13, vx + Inches(0.2), vis_y + Inches(1.6),
+                     vis_w - Inches(0.4), Inches(1.0),
+                     vd, font_size=11, color=GRAY_LIGHT,
+                     alignment=PP_ALIGN.CENTER, line_spacing=18)
+    add_slide_number(s13, len(prs.slides))
 
-phase_w = Inches(2.85)
-phase_gap = Inches(0.2)
-phase_x = Inches(0.83)
-phase_y = Inches(2.4)
-
-for i, (pname, is_active, ptitle, items) in enumerate(phases):
-    px = phase_x + i * (phase_w + phase_gap)
-    head_h = Inches(0.45)
-    head_fill = ACCENT if i == 0 else DARKER_BG
-    head_tc = BLACK if i == 0 else (ACCENT if is_active else GRAY_MED)
-    add_rounded_rect(s12, px, phase_y, phase_w, head_h,
-                     fill_color=head_fill)
-    add_text_box(s12, px + Inches(0.2), phase_y,
-                 phase_w - Inches(0.4), head_h,
-                 pname, font_size=10, color=head_tc, bold=True,
-                 font_name="JetBrains Mono")
-
-    body_h = Inches(4)
-    add_rounded_rect(s12, px, phase_y + head_h, phase_w, body_h,
-                     fill_color=CARD_BG)
-    add_text_box(s12, px + Inches(0.2), phase_y + head_h + Inches(0.15),
-                 phase_w - Inches(0.4), Inches(0.35),
-                 ptitle, font_size=16, color=WHITE, bold=True)
-
-    item_color = GRAY_LIGHT if is_active else GRAY_MED
-    dash_color = ACCENT if is_active else GRAY_DARK
-    for j, item in enumerate(items):
-        iy = phase_y + head_h + Inches(0.6) + j * Inches(0.35)
-        add_text_box(s12, px + Inches(0.2), iy,
-                     Inches(0.3), Inches(0.3),
-                     "\u2500", font_size=10, color=dash_color,
-                     font_name="JetBrains Mono")
-        add_text_box(s12, px + Inches(0.45), iy,
-                     phase_w - Inches(0.65), Inches(0.3),
-                     item, font_size=11, color=item_color)
-add_slide_number(s12, 12)
 
 # ═══════════════════════════════════════════════════════════════════════
-# SLIDE 13 - Long-Term Vision
+# SLIDE 15 - Closing
 # ═══════════════════════════════════════════════════════════════════════
-s13 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s13)
-add_section_label(s13, "LONG-TERM VISION")
-add_title(s13, "Version Control for Physical Assets", width=Inches(8))
-add_description(s13,
-    "We\u2019re building the provenance layer for the physical world. A "
-    "future where every asset has a verifiable, composable digital twin.",
-    width=Inches(6.5))
-
-vision_cards = [
-    ("*", "Global Asset\nProvenance Layer",
-     "A universal registry of verifiable asset histories across "
-     "industries and borders."),
-    ("*", "Embedded Finance\nEnablement",
-     "Tokenised assets become programmable collateral for lending, "
-     "insurance, and trade finance."),
-    ("*", "Automated\nCompliance",
-     "Regulatory reporting generated automatically from verifiable "
-     "asset data."),
-    ("*", "Cross-Industry\nComposability",
-     "Token packs from one industry interoperate with token packs "
-     "from another."),
+def build_closing(prs, blank_layout, c=EMPTY):
+    s14 = prs.slides.add_slide(blank_layout)
+    set_slide_bg(s14)
+    add_accent_line(s14, Inches(0), Inches(0), SLIDE_W, Pt(3))
+    add_text_box(s14, Inches(2.5), Inches(2.5), Inches(8.333), Inches(1),
+                 "\u201C" + c.text("Cobiu", "Build Trust Into Your Assets.")
+                 + "\u201D",
+                 font_size=40, color=WHITE, bold=True,
+                 alignment=PP_ALIGN.CENTER)
+    add_accent_line(s14, Inches(6), Inches(3.7), Inches(1.333), Pt(2))
+    add_text_box(s14, Inches(2.5), Inches(4.0), Inches(8.333), Inches(0.6),
+                 c.text("hN2lg", "BlockTrace"), font_size=20, color=ACCENT, bold=True,
+                 alignment=PP_ALIGN.CENTER)
+    add_text_box(s14, Inches(2.5), Inches(4.7), Inches(8.333), Inches(0.35),
+                 c.text("kqsTf", "contact@blocktrace.io"), font_size=12, color=GRAY_MED,
+                 font_name="JetBrains Mono", alignment=PP_ALIGN.CENTER)
+    add_text_box(s14, Inches(2.5), Inches(5.05), Inches(8.333), Inches(0.35),
+                 c.text("Y0VY3", "www.blocktrace.io"), font_size=12, color=GRAY_MED,
+                 font_name="JetBrains Mono", alignment=PP_ALIGN.CENTER)
+    add_slide_number(s14, len(prs.slides))
+
+# (pitch-deck.pen slide frame id, builder). Builders without a frame in the
+# design are PPTX-only and stay directly after their predecessor.
+SLIDE_BUILDERS = [
+    ("Sjc6f", build_title),
+    ("mtn5v", build_problem),
+    ("RaZgA", build_opportunity),
+    ("mlZoM", build_solution),
+    ("2sHtJ", build_how_it_works),
+    ("new_platform_slide", build_platform),
+    ("KCXuG", build_why_it_matters),
+    ("YCMO1", build_use_cases),
+    (None, build_integration),
+    ("cXOay", build_competition),
+    ("Ky6rX", build_business_model),
+    ("jOmv4", build_gtm),
+    ("AFazf", build_roadmap),
+    ("CNfMm", build_vision),
+    ("ZEePF", build_closing),
 ]
 
-vis_w = Inches(2.85)
-vis_h = Inches(3.0)
-vis_gap = Inches(0.2)
-vis_y = Inches(3.6)
 
-for i, (icon, vt, vd) in enumerate(vision_cards):
-    vx = Inches(0.83) + i * (vis_w + vis_gap)
-    shape = add_rounded_rect(s13, vx, vis_y, vis_w, vis_h,
-                             fill_color=CARD_BG)
-    if i == 3:
-        shape.line.color.rgb = ACCENT
-        shape.line.width = Pt(1)
-    add_text_box(s13, vx, vis_y + Inches(0.35), vis_w, Inches(0.5),
-                 icon, font_size=30, color=ACCENT,
-                 alignment=PP_ALIGN.CENTER)
-    add_text_box(s13, vx + Inches(0.2), vis_y + Inches(0.9),
-                 vis_w - Inches(0.4), Inches(0.6),
-                 vt, font_size=14, color=WHITE, bold=True,
-                 alignment=PP_ALIGN.CENTER, line_spacing=20)
-    add_text_box(s13, vx + Inches(0.2), vis_y + Inches(1.6),
-                 vis_w - Inches(0.4), Inches(1.0),
-                 vd, font_size=11, color=GRAY_LIGHT,
-                 alignment=PP_ALIGN.CENTER, line_spacing=18)
-add_slide_number(s13, 13)
+def ordered_builders(content=EMPTY):
+    """Builders in the design's slide order.
 
-# ═══════════════════════════════════════════════════════════════════════
-# SLIDE 14 - Closing
-# ═══════════════════════════════════════════════════════════════════════
-s14 = prs.slides.add_slide(blank_layout)
-set_slide_bg(s14)
-add_accent_line(s14, Inches(0), Inches(0), SLIDE_W, Pt(3))
-add_text_box(s14, Inches(2.5), Inches(2.5), Inches(8.333), Inches(1),
-             "\u201CBuild Trust Into Your Assets.\u201D",
-             font_size=40, color=WHITE, bold=True,
-             alignment=PP_ALIGN.CENTER)
-add_accent_line(s14, Inches(6), Inches(3.7), Inches(1.333), Pt(2))
-add_text_box(s14, Inches(2.5), Inches(4.0), Inches(8.333), Inches(0.6),
-             "BlockTrace", font_size=20, color=ACCENT, bold=True,
-             alignment=PP_ALIGN.CENTER)
-add_text_box(s14, Inches(2.5), Inches(4.7), Inches(8.333), Inches(0.35),
-             "contact@blocktrace.io", font_size=12, color=GRAY_MED,
-             font_name="JetBrains Mono", alignment=PP_ALIGN.CENTER)
-add_text_box(s14, Inches(2.5), Inches(5.05), Inches(8.333), Inches(0.35),
-             "www.blocktrace.io", font_size=12, color=GRAY_MED,
-             font_name="JetBrains Mono", alignment=PP_ALIGN.CENTER)
-add_slide_number(s14, 14)
-
-# Save
-output_path = "BlockTrace_Pitch_Deck.pptx"
-prs.save(output_path)
-print(f"\u2705 Saved {output_path} \u2014 {len(prs.slides)} slides")
+    Slides removed from the .pen are dropped; without a design (or when it
+    shares no slide ids with SLIDE_BUILDERS) the table order is used as is.
+    """
+    order = content.slide_order()
+    known = {pen_id for pen_id, _ in SLIDE_BUILDERS if pen_id}
+    if not known.intersection(order):
+        return [builder for _, builder in SLIDE_BUILDERS]
+
+    groups, trailing = {}, None
+    for pen_id, builder in SLIDE_BUILDERS:
+        if pen_id:
+            trailing = groups.setdefault(pen_id, [])
+        if trailing is not None:
+            trailing.append(builder)
+    return [builder for pen_id in order for builder in groups.get(pen_id, ())]
+
+
+# ── Build Presentation ─────────────────────────────────────────────────
+THEME_FONT = "Inter"
+_base = None
+
+
+def _drop_proxies(prs):
+    """Forget the proxies python-pptx caches on ``prs`` and its parts
+    (prs.slides, slide masters, layouts, ...).
+
+    They wrap child elements of a part's XML, and deepcopy() gives such a
+    proxy a detached copy of its element rather than the clone's own, so a
+    clone made after e.g. ``prs.slides`` was read would add slides to a
+    list no part saves. Without them a clone rebuilds every proxy from its
+    own tree on first use.
+    """
+    for obj in (prs, *prs.part.package.iter_parts()):
+        for key, value in list(vars(obj).items()):
+            if not key.startswith("_") and isinstance(value, ElementProxy):
+                del obj.__dict__[key]
+
+
+def _prepared_base():
+    """Default template parsed once per process: 16:9, Inter theme fonts."""
+    global _base
+    if _base is None:
+        prs = Presentation()
+        prs.slide_width = SLIDE_W
+        prs.slide_height = SLIDE_H
+        theme = prs.slide_master.part.part_related_by(RT.THEME)
+        # The theme is an opaque blob part in python-pptx; patch it in place
+        theme._blob = re.sub(
+            rb'(<a:(?:major|minor)Font><a:latin typeface=")[^"]*"',
+            rb'\g<1>' + THEME_FONT.encode() + b'"', theme.blob)
+        _base = prs
+    return _base
+
+
+def new_presentation():
+    """A blank deck cloned from the prepared base.
+
+    Deep-copying the parsed package is cheaper than re-reading and parsing
+    a template, and gives byte-identical output. Cached proxies are dropped
+    from the base first (see _drop_proxies), so nothing read on the base
+    leaks into a clone.
+    """
+    base = _prepared_base()
+    _drop_proxies(base)
+    return copy.deepcopy(base)
+
+
+def build_presentation(profiler=NULL_PROFILER, content=EMPTY):
+    with tracing.span("build") as build:
+        with profiler.stage("template"), tracing.span("template"):
+            prs = new_presentation()
+            blank_layout = prs.slide_layouts[6]
+        for builder in ordered_builders(content):
+            with profiler.stage(builder.__name__), tracing.span(
+                    "slide", builder=builder.__name__) as sp:
+                builder(prs, blank_layout, content)
+                if tracing.enabled():
+                    sp.set(slide=builder.__name__[len("build_"):],
+                           number=len(prs.slides),
+                           shapes=len(prs.slides[-1].shapes))
+        build.set(slides=len(prs.slides))
+    return prs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", default="BlockTrace_Pitch_Deck.pptx")
+    parser.add_argument("--embed-fonts", action="store_true",
+                        help="subset and embed the deck fonts")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="report tracemalloc deltas per build stage")
+    parser.add_argument("--pen", default=DEFAULT_PEN,
+                        help="design file to take slide copy and order from")
+    parser.add_argument("--no-pen", action="store_true",
+                        help="build from the built-in copy only")
+    parser.add_argument("--pdf", metavar="PATH",
+                        help="also render the deck to PDF (see pdf_export.py)")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="write trace spans (.jsonl, else Chrome format)")
+    args = parser.parse_args(argv)
+    profiler = MemoryProfiler() if args.profile_memory else NULL_PROFILER
+    tracing.configure(args.trace)
+
+    with profiler.stage("content"), tracing.span("content", pen=args.pen):
+        content = EMPTY if args.no_pen else load_content(args.pen)
+    prs = build_presentation(profiler, content)
+    if args.embed_fonts:
+        from font_embed import embed_fonts
+        with profiler.stage("embed_fonts"), \
+                tracing.span("embed_fonts") as sp:
+            sp.set(faces=len(embed_fonts(prs)))
+
+    with profiler.stage("save"), tracing.span("save", path=args.output):
+        written = save_presentation(prs, args.output)
+    if written:
+        print(f"\u2705 Saved {args.output} \u2014 {len(prs.slides)} slides")
+    else:
+        print(f"{args.output} unchanged \u2014 {len(prs.slides)} slides")
+    if args.pdf:
+        from pdf_export import save_pdf
+        with profiler.stage("pdf"), tracing.span("pdf", path=args.pdf):
+            written = save_pdf(prs, args.pdf)
+        print(f"{'Saved' if written else 'Unchanged'} {args.pdf}")
+    profiler.report()
+    tracing.close()
+
+
+if __name__ == "__main__":
+    main()
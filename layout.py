@@ -0,0 +1,126 @@
+"""Vectorised box layout for card grids, brickwork rows and stacks.
+
+Every solver returns a Boxes of four int64 EMU arrays (x, y, w, h), one
+entry per cell in reading order, computed in a single NumPy pass:
+
+    for (title, desc), (x, y, w, h) in zip(cards, grid(len(cards), MARGIN,
+                                                       TOP, CARD_W, CARD_H,
+                                                       columns=4, gap=GAP)):
+        add_card(slide, x, y, w, h, title, desc)
+
+Iterating a Boxes yields plain ints, which is what python-pptx expects.
+Sizes are whole EMU; fitted cell sizes round down, so a fitted grid never
+overflows its area.
+"""
+
+import numpy as np
+
+ALIGNMENTS = ("start", "center", "end")
+
+
+class Boxes:
+    def __init__(self, x, y, w, h):
+        n = max(np.size(x), np.size(y), np.size(w), np.size(h))
+        self.x, self.y, self.w, self.h = (
+            np.broadcast_to(np.asarray(a, dtype=np.int64), (n,))
+            for a in (x, y, w, h))
+
+    def __len__(self):
+        return len(self.x)
+
+    def __iter__(self):
+        return zip(self.x.tolist(), self.y.tolist(), self.w.tolist(),
+                   self.h.tolist())
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return Boxes(self.x[i], self.y[i], self.w[i], self.h[i])
+        return (int(self.x[i]), int(self.y[i]), int(self.w[i]),
+                int(self.h[i]))
+
+    def shift(self, dx=0, dy=0):
+        return Boxes(self.x + dx, self.y + dy, self.w, self.h)
+
+    def inset(self, dx, dy=None):
+        dy = dx if dy is None else dy
+        return Boxes(self.x + dx, self.y + dy, self.w - 2 * dx,
+                     self.h - 2 * dy)
+
+    def centers(self):
+        return self.x + self.w // 2, self.y + self.h // 2
+
+    def extent(self):
+        """(left, top, width, height) of the bounding box."""
+        left, top = int(self.x.min()), int(self.y.min())
+        return (left, top, int((self.x + self.w).max()) - left,
+                int((self.y + self.h).max()) - top)
+
+
+def fit(total, count, gap=0):
+    """Largest whole-EMU cell size that fits ``count`` cells in ``total``."""
+    return int((total - (count - 1) * gap) // count)
+
+
+def _offset(free, align):
+    if align not in ALIGNMENTS:
+        raise ValueError(f"align must be one of {ALIGNMENTS}, not {align!r}")
+    return {"start": 0, "center": free // 2, "end": free}[align]
+
+
+def grid(n, left, top, cell_w, cell_h, columns=None, gap=0, row_gap=None,
+         align="start"):
+    """``n`` cells filled row by row, ``columns`` per row.
+
+    ``align`` places a short last row within the width of a full one.
+    """
+    columns = min(columns or n, n) or 1
+    row_gap = gap if row_gap is None else row_gap
+    row, col = np.divmod(np.arange(n, dtype=np.int64), columns)
+    x = left + col * (cell_w + gap)
+    short = n % columns
+    if short and align != "start":
+        free = (columns - short) * (cell_w + gap)
+        x = np.where(row == n // columns, x + _offset(free, align), x)
+    return Boxes(x, top + row * (cell_h + row_gap), cell_w, cell_h)
+
+
+def fit_grid(n, left, top, width, height, columns=None, gap=0, row_gap=None,
+             align="start"):
+    """grid() with cell sizes derived from the area it must fill."""
+    columns = min(columns or n, n) or 1
+    rows = -(-n // columns)
+    row_gap = gap if row_gap is None else row_gap
+    return grid(n, left, top, fit(width, columns, gap),
+                fit(height, rows, row_gap), columns, gap, row_gap, align)
+
+
+def row(n, left, top, cell_w, cell_h, gap=0):
+    return grid(n, left, top, cell_w, cell_h, columns=n, gap=gap)
+
+
+def stack(n, left, top, cell_w, cell_h, gap=0):
+    return grid(n, left, top, cell_w, cell_h, columns=1, row_gap=gap)
+
+
+def centered_row(n, center_x, top, cell_w, cell_h, gap=0):
+    """A row of ``n`` cells centred on ``center_x`` (tree children)."""
+    span = n * cell_w + (n - 1) * gap
+    return row(n, center_x - span // 2, top, cell_w, cell_h, gap)
+
+
+def brickwork(counts, left, top, cell_w, cell_h, gap=0, row_gap=None,
+              align="center"):
+    """Rows of ``counts[i]`` cells, each aligned against the widest row.
+
+    brickwork((3, 2), ...) is the offset 3-over-2 card wall used on the
+    pitch deck's Why/Integrate/Business Model slides.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    row_gap = gap if row_gap is None else row_gap
+    rows = np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    col = np.arange(int(counts.sum()), dtype=np.int64) - starts[rows]
+    free = (counts.max() - counts) * (cell_w + gap)
+    shift = _offset(free, align)
+    return Boxes(left + shift[rows] + col * (cell_w + gap),
+                 top + rows * (cell_h + row_gap), cell_w, cell_h)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Build the pitch deck in several languages from one shared layout.
+
+The deck is laid out once. Every text box's string becomes a catalog
+message keyed by where it comes from: "<node id>.content" for copy taken
+from the .pen design (generate_pptx names those boxes after the node), or
+"text.<hash>" for the few strings written into generate_pptx itself. Each
+message also records a hash of its source text. Locales render in parallel
+workers that clone the laid-out deck and substitute text only - positions,
+sizes and styles are shared.
+
+    python localize.py extract -o locales/messages.json
+    python localize.py build de fr -d locales -o build/locales -j 4
+
+locales/de.json is {"<id>": {"text": "<translation>", "source": "<hash>"}}
+with "source" copied from the catalog. Editing an English string keeps its
+id, so its translation is not orphaned: the hashes no longer match and
+the entry is reported as stale (the English text is shown until it is
+re-translated). Entries whose id is not in the deck any more are reported
+as orphaned. Missing ids fall back to the source text. After substitution
+each box is measured with the deck's font metrics (as in pdf_export.py)
+and strings that no longer fit are reported with their id and slide.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from pptx import Presentation
+from reportlab.lib.utils import simpleSplit
+
+from deck_writer import presentation_bytes, write_if_changed
+from generate_pptx import TEXT_NAME_PREFIX, build_presentation
+from pdf_export import INSET_X, INSET_Y, pdf_font
+from pen_content import DEFAULT_PEN, load_content
+
+EMU_PER_PT = 12700
+_WORDS = re.compile(r"[^\W\d_]", re.UNICODE)
+
+
+def source_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:10]
+
+
+def message_id(shape):
+    """Catalog id of a text box: its .pen node and field, else its text."""
+    if shape.name.startswith(TEXT_NAME_PREFIX):
+        return f"{shape.name[len(TEXT_NAME_PREFIX):]}.content"
+    return f"text.{source_hash(shape.text_frame.text)}"
+
+
+def text_frames(prs):
+    """Yield (slide number, shape) for every translatable text box."""
+    for number, slide in enumerate(prs.slides, 1):
+        for shape in slide.shapes:
+            if not shape.has_text_frame:
+                continue
+            text = shape.text_frame.text
+            # Icons, numbers and symbols ("*", "01", "✓") stay as-is
+            if _WORDS.search(text):
+                yield number, shape
+
+
+def extract(prs):
+    catalog = {}
+    for number, shape in text_frames(prs):
+        text = shape.text_frame.text
+        entry = catalog.setdefault(message_id(shape),
+                                   {"text": text, "hash": source_hash(text),
+                                    "slides": []})
+        if number not in entry["slides"]:
+            entry["slides"].append(number)
+    return catalog
+
+
+def overflow(shape):
+    """Ratio of wrapped text height to box height (> 1 overflows)."""
+    frame = shape.text_frame
+    p = frame.paragraphs[0]
+    size = (p.font.size.pt if p.font.size else 18)
+    font = pdf_font(p.font.name, p.font.bold)
+    leading = p.line_spacing.pt if p.line_spacing else size * 1.2
+    width = shape.width / EMU_PER_PT - 2 * INSET_X
+    height = shape.height / EMU_PER_PT - 2 * INSET_Y
+    lines = sum(len(simpleSplit(line, font, size, width) or [""])
+                for line in frame.text.replace("\v", "\n").split("\n"))
+    return lines * leading / max(height, leading)
+
+
+def render_locale(job):
+    """Worker: substitute one locale's text into the shared layout.
+
+    Returns (locale, written, missing, stale, orphaned, overflows); stale
+    and orphaned list the ids of translations that were not used.
+    """
+    base, locale, messages, out_path = job
+    prs = Presentation(io.BytesIO(base))
+    missing, stale, overflows = 0, [], []
+    seen = set()
+    for number, shape in text_frames(prs):
+        key = message_id(shape)
+        seen.add(key)
+        entry = messages.get(key) or {}
+        text = entry.get("text")
+        if not text:
+            missing += 1
+            continue
+        if entry.get("source") != source_hash(shape.text_frame.text):
+            if key not in stale:
+                stale.append(key)
+            continue
+        before = overflow(shape)
+        shape.text_frame.paragraphs[0].text = text
+        ratio = overflow(shape)
+        # Only flag boxes the translation pushed over, not tight originals
+        if ratio > 1 and ratio > before:
+            overflows.append((key, number, round(ratio, 2), text))
+    written = write_if_changed(out_path, presentation_bytes(prs))
+    orphaned = sorted(set(messages) - seen)
+    return locale, written, missing, stale, orphaned, overflows
+
+
+def base_deck(pen_path=DEFAULT_PEN):
+    return build_presentation(content=load_content(pen_path))
+
+
+def build_locales(locales, locale_dir, out_dir, output_name, jobs=None):
+    prs = base_deck()
+    base = presentation_bytes(prs)
+    os.makedirs(out_dir, exist_ok=True)
+    root, ext = os.path.splitext(output_name)
+    job_list = []
+    for locale in locales:
+        with open(os.path.join(locale_dir, f"{locale}.json"),
+                  encoding="utf-8") as f:
+            messages = json.load(f)
+        job_list.append((base, locale, messages,
+                         os.path.join(out_dir, f"{root}.{locale}{ext}")))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(render_locale, job_list))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    ex = sub.add_parser("extract", help="write the source message catalog")
+    ex.add_argument("-o", "--output", default="locales/messages.json")
+    bd = sub.add_parser("build", help="render decks for the given locales")
+    bd.add_argument("locales", nargs="+")
+    bd.add_argument("-d", "--locale-dir", default="locales")
+    bd.add_argument("-o", "--out-dir", default="build/locales")
+    bd.add_argument("--name", default="BlockTrace_Pitch_Deck.pptx")
+    bd.add_argument("-j", "--jobs", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.command == "extract":
+        catalog = extract(base_deck())
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        data = json.dumps(catalog, indent=2, ensure_ascii=False) + "\n"
+        written = write_if_changed(args.output, data.encode("utf-8"))
+        print(f"{'Saved' if written else 'Unchanged'} {args.output} "
+              f"— {len(catalog)} messages")
+        return
+
+    results = build_locales(args.locales, args.locale_dir, args.out_dir,
+                            args.name, args.jobs)
+    for locale, written, missing, stale, orphaned, overflows in results:
+        print(f"{locale}: {'saved' if written else 'unchanged'}, "
+              f"{missing} untranslated, {len(stale)} stale, "
+              f"{len(orphaned)} orphaned, {len(overflows)} overflowing")
+        for key in stale:
+            print(f"  stale {key}: source text changed", file=sys.stderr)
+        for key in orphaned:
+            print(f"  orphaned {key}: not in the deck", file=sys.stderr)
+        for key, number, ratio, text in overflows:
+            print(f"  slide {number:02d} {key} x{ratio}: {text[:60]!r}",
+                  file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""tracemalloc-based memory profiling for pipeline stages.
+
+    profiler = MemoryProfiler()
+    with profiler.stage("load"):
+        ...
+    profiler.report()
+
+Each stage records the net traced-memory delta, the peak reached while it
+ran, and the allocation sites that grew the most. NULL_PROFILER has the
+same interface and does nothing, so call sites need no branching.
+
+tracemalloc only sees allocations made through Python's allocator: lxml's
+libxml2 trees are invisible to it, while the python-pptx proxies and our
+own content tuples are not.
+"""
+
+import contextlib
+import sys
+import tracemalloc
+
+_IGNORE = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemoryProfiler:
+    def __init__(self, top=10, frames=1):
+        self.top = top
+        self.frames = frames
+        self.stages = []
+        self._first = None
+        self._last = None
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(_IGNORE)
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        before = self._snapshot()
+        if self._first is None:
+            self._first = before
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            after = self._snapshot()
+            self.stages.append({
+                "name": name,
+                "delta": current - start,
+                "peak": peak - start,
+                "sites": after.compare_to(before, "lineno")[:self.top],
+            })
+            self._last = after
+
+    def report(self, file=sys.stderr):
+        if not self.stages:
+            return
+        width = max(len(s["name"]) for s in self.stages)
+        print(f"\n{'stage':<{width}}  {'delta':>12}  {'peak':>12}", file=file)
+        for s in self.stages:
+            print(f"{s['name']:<{width}}  {_kib(s['delta']):>12}  "
+                  f"{_kib(s['peak']):>12}", file=file)
+
+        print("\nTop allocation sites per stage:", file=file)
+        for s in self.stages:
+            sites = [st for st in s["sites"] if st.size_diff > 0]
+            if not sites:
+                continue
+            print(f"  {s['name']}", file=file)
+            for st in sites:
+                frame = st.traceback[0]
+                print(f"    {_kib(st.size_diff):>12}  {st.count_diff:>+8} "
+                      f"blocks  {frame.filename}:{frame.lineno}", file=file)
+
+        print("\nRetained since first stage:", file=file)
+        for st in self._last.compare_to(self._first, "lineno")[:self.top]:
+            frame = st.traceback[0]
+            print(f"  {_kib(st.size_diff):>12}  {frame.filename}:"
+                  f"{frame.lineno}", file=file)
+
+    def stop(self):
+        tracemalloc.stop()
+
+
+class _NullProfiler:
+    def stage(self, name):
+        return contextlib.nullcontext()
+
+    def report(self, file=None):
+        pass
+
+    def stop(self):
+        pass
+
+
+NULL_PROFILER = _NullProfiler()
+
+
+def _kib(n):
+    return f"{n / 1024:+,.1f} KiB"
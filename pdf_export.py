@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Render a built deck straight to PDF with reportlab, no office suite.
+
+The renderer walks the python-pptx shape tree that the generate_pptx
+helpers produce - slide background, rectangles and rounded rectangles
+(fill, optional outline), text boxes and pictures - so the PDF has the
+same geometry as the PPTX without a second layout model. Text is wrapped
+run by run, each in its own font, size and colour, and placed by the
+frame's vertical anchor (top, middle or bottom).
+
+    python generate_pptx.py --pdf BlockTrace_Pitch_Deck.pdf
+    python pdf_export.py deck-a.pptx deck-b.pptx -o build/pdf -j 4
+
+Fonts come from the same BLOCKTRACE_FONT_DIRS lookup as font_embed.py and
+fall back to reportlab's bundled Vera. Registered fonts and decoded images
+are cached per process, so batch exports pay for them once per worker.
+"""
+
+import argparse
+import io
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import reportlab
+from pptx import Presentation
+from pptx.enum.dml import MSO_FILL
+from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.oxml.ns import qn
+from pptx.text.text import _Run
+from pptx.util import Emu, Pt
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+
+from deck_writer import write_if_changed
+from font_embed import find_font_file
+
+EMU_PER_PT = 12700
+# python-pptx text box defaults (bodyPr lIns/rIns 0.1", tIns/bIns 0.05")
+INSET_X = Emu(91440).pt
+INSET_Y = Emu(45720).pt
+ROUNDED_DEFAULT_ADJ = 0.16667
+# Words, runs of spaces and line breaks, wrapped as units
+_PIECES = re.compile(r"\n|[^\S\n]+|[^\s]+")
+_VERA = os.path.join(os.path.dirname(reportlab.__file__), "fonts")
+
+_fonts = {}
+_images = {}
+
+
+def pdf_font(family, bold):
+    """reportlab font name for (family, bold), registering it on first use."""
+    key = (family or "Calibri", bool(bold))
+    if key not in _fonts:
+        path = find_font_file(*key)
+        name = f"{key[0].replace(' ', '')}-{'Bold' if bold else 'Regular'}"
+        if path is None:
+            path = os.path.join(_VERA, "VeraBd.ttf" if bold else "Vera.ttf")
+            name = "Vera-Bold" if bold else "Vera"
+        if name not in pdfmetrics.getRegisteredFontNames():
+            pdfmetrics.registerFont(TTFont(name, path))
+        _fonts[key] = name
+    return _fonts[key]
+
+
+def pdf_image(image):
+    """ImageReader for a pptx Image, shared across slides by content hash."""
+    if image.sha1 not in _images:
+        _images[image.sha1] = ImageReader(io.BytesIO(image.blob))
+    return _images[image.sha1]
+
+
+def _rgb(color):
+    return tuple(c / 255 for c in color.rgb)
+
+
+def _solid(fill):
+    return fill.type == MSO_FILL.SOLID
+
+
+def draw_shape(c, shape, page_h):
+    x, w = shape.left / EMU_PER_PT, shape.width / EMU_PER_PT
+    h = shape.height / EMU_PER_PT
+    y = page_h - shape.top / EMU_PER_PT - h
+
+    if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+        c.drawImage(pdf_image(shape.image), x, y, w, h, mask="auto")
+        return
+    if shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
+        fill = _solid(shape.fill)
+        stroke = _solid(shape.line.fill)
+        if fill:
+            c.setFillColorRGB(*_rgb(shape.fill.fore_color))
+        if stroke:
+            c.setStrokeColorRGB(*_rgb(shape.line.color))
+            c.setLineWidth(shape.line.width.pt or 0.75)
+        if fill or stroke:
+            if shape.auto_shape_type == MSO_SHAPE.ROUNDED_RECTANGLE:
+                adj = (shape.adjustments[0] if len(shape.adjustments)
+                       else ROUNDED_DEFAULT_ADJ)
+                c.roundRect(x, y, w, h, adj * min(w, h), stroke=int(stroke),
+                            fill=int(fill))
+            else:
+                c.rect(x, y, w, h, stroke=int(stroke), fill=int(fill))
+    if shape.has_text_frame and shape.text_frame.text:
+        draw_text(c, shape.text_frame, x, y + h, w, h)
+
+
+def _run_style(run, p):
+    """(font name, size, colour) of ``run``, inheriting from ``p``."""
+    font = run.font
+    size = (font.size or p.font.size or Pt(18)).pt
+    bold = font.bold if font.bold is not None else p.font.bold
+    name = pdf_font(font.name or p.font.name, bold)
+    try:
+        color = _rgb(font.color if font.color.type else p.font.color)
+    except AttributeError:
+        color = (0, 0, 0)
+    return name, size, color
+
+
+def _paragraph_lines(p, max_w):
+    """Wrap one paragraph's runs into lines of (text, style, width) pieces.
+
+    Words are kept whole and wrapped greedily; a:br starts a new line.
+    """
+    lines, line, line_w = [], [], 0
+    for child in p._p.content_children:
+        if child.tag == qn("a:br"):
+            lines.append(line)
+            line, line_w = [], 0
+            continue
+        run = _Run(child, p)
+        style = _run_style(run, p)
+        name, size, _ = style
+        for piece in _PIECES.findall(run.text.replace("\v", "\n")):
+            if piece == "\n":
+                lines.append(line)
+                line, line_w = [], 0
+                continue
+            width = pdfmetrics.stringWidth(piece, name, size)
+            if piece.isspace():
+                if line:
+                    line.append((piece, style, width))
+                    line_w += width
+                continue
+            if line and line_w + width > max_w:
+                while line and line[-1][0].isspace():
+                    line_w -= line.pop()[2]
+                lines.append(line)
+                line, line_w = [], 0
+            line.append((piece, style, width))
+            line_w += width
+    lines.append(line)
+    return lines
+
+
+def draw_text(c, frame, x, top, width, height):
+    """Word-wrapped paragraphs, each run in its own font, size and colour,
+    placed by the frame's vertical anchor (top unless set)."""
+    max_w = width - 2 * INSET_X
+    laid_out = []
+    for p in frame.paragraphs:
+        runs = p.runs
+        # An empty line keeps the height of the paragraph's first run
+        empty = (_run_style(runs[0], p)[1] if runs
+                 else (p.font.size or Pt(18)).pt)
+        for line in _paragraph_lines(p, max_w):
+            size = max((style[1] for _, style, _ in line), default=empty)
+            if isinstance(p.line_spacing, float):
+                leading = size * 1.2 * p.line_spacing
+            elif p.line_spacing is not None:
+                leading = p.line_spacing.pt
+            else:
+                leading = size * 1.2
+            laid_out.append((p.alignment, line, size, leading))
+
+    total = sum(leading for _, _, _, leading in laid_out)
+    free = height - 2 * INSET_Y - total
+    anchor = frame.vertical_anchor
+    cursor = top - INSET_Y
+    if anchor == MSO_ANCHOR.MIDDLE:
+        cursor -= free / 2
+    elif anchor == MSO_ANCHOR.BOTTOM:
+        cursor -= free
+
+    for alignment, line, size, leading in laid_out:
+        cursor -= leading
+        baseline = cursor + (leading - size) / 2 + size * 0.2
+        while line and line[-1][0].isspace():
+            line = line[:-1]
+        line_w = sum(w for _, _, w in line)
+        if alignment == PP_ALIGN.CENTER:
+            left = x + (width - line_w) / 2
+        elif alignment == PP_ALIGN.RIGHT:
+            left = x + width - INSET_X - line_w
+        else:
+            left = x + INSET_X
+        for piece, (name, piece_size, color), w in line:
+            c.setFont(name, piece_size)
+            c.setFillColorRGB(*color)
+            c.drawString(left, baseline, piece)
+            left += w
+
+
+def presentation_pdf(prs):
+    """PDF bytes for a python-pptx Presentation."""
+    page_w = prs.slide_width / EMU_PER_PT
+    page_h = prs.slide_height / EMU_PER_PT
+    buf = io.BytesIO()
+    # invariant=1 pins the creation date and document id, so identical
+    # decks give identical PDFs (and write_if_changed can skip them)
+    c = canvas.Canvas(buf, pagesize=(page_w, page_h), invariant=1,
+                      pageCompression=1)
+    for slide in prs.slides:
+        bg = slide.background.fill
+        if _solid(bg):
+            c.setFillColorRGB(*_rgb(bg.fore_color))
+            c.rect(0, 0, page_w, page_h, stroke=0, fill=1)
+        for shape in slide.shapes:
+            draw_shape(c, shape, page_h)
+        c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def save_pdf(prs, path):
+    return write_if_changed(path, presentation_pdf(prs))
+
+
+def export_file(job):
+    """Worker: convert one PPTX file; returns (pdf path, written)."""
+    pptx_path, pdf_path = job
+    return pdf_path, save_pdf(Presentation(pptx_path), pdf_path)
+
+
+def export_files(paths, out_dir, jobs=None):
+    os.makedirs(out_dir, exist_ok=True)
+    job_list = [(p, os.path.join(out_dir, os.path.splitext(
+        os.path.basename(p))[0] + ".pdf")) for p in paths]
+    if len(job_list) == 1 or jobs == 1:
+        return [export_file(j) for j in job_list]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(export_file, job_list))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("decks", nargs="+", help="PPTX files to convert")
+    parser.add_argument("-o", "--out-dir", default=".")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    args = parser.parse_args(argv)
+    for path, written in export_files(args.decks, args.out_dir, args.jobs):
+        print(f"{'Saved' if written else 'Unchanged'} {path}",
+              file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
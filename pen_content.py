@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Extract slide copy from a .pen deck into a content map keyed by node id.
+
+The map holds every text node's content, every icon_font's icon name and
+the slide order (frames sorted left to right, as laid out in the design
+tool). generate_pptx looks its copy up here, so an edit made in
+pitch-deck.pen flows into the PPTX without touching the script. Text comes
+back as NodeText, a str that remembers its node id; generate_pptx names
+the text box after it so localize.py can key translations by node.
+
+Maps are cached under .cache/content by file hash; an unchanged deck
+skips extraction entirely.
+
+    python pen_content.py pitch-deck.pen
+"""
+
+import json
+import os
+import sys
+
+import tracing
+from buildcache import cache_path
+from pen_journal import current_hash, load_current
+
+DEFAULT_PEN = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "pitch-deck.pen")
+# Bump when the map layout changes so stale cache entries are ignored
+MAP_VERSION = 1
+
+
+class NodeText(str):
+    """Copy looked up in a ContentMap, tagged with the id of its node."""
+
+    def __new__(cls, text, node_id):
+        self = super().__new__(cls, text)
+        self.node_id = node_id
+        return self
+
+
+class ContentMap:
+    def __init__(self, nodes=None, slides=()):
+        self.nodes = nodes or {}
+        self.slides = list(slides)
+
+    def text(self, node_id, default):
+        return NodeText(self.nodes.get(node_id, {}).get("text", default),
+                        node_id)
+
+    def icon(self, node_id, default=None):
+        return self.nodes.get(node_id, {}).get("icon", default)
+
+    def slide_order(self):
+        return [s["id"] for s in self.slides]
+
+
+EMPTY = ContentMap()
+
+
+def extract(doc):
+    nodes = {}
+    stack = list(doc.get("children", ()))
+    while stack:
+        node = stack.pop()
+        if node.get("type") == "text":
+            nodes[node["id"]] = {"text": node.get("content", "")}
+        elif node.get("type") == "icon_font":
+            nodes[node["id"]] = {"icon": node.get("iconFontName")}
+        stack.extend(node.get("children", ()))
+    frames = sorted((n for n in doc.get("children", ())
+                     if n.get("type") == "frame"),
+                    key=lambda n: (n.get("y", 0), n.get("x", 0)))
+    slides = [{"id": f["id"], "name": f.get("name", "")} for f in frames]
+    return {"version": MAP_VERSION, "slides": slides, "nodes": nodes}
+
+
+def load_content(pen_path=DEFAULT_PEN):
+    """Return the ContentMap for ``pen_path``, or EMPTY if it is missing."""
+    if not pen_path or not os.path.exists(pen_path):
+        return EMPTY
+    cached = cache_path("content", f"{current_hash(pen_path)}.json")
+    data = None
+    if os.path.exists(cached):
+        with open(cached, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != MAP_VERSION:
+            data = None
+    if data is None:
+        with tracing.span("extract_content", path=pen_path) as sp:
+            data = extract(load_current(pen_path))
+            tmp = cached + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, cached)
+            sp.set(nodes=len(data["nodes"]))
+    return ContentMap(data["nodes"], data["slides"])
+
+
+def main(argv):
+    content = load_content(argv[0] if argv else DEFAULT_PEN)
+    for slide in content.slides:
+        print(f"{slide['id']:<20} {slide['name']}")
+    texts = sum("text" in n for n in content.nodes.values())
+    print(f"{texts} text nodes, {len(content.nodes) - texts} icons")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""Export a .pen page (e.g. website.pen) to static HTML/CSS, one file pair
+per top-level section.
+
+Image URLs are resolved through the design's asset manifest (assets.py)
+and written relative to the section stylesheets. Each section's subtree
+is hashed together with the page layout and those image URLs, which its
+CSS depends on; only sections whose hash differs from the
+previous export's manifest are re-rendered, and those are rendered in
+parallel worker processes.
+
+    python pen_html.py website.pen -o build/site-preview
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from assets import AssetManifest, image_refs
+from pen_journal import load_current
+
+# Bump when rendering changes so every section is re-exported
+RENDERER_VERSION = 2
+MANIFEST = "manifest.json"
+
+ALIGN = {"start": "flex-start", "center": "center", "end": "flex-end"}
+JUSTIFY = {"start": "flex-start", "center": "center", "end": "flex-end",
+           "space_between": "space-between",
+           "space_around": "space-around"}
+
+
+def subtree_hash(node, context=None):
+    """Hash of a section plus the context its CSS depends on (the parent
+    shell's layout, the image URLs)."""
+    blob = json.dumps([node, context], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(
+        f"{RENDERER_VERSION}:{blob}".encode("utf-8")).hexdigest()
+
+
+def slugify(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "section"
+
+
+def css_color(value):
+    if isinstance(value, str) and value.startswith("$"):
+        return f"var(--{value[1:]})"
+    return value
+
+
+def px(value):
+    return f"{value:g}px" if isinstance(value, (int, float)) else value
+
+
+def css_box(value):
+    if isinstance(value, list):
+        return " ".join(px(v) for v in value)
+    return px(value)
+
+
+def css_paint(fill, assets):
+    """Return a CSS background layer (or None) for one .pen fill entry."""
+    if isinstance(fill, str):
+        color = css_color(fill)
+        return f"linear-gradient({color}, {color})"
+    if not fill.get("enabled", True):
+        return None
+    kind = fill.get("type")
+    if kind == "color":
+        color = css_color(fill.get("color"))
+        return f"linear-gradient({color}, {color})"
+    if kind == "image":
+        url = assets.get(fill["url"], fill["url"])
+        return f'url("{url}") center / cover no-repeat'
+    if kind == "gradient":
+        stops = ", ".join(
+            f"{css_color(c['color'])} {c.get('position', 0) * 100:g}%"
+            for c in fill.get("colors", ())
+        )
+        if fill.get("gradientType") == "radial":
+            size = fill.get("size", {})
+            center = fill.get("center", {})
+            return (
+                f"radial-gradient({size.get('width', 1) * 50:g}% "
+                f"{size.get('height', 1) * 50:g}% at "
+                f"{center.get('x', 0.5) * 100:g}% "
+                f"{center.get('y', 0.5) * 100:g}%, {stops})"
+            )
+        angle = 90 + fill.get("rotation", 0)
+        return f"linear-gradient({angle:g}deg, {stops})"
+    return None
+
+
+def node_css(node, parent, assets):
+    kind = node["type"]
+    rules = []
+    parent_layout = parent.get("layout", "horizontal") if parent else "vertical"
+
+    if parent_layout == "none" and ("x" in node or "y" in node):
+        rules += ["position: absolute",
+                  f"left: {px(node.get('x', 0))}",
+                  f"top: {px(node.get('y', 0))}"]
+
+    fixed = False
+    for dim, axis in (("width", "horizontal"), ("height", "vertical")):
+        value = node.get(dim)
+        if value == "fill_container":
+            if parent_layout == axis:
+                rules += ["flex: 1 1 0", f"min-{dim}: 0"]
+            else:
+                rules.append("align-self: stretch")
+        elif isinstance(value, (int, float)) and kind != "line":
+            rules.append(f"{dim}: {px(value)}")
+            fixed = True
+    if fixed or (kind == "text" and node.get("textGrowth") != "fixed-width"):
+        rules.append("flex-shrink: 0")
+
+    if kind == "frame":
+        layout = node.get("layout", "horizontal")
+        if layout == "none":
+            rules.append("position: relative")
+        else:
+            rules.append("display: flex")
+            if layout == "vertical":
+                rules.append("flex-direction: column")
+            rules.append(
+                f"align-items: {ALIGN.get(node.get('alignItems'), 'flex-start')}")
+            if "justifyContent" in node:
+                rules.append(
+                    "justify-content: "
+                    f"{JUSTIFY.get(node['justifyContent'], 'flex-start')}")
+            if "gap" in node:
+                rules.append(f"gap: {px(node['gap'])}")
+        if "padding" in node:
+            rules.append(f"padding: {css_box(node['padding'])}")
+        if node.get("clip"):
+            rules.append("overflow: hidden")
+
+    fill = node.get("fill")
+    if kind in ("text", "icon_font"):
+        if isinstance(fill, str):
+            rules.append(f"color: {css_color(fill)}")
+    elif fill is not None:
+        fills = fill if isinstance(fill, list) else [fill]
+        # .pen paints bottom-up, CSS lists the top layer first
+        layers = [css_paint(f, assets) for f in reversed(fills)]
+        layers = [layer for layer in layers if layer]
+        if layers:
+            rules.append(f"background: {', '.join(layers)}")
+
+    if kind == "ellipse":
+        rules.append("border-radius: 50%")
+    elif "cornerRadius" in node:
+        rules.append(f"border-radius: {css_box(node['cornerRadius'])}")
+
+    stroke = node.get("stroke")
+    if isinstance(stroke, dict):
+        border = (f"{px(stroke.get('thickness', 1))} solid "
+                  f"{css_color(stroke.get('fill', 'currentColor'))}")
+        if kind == "line":
+            w, h = node.get("width", 0), node.get("height", 0)
+            rules += [f"width: {px(abs(w))}", f"height: {px(abs(h))}",
+                      f"border-{'left' if w == 0 else 'top'}: {border}"]
+            if w < 0:
+                rules.append(f"margin-left: {px(w)}")
+        else:
+            rules.append(f"border: {border}")
+            rules.append("box-sizing: border-box")
+
+    if kind == "text":
+        rules.append(f"font-family: '{node.get('fontFamily', 'Inter')}', "
+                     "sans-serif")
+        if "fontSize" in node:
+            rules.append(f"font-size: {px(node['fontSize'])}")
+        if "fontWeight" in node:
+            rules.append(f"font-weight: {node['fontWeight']}")
+        if "letterSpacing" in node:
+            rules.append(f"letter-spacing: {px(node['letterSpacing'])}")
+        if "lineHeight" in node:
+            rules.append(f"line-height: {node['lineHeight']:g}")
+        if "textAlign" in node:
+            rules.append(f"text-align: {node['textAlign']}")
+        rules.append("white-space: pre-wrap")
+    elif kind == "icon_font":
+        size = node.get("width", 24)
+        rules += [f"font-size: {px(size)}", "display: inline-flex"]
+
+    return rules
+
+
+def render_node(node, parent, assets, out_html, out_css, depth):
+    cls = f"n-{node['id']}"
+    rules = node_css(node, parent, assets)
+    if rules:
+        out_css.append(f".{cls} {{ {'; '.join(rules)}; }}")
+    pad = "  " * depth
+    kind = node["type"]
+    name = html.escape(node.get("name", ""), quote=True)
+    if kind == "text":
+        out_html.append(f'{pad}<div class="{cls}" data-name="{name}">'
+                        f'{html.escape(node.get("content", ""))}</div>')
+    elif kind == "icon_font":
+        icon = html.escape(node.get("iconFontName", ""), quote=True)
+        out_html.append(f'{pad}<i class="{cls}" data-lucide="{icon}" '
+                        f'data-name="{name}"></i>')
+    else:
+        out_html.append(f'{pad}<div class="{cls}" data-name="{name}">')
+        for child in node.get("children", ()):
+            render_node(child, node, assets, out_html, out_css,
+                        depth + 1)
+        out_html.append(f"{pad}</div>")
+
+
+def render_section(job):
+    """Worker entry point: render one section subtree to (html, css)."""
+    section, parent, assets = job
+    out_html, out_css = [], []
+    render_node(section, parent, assets, out_html, out_css, 0)
+    return "\n".join(out_html) + "\n", "\n".join(out_css) + "\n"
+
+
+def theme_css(variables):
+    lines = [":root {"]
+    for name, var in sorted(variables.items()):
+        value = var.get("value") if isinstance(var, dict) else var
+        lines.append(f"  --{name}: {value};")
+    lines.append("}")
+    lines.append("body { margin: 0; background: var(--bg-dark, #09090B); }")
+    lines.append("* { box-sizing: border-box; }")
+    return "\n".join(lines) + "\n"
+
+
+def index_html(page, sections, out_dir):
+    links = ['<link rel="stylesheet" href="theme.css">']
+    links += [f'<link rel="stylesheet" href="sections/{slug}.css">'
+              for _, slug in sections]
+    links.append(f'<link rel="stylesheet" href="sections/{page["slug"]}.css">')
+    body = []
+    for _, slug in sections:
+        with open(os.path.join(out_dir, "sections", f"{slug}.html"),
+                  encoding="utf-8") as f:
+            body.append(f.read())
+    title = html.escape(page["name"])
+    return (
+        "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{title}</title>\n" + "\n".join(links) + "\n"
+        "<script src=\"https://unpkg.com/lucide@latest\"></script>\n"
+        f"</head>\n<body>\n<div class=\"{page['cls']}\">\n"
+        + "".join(body)
+        + "</div>\n<script>lucide.createIcons();</script>\n</body>\n</html>\n"
+    )
+
+
+def asset_urls(pen_path, doc, section_dir):
+    """Map each image URL in ``doc`` to its URL from ``section_dir``.
+
+    Local images are resolved through the design's asset manifest, which
+    is rebuilt in memory when the design references images it lacks;
+    missing or stale files are reported on stderr. Remote URLs are kept.
+    """
+    manifest = AssetManifest.load(pen_path)
+    if set(image_refs(doc)) - set(manifest.entries):
+        manifest = AssetManifest.build(pen_path, doc)
+    for url, problem in manifest.check():
+        print(f"warning: {problem} asset {url}", file=sys.stderr)
+    base = os.path.abspath(section_dir)
+    urls = {}
+    for url in manifest.entries:
+        local = manifest.resolve(url)
+        if local is not None:
+            urls[url] = os.path.relpath(local, base).replace(os.sep, "/")
+    return urls
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def export(pen_path, out_dir, jobs=None, force=False):
+    """Export the first page of ``pen_path``; returns the list of re-rendered
+    section slugs."""
+    doc = load_current(pen_path)
+    page = doc["children"][0]
+    section_dir = os.path.join(out_dir, "sections")
+    os.makedirs(section_dir, exist_ok=True)
+    # Image URLs are resolved from the stylesheets in sections/
+    assets = asset_urls(pen_path, doc, section_dir)
+
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    # Read even with force: the old slugs say which files to clean up
+    previous = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            previous = json.load(f).get("sections", {})
+
+    # Page shell: the root frame without its children
+    shell = {k: v for k, v in page.items() if k != "children"}
+    page_slug = "page-" + slugify(page.get("name", page["id"]))
+    page_rules = node_css(shell, None, assets)
+    page_rules.append("margin: 0 auto")
+    _write(os.path.join(section_dir, f"{page_slug}.css"),
+           f".n-{page['id']} {{ {'; '.join(page_rules)}; }}\n")
+
+    # node_css() reads the parent's layout and maps image URLs
+    context = {"parent_layout": shell.get("layout", "horizontal"),
+               "assets": assets}
+    sections, todo, current = [], [], {}
+    used = set()
+    for section in page.get("children", ()):
+        slug = slugify(section.get("name", section["id"]))
+        if slug in used:
+            slug = f"{slug}-{section['id'].lower()}"
+        used.add(slug)
+        digest = subtree_hash(section, context)
+        current[section["id"]] = {"slug": slug, "hash": digest}
+        sections.append((section["id"], slug))
+        prev = previous.get(section["id"])
+        if (force or prev != current[section["id"]] or not os.path.exists(
+                os.path.join(section_dir, f"{slug}.html"))):
+            todo.append((slug, (section, shell, assets)))
+
+    if len(todo) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(render_section, [j for _, j in todo]))
+    else:
+        results = [render_section(j) for _, j in todo]
+
+    for (slug, _), (body, css) in zip(todo, results):
+        _write(os.path.join(section_dir, f"{slug}.html"), body)
+        _write(os.path.join(section_dir, f"{slug}.css"), css)
+
+    # Drop files of sections that no longer exist or were renamed
+    live = {entry["slug"] for entry in current.values()}
+    for entry in previous.values():
+        if entry["slug"] not in live:
+            for ext in ("html", "css"):
+                stale = os.path.join(section_dir, f"{entry['slug']}.{ext}")
+                if os.path.exists(stale):
+                    os.remove(stale)
+
+    _write(os.path.join(out_dir, "theme.css"),
+           theme_css(doc.get("variables", {})))
+    page_info = {"name": page.get("name", ""), "slug": page_slug,
+                 "cls": f"n-{page['id']}"}
+    _write(os.path.join(out_dir, "index.html"),
+           index_html(page_info, sections, out_dir))
+    _write(manifest_path, json.dumps(
+        {"renderer": RENDERER_VERSION, "sections": current}, indent=2))
+    return [slug for slug, _ in todo]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pen", nargs="?", default="website.pen")
+    parser.add_argument("-o", "--out", default=os.path.join("build",
+                                                            "site-preview"))
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="re-render every section")
+    args = parser.parse_args(argv)
+    changed = export(args.pen, args.out, jobs=args.jobs, force=args.force)
+    if changed:
+        print(f"Exported {len(changed)} section(s): {', '.join(changed)}")
+    else:
+        print("All sections up to date")
+    print(f"Preview: {os.path.join(args.out, 'index.html')}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""Append-only operation journal for .pen documents.
+
+Edits are recorded as small JSON operations in ``<file>.pen.journal`` next
+to the document instead of rewriting the whole file:
+
+    {"op": "set", "id": "ADtqg", "field": "content", "value": "BlockTrace"}
+    {"op": "unset", "id": "ADtqg", "field": "fill"}
+    {"op": "insert", "parent": null, "index": 5, "node": {...}}
+    {"op": "move", "id": "KCXuG", "parent": null, "index": 6}
+    {"op": "remove", "id": "aydNg"}
+    {"op": "order", "parent": null, "ids": ["yzi3r", "KCXuG", ...]}
+
+The .pen file itself is the snapshot; load_current() returns the snapshot
+with its journal replayed and current_hash() a hash covering both, which
+is what readers and their caches must use. The journal's first line
+records the snapshot's content hash; loading replays the journal on top of
+a matching snapshot, and compaction folds the journal into a new snapshot
+once it grows past COMPACT_OPS operations or half the snapshot's size.
+
+Compaction writes the new snapshot to ``<file>.pen.tmp``, appends a
+``{"op": "compact", "snapshot": <its hash>}`` marker to the journal, renames
+the snapshot into place and then resets the journal. A crash at any point
+is repaired on the next load: with the marker present the compaction is
+rolled forward (or, if the new snapshot never landed, the marker dropped).
+A journal whose snapshot was replaced by something else - a design tool
+saving the file - raises StaleJournalError; load with on_stale="rebase"
+to replay the ops that still apply onto the new snapshot, or "discard" to
+set the journal aside as ``<file>.pen.journal.stale``.
+
+Sessions in different processes may edit the same file. Loading, saving
+and compacting hold an advisory lock (``<file>.pen.lock``), and a session
+remembers the version (snapshot hash and journal length) it loaded. If
+the file moved on before save(), the session either raises ConflictError
+(on_conflict="refuse") or rebases: it reloads the newer state and replays
+its pending ops on top. Ops address nodes by id, so independent edits
+merge; a field both sessions set ends with the later save's value, and an
+op whose node was removed makes the rebase fail with ConflictError.
+Snapshots and journal resets are written to a temp file and renamed.
+
+    session = PenSession("pitch-deck.pen")
+    session.set("ADtqg", "content", "BlockTrace")
+    session.save()          # appends one line
+    session.undo()          # appends the inverse op
+
+    python pen_journal.py status pitch-deck.pen
+    python pen_journal.py compact pitch-deck.pen
+    python pen_journal.py rebase pitch-deck.pen     # after a stale error
+    python pen_journal.py discard pitch-deck.pen
+"""
+
+import contextlib
+import copy
+import fcntl
+import json
+import os
+import random
+import string
+import sys
+
+import penfile
+import tracing
+from buildcache import bytes_hash, file_hash
+
+JOURNAL_VERSION = 1
+COMPACT_OPS = 500
+JOURNAL_SUFFIX = ".journal"
+LOCK_SUFFIX = ".lock"
+
+
+class ConflictError(ValueError):
+    """The .pen changed on disk and this session's edits cannot apply."""
+
+
+class StaleJournalError(ValueError):
+    """The journal was written against a different snapshot."""
+
+
+def journal_path(pen_path):
+    return pen_path + JOURNAL_SUFFIX
+
+
+def current_hash(pen_path):
+    """Hash of the snapshot plus its journal, for keying derived caches."""
+    journal = journal_path(pen_path)
+    if not os.path.exists(journal):
+        return file_hash(pen_path)
+    return bytes_hash(f"{file_hash(pen_path)}:{file_hash(journal)}"
+                      .encode("utf-8"))
+
+
+def load_current(pen_path):
+    """The document as edited: the snapshot with its journal replayed.
+
+    Every reader of a .pen should load through here; penfile.load alone
+    misses journaled edits.
+    """
+    if not os.path.exists(journal_path(pen_path)):
+        return penfile.load(pen_path)
+    return PenSession(pen_path).doc
+
+
+@contextlib.contextmanager
+def locked(pen_path):
+    """Hold the exclusive advisory lock for ``pen_path`` across processes."""
+    with open(pen_path + LOCK_SUFFIX, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _dump(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def read_journal(path):
+    """Return (header, ops); a torn final line from a crash is dropped."""
+    if not os.path.exists(path):
+        return None, []
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().split("\n")
+    records = []
+    for n, line in enumerate(lines):
+        if not line:
+            continue
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            if n < len(lines) - 1 and any(lines[n + 1:]):
+                raise ValueError(f"{path}:{n + 1}: corrupt journal entry")
+    if not records:
+        return None, []
+    return records[0], records[1:]
+
+
+def reassign_ids(node, taken, rng=None):
+    """Give ``node``'s descendants fresh ids not in ``taken`` (for copies)."""
+    rng = rng or random.Random()
+    alphabet = string.ascii_letters + string.digits
+    stack = list(node.get("children", ()))
+    while stack:
+        child = stack.pop()
+        while child["id"] in taken:
+            child["id"] = "".join(rng.choice(alphabet) for _ in range(5))
+        taken.add(child["id"])
+        stack.extend(child.get("children", ()))
+    return node
+
+
+def _drop_torn_tail(path):
+    """Cut a half-written last line so the next append starts cleanly."""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+class PenSession:
+    """A .pen document plus the journal of edits made since its snapshot."""
+
+    def __init__(self, pen_path, compact_ops=COMPACT_OPS,
+                 on_conflict="rebase", on_stale="raise"):
+        if on_conflict not in ("rebase", "refuse"):
+            raise ValueError(f"on_conflict must be 'rebase' or 'refuse', "
+                             f"not {on_conflict!r}")
+        if on_stale not in ("raise", "rebase", "discard"):
+            raise ValueError(f"on_stale must be 'raise', 'rebase' or "
+                             f"'discard', not {on_stale!r}")
+        self.path = pen_path
+        self.journal = journal_path(pen_path)
+        self.compact_ops = compact_ops
+        self.on_conflict = on_conflict
+        self.on_stale = on_stale
+        self.skipped = []
+        self.pending = []
+        self.undo_stack = []
+        with locked(pen_path):
+            self._load()
+
+    def _load(self):
+        """Read snapshot and journal; the caller holds the lock."""
+        with tracing.span("pen_load", path=self.path) as sp:
+            self.doc = penfile.load(self.path)
+            self.snapshot = file_hash(self.path)
+            self._reindex()
+            sp.set(bytes=os.path.getsize(self.path), nodes=len(self.nodes))
+
+        with tracing.span("journal_replay", path=self.journal) as sp:
+            _drop_torn_tail(self.journal)
+            header, ops = read_journal(self.journal)
+            if ops and ops[-1].get("op") == "compact":
+                self._finish_compact(ops[-1]["snapshot"])
+                return self._load()
+            if header is not None and header.get("snapshot") != self.snapshot:
+                ops = self._stale(ops)
+            self.journal_ops = len(ops)
+            for op in ops:
+                self.apply(op)
+            sp.set(ops=len(ops))
+        self.version = self._disk_version()
+
+    def _finish_compact(self, target):
+        """Repair a compaction interrupted after its marker was written."""
+        tmp = self.path + ".tmp"
+        if os.path.exists(tmp) and file_hash(tmp) == target:
+            os.replace(tmp, self.path)
+        if file_hash(self.path) == target:
+            self._reset_journal(target)
+            return
+        # The new snapshot never landed: the journal before the marker
+        # still describes the document
+        with open(self.journal, "rb") as f:
+            data = f.read()
+        self._write_journal(data[:data.rstrip(b"\n").rfind(b"\n") + 1])
+
+    def _stale(self, ops):
+        """Handle a journal written against another snapshot; returns the
+        ops to replay."""
+        if self.on_stale == "raise":
+            raise StaleJournalError(
+                f"{self.journal} was written against a different snapshot of "
+                f"{self.path}; run 'pen_journal.py rebase' or 'discard'")
+        if self.on_stale == "discard":
+            os.replace(self.journal, self.journal + ".stale")
+            self._reset_journal(self.snapshot)
+            self.skipped = ops
+            return []
+        applied = []
+        for op in ops:
+            try:
+                self.apply(op)
+            except (KeyError, ValueError):
+                self.skipped.append(op)
+            else:
+                applied.append(op)
+        # Reload clean and rewrite the journal against this snapshot
+        self.doc = penfile.load(self.path)
+        self._reindex()
+        header = {"journal": JOURNAL_VERSION, "snapshot": self.snapshot}
+        self._write_journal("".join(_dump(record) + "\n"
+                                    for record in [header] + applied)
+                            .encode("utf-8"))
+        return applied
+
+    def _write_journal(self, data):
+        tmp = self.journal + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.journal)
+
+    def _reset_journal(self, snapshot):
+        self._write_journal((_dump({"journal": JOURNAL_VERSION,
+                                    "snapshot": snapshot}) + "\n")
+                            .encode("utf-8"))
+
+    def _disk_version(self):
+        size = (os.path.getsize(self.journal)
+                if os.path.exists(self.journal) else 0)
+        return f"{file_hash(self.path)}:{size}"
+
+    def _check_version(self):
+        """Rebase onto (or refuse) changes saved since this session loaded.
+
+        The caller holds the lock. Undo history does not survive a rebase.
+        """
+        if self._disk_version() == self.version:
+            return
+        if self.on_conflict == "refuse":
+            raise ConflictError(f"{self.path} changed since it was loaded")
+        pending = self.pending
+        self._load()
+        try:
+            for op in pending:
+                self.apply(op)
+        except (KeyError, ValueError) as exc:
+            self._load()
+            raise ConflictError(f"cannot rebase onto {self.path}: "
+                                f"{exc}") from exc
+        self.undo_stack = []
+
+    # ── Index ──────────────────────────────────────────────────────────
+    def _reindex(self):
+        self.nodes, self.parents = {}, {}
+        self._index_children(None, self.doc.get("children", ()))
+
+    def _index_children(self, parent_id, children):
+        for child in children:
+            self.nodes[child["id"]] = child
+            self.parents[child["id"]] = parent_id
+            self._index_children(child["id"], child.get("children", ()))
+
+    def _unindex(self, node):
+        self.nodes.pop(node["id"], None)
+        self.parents.pop(node["id"], None)
+        for child in node.get("children", ()):
+            self._unindex(child)
+
+    def node(self, node_id):
+        try:
+            return self.nodes[node_id]
+        except KeyError:
+            raise KeyError(f"unknown node id {node_id!r}") from None
+
+    def children_of(self, parent_id):
+        if parent_id is None:
+            return self.doc.setdefault("children", [])
+        return self.node(parent_id).setdefault("children", [])
+
+    # ── Operations ─────────────────────────────────────────────────────
+    def apply(self, op):
+        """Apply one operation to the document and return its inverse."""
+        kind = op["op"]
+        if kind in ("set", "unset"):
+            node = self.node(op["id"])
+            field = op["field"]
+            if field in ("id", "children"):
+                raise ValueError(f"cannot {kind} {field!r}; use insert/move")
+            inverse = ({"op": "set", "id": op["id"], "field": field,
+                        "value": copy.deepcopy(node[field])}
+                       if field in node else
+                       {"op": "unset", "id": op["id"], "field": field})
+            if kind == "set":
+                node[field] = copy.deepcopy(op["value"])
+            else:
+                node.pop(field, None)
+            return inverse
+        if kind == "insert":
+            node = copy.deepcopy(op["node"])
+            if node["id"] in self.nodes:
+                raise ValueError(f"duplicate node id {node['id']!r}")
+            siblings = self.children_of(op.get("parent"))
+            siblings.insert(op.get("index", len(siblings)), node)
+            self._index_children(op.get("parent"), [node])
+            return {"op": "remove", "id": node["id"]}
+        if kind == "remove":
+            node = self.node(op["id"])
+            parent_id = self.parents[op["id"]]
+            siblings = self.children_of(parent_id)
+            index = siblings.index(node)
+            del siblings[index]
+            self._unindex(node)
+            return {"op": "insert", "parent": parent_id, "index": index,
+                    "node": node}
+        if kind == "move":
+            node = self.node(op["id"])
+            parent_id = op.get("parent")
+            if parent_id == op["id"] or parent_id in self._descendants(node):
+                raise ValueError(f"cannot move {op['id']!r} into itself")
+            old_parent = self.parents[op["id"]]
+            old_siblings = self.children_of(old_parent)
+            old_index = old_siblings.index(node)
+            del old_siblings[old_index]
+            siblings = self.children_of(parent_id)
+            siblings.insert(op.get("index", len(siblings)), node)
+            self.parents[op["id"]] = parent_id
+            return {"op": "move", "id": op["id"], "parent": old_parent,
+                    "index": old_index}
+        if kind == "order":
+            siblings = self.children_of(op.get("parent"))
+            by_id = {child["id"]: child for child in siblings}
+            if sorted(by_id) != sorted(op["ids"]):
+                raise ValueError("order must list every child id exactly once")
+            inverse = {"op": "order", "parent": op.get("parent"),
+                       "ids": [child["id"] for child in siblings]}
+            siblings[:] = [by_id[node_id] for node_id in op["ids"]]
+            return inverse
+        raise ValueError(f"unknown journal op {kind!r}")
+
+    def _descendants(self, node):
+        out = set()
+        stack = list(node.get("children", ()))
+        while stack:
+            child = stack.pop()
+            out.add(child["id"])
+            stack.extend(child.get("children", ()))
+        return out
+
+    def record(self, op):
+        self.undo_stack.append(self.apply(op))
+        self.pending.append(op)
+
+    def set(self, node_id, field, value):
+        self.record({"op": "set", "id": node_id, "field": field,
+                     "value": value})
+
+    def unset(self, node_id, field):
+        self.record({"op": "unset", "id": node_id, "field": field})
+
+    def insert(self, parent_id, index, node):
+        self.record({"op": "insert", "parent": parent_id, "index": index,
+                     "node": node})
+
+    def move(self, node_id, parent_id, index):
+        self.record({"op": "move", "id": node_id, "parent": parent_id,
+                     "index": index})
+
+    def remove(self, node_id):
+        self.record({"op": "remove", "id": node_id})
+
+    def order(self, parent_id, ids):
+        self.record({"op": "order", "parent": parent_id, "ids": list(ids)})
+
+    def undo(self):
+        """Revert this session's latest operation by recording its inverse."""
+        if not self.undo_stack:
+            raise IndexError("nothing to undo")
+        inverse = self.undo_stack.pop()
+        self.apply(inverse)
+        self.pending.append(inverse)
+
+    # ── Persistence ────────────────────────────────────────────────────
+    def save(self):
+        """Append pending ops to the journal, compacting when it is large.
+
+        Returns the number of bytes written.
+        """
+        if not self.pending:
+            return 0
+        with locked(self.path):
+            self._check_version()
+            if self.journal_ops + len(self.pending) > self.compact_ops or (
+                    os.path.exists(self.journal)
+                    and os.path.getsize(self.journal)
+                    > os.path.getsize(self.path) // 2):
+                return self._compact()
+            lines = []
+            if self.journal_ops == 0 and not os.path.exists(self.journal):
+                lines.append(_dump({"journal": JOURNAL_VERSION,
+                                    "snapshot": self.snapshot}))
+            lines.extend(_dump(op) for op in self.pending)
+            data = ("\n".join(lines) + "\n").encode("utf-8")
+            with open(self.journal, "ab") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            self.journal_ops += len(self.pending)
+            self.pending = []
+            self.version = self._disk_version()
+            return len(data)
+
+    def compact(self):
+        """Write the current document as the new snapshot, emptying the
+        journal. Returns the number of bytes written."""
+        with locked(self.path):
+            self._check_version()
+            return self._compact()
+
+    def _compact(self):
+        tmp = self.path + ".tmp"
+        penfile.save(tmp, self.doc)
+        target = file_hash(tmp)
+        if not os.path.exists(self.journal):
+            self._reset_journal(self.snapshot)
+        # The marker lets a load after a crash finish (or undo) the swap
+        with open(self.journal, "ab") as f:
+            f.write((_dump({"op": "compact", "snapshot": target}) + "\n")
+                    .encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self.snapshot = target
+        self._reset_journal(target)
+        self.journal_ops = 0
+        self.pending = []
+        self.version = self._disk_version()
+        return os.path.getsize(self.path)
+
+
+def main(argv):
+    if len(argv) != 2 or argv[0] not in ("status", "compact", "rebase",
+                                         "discard"):
+        print(__doc__, file=sys.stderr)
+        sys.exit(2)
+    command, path = argv
+    on_stale = command if command in ("rebase", "discard") else "raise"
+    try:
+        session = PenSession(path, on_stale=on_stale)
+    except StaleJournalError as exc:
+        sys.exit(str(exc))
+    if on_stale != "raise":
+        print(f"{path}: journal {command} done, {session.journal_ops} ops "
+              f"kept, {len(session.skipped)} dropped")
+    elif command == "compact":
+        written = session.compact()
+        print(f"Compacted {path} ({written:,} bytes)")
+    else:
+        size = (os.path.getsize(session.journal)
+                if os.path.exists(session.journal) else 0)
+        print(f"{path}: {session.journal_ops} journaled ops, "
+              f"{size:,} journal bytes, {len(session.nodes):,} nodes")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
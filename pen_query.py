@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""CSS-like selector queries over .pen node trees.
+
+    frame[name^="07"] #col6a > frame      cards in one column of slide 07
+    > frame > text:last                   every slide's footer number
+    #h6 > text:nth(1)                     the title text of header h6
+    icon_font[iconFontName=bell]
+
+Supported: type names and ``*``; ``#key`` (a node id or layer name - the
+design tool shows either); attributes ``[field]``, ``[field=v]``,
+``[field^=v]``, ``[field$=v]``, ``[field*=v]``; ``:first``, ``:last`` and
+``:nth(i)`` (0-based position among the parent's children, the index a
+``['children'][i]`` chain would use); descendant and ``>`` combinators. A
+leading ``>`` anchors the first step to the direct children of the root
+being queried.
+
+Selectors are parsed and compiled once (cached by text). A PenIndex walks
+the tree once to index nodes by type and by id/name; a query starts from
+the index entries of its rightmost step and checks ancestors upwards, so
+several selectors over all slides share a single traversal:
+
+    index = PenIndex(doc)
+    found = index.select_many({"footers": "> frame > text:last",
+                               "icons": "icon_font"})
+
+    python pen_query.py pitch-deck.pen 'frame[name^="07"] text'
+"""
+
+import re
+import sys
+from functools import lru_cache
+
+from pen_journal import load_current
+
+_TOKEN = re.compile(r"""
+    (?P<child>\s*>\s*)
+  | (?P<space>\s+)
+  | (?P<type>\*|[A-Za-z_][\w-]*)
+  | \#(?P<key>[\w-]+)
+  | \[\s*(?P<field>[\w-]+)\s*(?:(?P<op>[\^$*]?=)\s*
+        (?P<value>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]
+  | :(?P<pseudo>[\w-]+)(?:\(\s*(?P<arg>-?\d+)\s*\))?
+""", re.VERBOSE)
+
+_ATTR_OPS = {
+    "=": lambda have, want: have == want,
+    "^=": lambda have, want: have.startswith(want),
+    "$=": lambda have, want: have.endswith(want),
+    "*=": lambda have, want: want in have,
+}
+
+
+class SelectorError(ValueError):
+    pass
+
+
+class Step:
+    """One compound selector (``frame#col6a[name^=c]:nth(0)``)."""
+
+    __slots__ = ("combinator", "type", "key", "tests")
+
+    def __init__(self, combinator):
+        self.combinator = combinator  # None, " " or ">" (to the step before)
+        self.type = None
+        self.key = None
+        self.tests = []  # (node, index) -> bool
+
+    def matches(self, node, index):
+        if self.type is not None and node.get("type") != self.type:
+            return False
+        if self.key is not None and self.key not in (node.get("id"),
+                                                     node.get("name")):
+            return False
+        return all(test(node, index) for test in self.tests)
+
+
+def _attr_test(field, op, value):
+    if op is None:
+        return lambda node, index: field in node
+    check = _ATTR_OPS[op]
+    if value[:1] in "\"'":
+        value = value[1:-1]
+
+    def test(node, index):
+        have = node.get(field)
+        return have is not None and check(str(have), value)
+    return test
+
+
+def _pseudo_test(name, arg, selector):
+    if name == "first":
+        return lambda node, index: index.position(node) == 0
+    if name == "last":
+        return lambda node, index: (index.position(node)
+                                    == index.siblings(node) - 1)
+    if name == "nth" and arg is not None:
+        want = int(arg)
+        return lambda node, index: index.position(node) == want
+    raise SelectorError(f"unknown pseudo-class :{name} in {selector!r}")
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector):
+    """Parse ``selector`` into a tuple of Steps, left to right."""
+    steps, step, pos = [], None, 0
+    text = selector.strip()
+    pending = None
+    while pos < len(text):
+        m = _TOKEN.match(text, pos)
+        if m is None:
+            raise SelectorError(f"bad selector {selector!r} at {pos}: "
+                                f"{text[pos:pos + 10]!r}")
+        pos = m.end()
+        if m["child"] is not None or m["space"] is not None:
+            if step is None and pending is not None:
+                raise SelectorError(f"doubled combinator in {selector!r}")
+            pending = ">" if m["child"] is not None else " "
+            if step is not None:
+                steps.append(step)
+                step = None
+            continue
+        if step is None:
+            step = Step(pending)
+            pending = None
+        if m["type"] is not None:
+            if step.type is not None or step.key or step.tests:
+                raise SelectorError(f"type must lead its step in {selector!r}")
+            step.type = None if m["type"] == "*" else m["type"]
+        elif m["key"] is not None:
+            step.key = m["key"]
+        elif m["field"] is not None:
+            step.tests.append(_attr_test(m["field"], m["op"], m["value"]))
+        else:
+            step.tests.append(_pseudo_test(m["pseudo"], m["arg"], selector))
+    if step is None:
+        raise SelectorError(f"selector {selector!r} ends in a combinator")
+    steps.append(step)
+    return tuple(steps)
+
+
+class PenIndex:
+    """One-pass index of a .pen document (or any subtree) for queries."""
+
+    def __init__(self, root):
+        self.root = root
+        self.by_type = {}
+        self.by_key = {}
+        self.nodes = []
+        self._parent = {}
+        self._position = {}
+        stack = [(root, None, 0)]
+        while stack:
+            node, parent, position = stack.pop()
+            if node is not root:
+                self.nodes.append(node)
+                self._parent[id(node)] = parent
+                self._position[id(node)] = position
+                self.by_type.setdefault(node.get("type"), []).append(node)
+                for key in {node.get("id"), node.get("name")} - {None}:
+                    self.by_key.setdefault(key, []).append(node)
+            children = node.get("children", ())
+            stack.extend((child, node, n)
+                         for n, child in reversed(list(enumerate(children))))
+
+    def parent(self, node):
+        return self._parent.get(id(node))
+
+    def position(self, node):
+        return self._position[id(node)]
+
+    def siblings(self, node):
+        return len(self.parent(node).get("children", ()))
+
+    def slide_of(self, node):
+        """The top-level frame containing ``node`` (itself if top-level)."""
+        while self.parent(node) is not self.root:
+            node = self.parent(node)
+        return node
+
+    def _candidates(self, step):
+        if step.key is not None:
+            return self.by_key.get(step.key, ())
+        if step.type is not None:
+            return self.by_type.get(step.type, ())
+        return self.nodes
+
+    def _match_up(self, node, steps, i):
+        """True if steps[:i + 1] match ending at ``node``."""
+        step = steps[i]
+        if not step.matches(node, self):
+            return False
+        parent = self.parent(node)
+        if i == 0:
+            return step.combinator != ">" or parent is self.root
+        if step.combinator == ">":
+            return (parent is not self.root
+                    and self._match_up(parent, steps, i - 1))
+        while parent is not self.root:
+            if self._match_up(parent, steps, i - 1):
+                return True
+            parent = self.parent(parent)
+        return False
+
+    def select(self, selector):
+        """All nodes matching ``selector``, in document order."""
+        steps = compile_selector(selector)
+        last = len(steps) - 1
+        return [node for node in self._candidates(steps[-1])
+                if self._match_up(node, steps, last)]
+
+    def select_one(self, selector):
+        """The single node matching ``selector``; raises if not exactly one."""
+        found = self.select(selector)
+        if len(found) != 1:
+            raise LookupError(f"{selector!r} matched {len(found)} nodes")
+        return found[0]
+
+    def select_many(self, selectors):
+        """Run a dict of ``{key: selector}`` against this one index."""
+        return {key: self.select(sel) for key, sel in selectors.items()}
+
+
+def select(root, selector):
+    return PenIndex(root).select(selector)
+
+
+def select_one(root, selector):
+    return PenIndex(root).select_one(selector)
+
+
+def main(argv):
+    if len(argv) < 2:
+        print(__doc__, file=sys.stderr)
+        sys.exit(2)
+    index = PenIndex(load_current(argv[0]))
+    for selector in argv[1:]:
+        for node in index.select(selector):
+            slide = index.slide_of(node).get("name", "")
+            detail = node.get("content") or node.get("iconFontName") or ""
+            print(f"{node['id']}\t{node.get('type')}\t{node.get('name', '')}"
+                  f"\t{slide}\t{str(detail)[:60]}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Load, save and compact .pen design documents.
+
+A compacted document interns repeated fill/stroke values and text style
+runs into a shared ``$styles`` table and references them by key. load()
+always expands, so callers only ever see the plain node tree.
+"""
+
+import copy
+import json
+import sys
+
+STYLE_TABLE = "$styles"
+STYLE_REF = "$style"
+FONT_REF = "$font"
+
+# Node keys whose (non-scalar) values are interned whole
+FILL_KEYS = ("fill", "stroke")
+# Text style keys interned as one contiguous run
+FONT_KEYS = ("fontFamily", "fontSize", "fontWeight", "letterSpacing",
+             "lineHeight")
+
+
+def _font_run(node):
+    """Return (start, keys) of the contiguous font-key run holding fontFamily."""
+    keys = list(node)
+    if "fontFamily" not in keys:
+        return None, ()
+    start = end = keys.index("fontFamily")
+    while start > 0 and keys[start - 1] in FONT_KEYS:
+        start -= 1
+    while end + 1 < len(keys) and keys[end + 1] in FONT_KEYS:
+        end += 1
+    return start, tuple(keys[start:end + 1])
+
+
+def _walk(nodes):
+    for node in nodes:
+        yield node
+        yield from _walk(node.get("children", ()))
+
+
+def compact_styles(doc, min_uses=2):
+    """Return a copy of ``doc`` with repeated styles moved into ``$styles``."""
+    if STYLE_TABLE in doc:
+        return doc
+
+    # Count candidates first so one-off styles stay inline
+    counts = {}
+    for node in _walk(doc.get("children", ())):
+        for key in FILL_KEYS:
+            value = node.get(key)
+            if isinstance(value, (dict, list)):
+                sig = json.dumps(value, ensure_ascii=False)
+                counts[sig] = counts.get(sig, 0) + 1
+        _, run = _font_run(node)
+        if run:
+            sig = json.dumps({k: node[k] for k in run}, ensure_ascii=False)
+            counts[sig] = counts.get(sig, 0) + 1
+
+    table = {}
+    keys = {}
+
+    def intern(prefix, sig, value):
+        if counts.get(sig, 0) < min_uses:
+            return None
+        if sig not in keys:
+            keys[sig] = f"{prefix}{sum(k[0] == prefix for k in table)}"
+            table[keys[sig]] = value
+        return keys[sig]
+
+    def compact_node(node):
+        start, run = _font_run(node)
+        font_key = None
+        if run:
+            group = {k: node[k] for k in run}
+            font_key = intern("t", json.dumps(group, ensure_ascii=False), group)
+
+        out = {}
+        for key, value in node.items():
+            if font_key and key in run:
+                if key == run[0]:
+                    out[FONT_REF] = font_key
+                continue
+            if key == "children":
+                out[key] = [compact_node(c) for c in value]
+            elif key in FILL_KEYS and isinstance(value, (dict, list)):
+                ref = intern("f", json.dumps(value, ensure_ascii=False), value)
+                out[key] = {STYLE_REF: ref} if ref else value
+            else:
+                out[key] = value
+        return out
+
+    children = [compact_node(c) for c in doc.get("children", ())]
+    out = {}
+    for key, value in doc.items():
+        out[key] = children if key == "children" else value
+    if table:
+        out[STYLE_TABLE] = table
+    return out
+
+
+def expand_styles(doc):
+    """Inverse of compact_styles(); documents without ``$styles`` pass through."""
+    table = doc.get(STYLE_TABLE)
+    if table is None:
+        return doc
+
+    def expand_node(node):
+        out = {}
+        for key, value in node.items():
+            if key == FONT_REF:
+                out.update(table[value])
+            elif key == "children":
+                out[key] = [expand_node(c) for c in value]
+            elif (key in FILL_KEYS and isinstance(value, dict)
+                    and STYLE_REF in value):
+                # Each node gets its own copy; sharing would alias edits
+                out[key] = copy.deepcopy(table[value[STYLE_REF]])
+            else:
+                out[key] = value
+        return out
+
+    return {
+        key: [expand_node(c) for c in value] if key == "children" else value
+        for key, value in doc.items() if key != STYLE_TABLE
+    }
+
+
+def loads(text):
+    return expand_styles(json.loads(text))
+
+
+def dumps(doc, compact=False):
+    if compact:
+        return json.dumps(compact_styles(doc), ensure_ascii=False,
+                          separators=(",", ":"))
+    # Same layout the design tool writes: 2-space indent, raw UTF-8
+    return json.dumps(doc, indent=2, ensure_ascii=False)
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return loads(f.read())
+
+
+def save(path, doc, compact=False):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(dumps(doc, compact=compact))
+
+
+def main(argv):
+    if len(argv) != 3 or argv[0] not in ("compact", "expand"):
+        print("usage: penfile.py compact|expand SRC DEST", file=sys.stderr)
+        return 2
+    mode, src, dest = argv
+    doc = load(src)
+    save(dest, doc, compact=(mode == "compact"))
+    with open(src, "rb") as a, open(dest, "rb") as b:
+        before, after = len(a.read()), len(b.read())
+    print(f"{src} ({before:,} bytes) -> {dest} ({after:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Read-only, lazily parsed view of a PPTX for QA checks.
+
+    python pptx_inspect.py BlockTrace_Pitch_Deck.pptx
+    python pptx_inspect.py big.pptx --slides 1,2 --text
+
+Opening a deck reads only the zip directory, ppt/presentation.xml and its
+relationships; python-pptx would parse every slide part up front. A slide
+part is parsed the first time one of its properties is read, in a single
+iterparse pass that keeps the shape count, the text of each shape and the
+title, and discards elements as it goes:
+
+    with DeckInspector("big.pptx") as deck:
+        print(len(deck), deck[0].title, deck[0].shape_count)
+
+The title is the text of a title placeholder; generated decks have none,
+so it falls back to the first shape with the largest font size.
+"""
+
+import argparse
+import posixpath
+import sys
+import zipfile
+
+from lxml import etree
+
+_NS = {
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "r": ("http://schemas.openxmlformats.org/officeDocument/2006/"
+          "relationships"),
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+_P, _A = "{%s}" % _NS["p"], "{%s}" % _NS["a"]
+_SHAPES = {_P + tag for tag in ("sp", "pic", "cxnSp", "graphicFrame",
+                                "grpSp")}
+_TITLE_TYPES = {"title", "ctrTitle"}
+PRESENTATION = "ppt/presentation.xml"
+
+
+def _rels_name(part):
+    folder, name = posixpath.split(part)
+    return posixpath.join(folder, "_rels", name + ".rels")
+
+
+class SlideInfo:
+    """One slide; its part is parsed on first property access."""
+
+    def __init__(self, deck, number, part):
+        self.deck = deck
+        self.number = number
+        self.part = part
+        self._parsed = None
+
+    def _parse(self):
+        if self._parsed is None:
+            self._parsed = _scan_slide(self.deck.zip.open(self.part))
+        return self._parsed
+
+    @property
+    def shape_count(self):
+        """Top-level shapes, as len(slide.shapes) counts them."""
+        return self._parse()[0]
+
+    @property
+    def texts(self):
+        """Text of each shape with any, paragraphs joined by newlines."""
+        return self._parse()[1]
+
+    @property
+    def title(self):
+        return self._parse()[2]
+
+
+def _scan_slide(stream):
+    """Return (top-level shape count, texts, title) for one slide part."""
+    count = depth = 0
+    texts, paragraphs, runs = [], [], []
+    title = title_size = None
+    placeholder_title = None
+    is_title = False
+    size = 0
+    for event, el in etree.iterparse(stream, events=("start", "end")):
+        tag = el.tag
+        if event == "start":
+            if tag in _SHAPES:
+                depth += 1
+                if depth == 1:
+                    count += 1
+                if tag == _P + "sp":
+                    paragraphs, is_title, size = [], False, 0
+            elif tag == _P + "ph":
+                is_title = el.get("type") in _TITLE_TYPES
+            elif tag in (_A + "rPr", _A + "endParaRPr", _A + "defRPr"):
+                size = max(size, int(el.get("sz", 0)))
+            continue
+        if tag == _A + "t":
+            runs.append(el.text or "")
+        elif tag == _A + "br":
+            runs.append("\v")
+        elif tag == _A + "p":
+            paragraphs.append("".join(runs))
+            runs = []
+        elif tag == _P + "sp":
+            text = "\n".join(paragraphs)
+            if text.strip():
+                texts.append(text)
+                if is_title and placeholder_title is None:
+                    placeholder_title = text
+                if title_size is None or size > title_size:
+                    title, title_size = text, size
+        if tag in _SHAPES:
+            depth -= 1
+            el.clear()
+    return count, texts, placeholder_title or title
+
+
+class DeckInspector:
+    def __init__(self, path):
+        self.path = path
+        self.zip = zipfile.ZipFile(path)
+        rels = etree.fromstring(self.zip.read(_rels_name(PRESENTATION)))
+        targets = {rel.get("Id"): rel.get("Target")
+                   for rel in rels.iterfind("rel:Relationship", _NS)}
+        pres = etree.fromstring(self.zip.read(PRESENTATION))
+        size = pres.find("p:sldSz", _NS)
+        self.slide_size = ((int(size.get("cx")), int(size.get("cy")))
+                           if size is not None else None)
+        base = posixpath.dirname(PRESENTATION)
+        self.slides = [
+            SlideInfo(self, number, posixpath.normpath(posixpath.join(
+                base, targets[sld.get("{%s}id" % _NS["r"])])))
+            for number, sld in enumerate(
+                pres.iterfind("p:sldIdLst/p:sldId", _NS), 1)]
+
+    def __len__(self):
+        return len(self.slides)
+
+    def __getitem__(self, index):
+        return self.slides[index]
+
+    def __iter__(self):
+        return iter(self.slides)
+
+    def close(self):
+        self.zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path")
+    parser.add_argument("--slides", help='slide numbers, e.g. "1,3"')
+    parser.add_argument("--text", action="store_true",
+                        help="print each slide's text too")
+    args = parser.parse_args(argv)
+    with DeckInspector(args.path) as deck:
+        numbers = (range(1, len(deck) + 1) if not args.slides else
+                   [int(n) for n in args.slides.split(",")])
+        print(f"{args.path}: {len(deck)} slides", file=sys.stderr)
+        for number in numbers:
+            slide = deck[number - 1]
+            title = (slide.title or "").split("\n")[0]
+            print(f"{number:02d}\t{slide.shape_count} shapes\t{title}")
+            if args.text:
+                for text in slide.texts:
+                    print("\t" + text.replace("\n", " / "))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Insert, drop and reorder slides in .pen designs and generated decks.
+
+    python reflow.py pitch-deck.pen --order 1-5,14,6-13
+    python reflow.py BlockTrace_Pitch_Deck.pptx --order 2,1,3-15 -o out.pptx
+    python reflow.py website-a.pen website-b.pen --order 2,1
+
+--order lists the current slide numbers in their new order (ranges
+allowed, "15-6" counts down); slides left out are dropped, but an order
+that keeps none is refused without --allow-empty. The same order is applied to every
+file given, so a design and the deck generated from it stay in step.
+
+Each file is rewritten in one pass over its slide list, without
+regenerating any slide content:
+
+- .pen: slides are ordered left to right, laid out from the first slide's
+  x with SLIDE_GAP between frames, "NN - Title" names and the footer
+  number (the slide's direct-child numeric text node that holds its old
+  number, wherever it sits among the children) are renumbered. Edits go through pen_journal.PenSession, so they land in the
+  journal and can be undone.
+- .pptx: the <p:sldIdLst> entries are reordered (dropped slides lose their
+  relationship) and each slide's footer - the shape generate_pptx names
+  "Slide Number" - gets its new number with its formatting kept.
+
+To insert a slide, add it first (session.insert for a .pen, add_slide for
+a deck, which appends) and then reflow with it at its new position.
+"""
+
+import argparse
+import re
+import sys
+
+from deck_writer import save_presentation
+from pen_journal import PenSession
+
+SLIDE_GAP = 100
+_NUMBERED = re.compile(r"(\d+)( - .*)", re.DOTALL)
+
+
+def parse_order(spec, count, allow_empty=False):
+    """Turn "1-5,15,6-14" into 0-based slide indices, checking bounds.
+
+    A descending range ("15-6") lists its slides in reverse. An order that
+    keeps no slides is refused unless ``allow_empty``.
+    """
+    order = []
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        first, _, last = part.partition("-")
+        try:
+            first, last = int(first), int(last or first)
+        except ValueError:
+            raise ValueError(f"--order {spec!r}: bad entry {part!r}") from None
+        step = 1 if last >= first else -1
+        order.extend(range(first, last + step, step))
+    bad = [n for n in order if not 1 <= n <= count]
+    if bad or len(set(order)) != len(order):
+        raise ValueError(f"--order {spec!r} must name slides 1-{count} "
+                         "at most once each")
+    if not order and not allow_empty:
+        raise ValueError(f"--order {spec!r} would drop every slide")
+    return [n - 1 for n in order]
+
+
+def pen_slides(session):
+    """Top-level frames in visual order (as pen_content reads them)."""
+    return sorted(session.children_of(None),
+                  key=lambda n: (n.get("y", 0), n.get("x", 0)))
+
+
+def pen_footer(slide, old_numbers):
+    """The slide's footer: a direct-child text node whose content is one
+    of ``old_numbers`` (its current position, or the "NN" of its name)."""
+    for child in reversed(slide.get("children", ())):
+        content = child.get("content", "")
+        if (child.get("type") == "text" and content.isdigit()
+                and int(content) in old_numbers):
+            return child
+    return None
+
+
+def reflow_pen(session, order=None, gap=SLIDE_GAP, first=1):
+    """Lay slides out in ``order`` (slide ids; default: current visual
+    order), dropping the rest. Returns the number of ops recorded."""
+    slides = pen_slides(session)
+    order = list(order or (s["id"] for s in slides))
+    recorded = len(session.pending)
+    position = {s["id"]: n for n, s in enumerate(slides, first)}
+    x = min((s.get("x", 0) for s in slides), default=0)
+    for node_id in {s["id"] for s in slides} - set(order):
+        session.remove(node_id)
+    if [s["id"] for s in session.children_of(None)] != order:
+        session.order(None, order)
+    for number, node_id in enumerate(order, first):
+        slide = session.node(node_id)
+        if slide.get("x") != x:
+            session.set(node_id, "x", x)
+        m = _NUMBERED.fullmatch(slide.get("name", ""))
+        old_numbers = {position.get(node_id)} | ({int(m[1])} if m else set())
+        if m and m[1] != f"{number:02d}":
+            session.set(node_id, "name", f"{number:02d}{m[2]}")
+        footer = pen_footer(slide, old_numbers)
+        if footer is not None and footer["content"] != f"{number:02d}":
+            session.set(footer["id"], "content", f"{number:02d}")
+        x += slide.get("width", 0) + gap
+    return len(session.pending) - recorded
+
+
+def _footer(slide, old_number):
+    from generate_pptx import SLIDE_NUMBER_NAME
+
+    for shape in slide.shapes:
+        if shape.name == SLIDE_NUMBER_NAME and shape.has_text_frame:
+            return shape
+    # Decks saved before the footer was named: match the old number
+    for shape in slide.shapes:
+        if shape.has_text_frame and shape.text_frame.text == \
+                f"{old_number:02d}":
+            return shape
+    return None
+
+
+def reflow_pptx(prs, order, first=1):
+    """Reorder ``prs`` to ``order`` (0-based current indices), dropping
+    slides left out, and renumber footers. Returns the new slide count."""
+    sld_id_lst = prs.slides._sldIdLst
+    entries = list(sld_id_lst)
+    keep = {id(entries[i]) for i in order}
+    for entry in entries:
+        sld_id_lst.remove(entry)
+        if id(entry) not in keep:
+            prs.part.drop_rel(entry.rId)
+    for number, index in enumerate(order, first):
+        entry = entries[index]
+        sld_id_lst.append(entry)
+        footer = _footer(prs.part.related_slide(entry.rId), index + first)
+        if footer is not None:
+            runs = footer.text_frame.paragraphs[0].runs
+            if runs and runs[0].text != f"{number:02d}":
+                runs[0].text = f"{number:02d}"
+    return len(order)
+
+
+def reflow_file(path, spec, output=None, allow_empty=False):
+    """Apply an --order spec to one .pen or .pptx; returns a summary."""
+    if path.endswith(".pen"):
+        session = PenSession(path)
+        slides = pen_slides(session)
+        order = [slides[i]["id"]
+                 for i in parse_order(spec, len(slides), allow_empty)]
+        ops = reflow_pen(session, order)
+        session.save()
+        return f"{path}: {len(order)} slides, {ops} ops journaled"
+    from pptx import Presentation
+
+    prs = Presentation(path)
+    order = parse_order(spec, len(prs.slides), allow_empty)
+    reflow_pptx(prs, order)
+    written = save_presentation(prs, output or path)
+    return (f"{output or path}: {len(order)} slides, "
+            f"{'saved' if written else 'unchanged'}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help=".pen and/or .pptx files")
+    parser.add_argument("--order", required=True,
+                        help='current slide numbers in their new order, '
+                             'e.g. "1-5,15,6-14"')
+    parser.add_argument("-o", "--output",
+                        help="write the reflowed deck here (one .pptx only)")
+    parser.add_argument("--allow-empty", action="store_true",
+                        help="allow an order that drops every slide")
+    args = parser.parse_args(argv)
+    if args.output and (len(args.paths) != 1
+                        or args.paths[0].endswith(".pen")):
+        parser.error("-o needs exactly one .pptx input")
+    for path in args.paths:
+        try:
+            print(reflow_file(path, args.order, args.output,
+                              args.allow_empty))
+        except ValueError as exc:
+            sys.exit(f"{path}: {exc}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Re-skin a generated PPTX or a .pen design through a colour mapping.
+
+Colours are rewritten in one regex pass over the raw text - every
+<a:srgbClr val="..."/> in the PPTX XML parts, and every "#RRGGBB" or
+"#RRGGBBAA" string in a .pen file (solid fills, strokes, gradient stops,
+variables and $styles entries alike, alpha kept). Nothing is parsed or
+rebuilt, so a deck re-skins in milliseconds and unmapped bytes stay
+exactly as they were.
+
+    python retheme.py BlockTrace_Pitch_Deck.pptx --palette light \\
+        -o BlockTrace_Pitch_Deck-light.pptx
+    python retheme.py website.pen --palette brand.json -o website-brand.pen
+
+A palette is a built-in name (see PALETTES) or a JSON file mapping
+"#RRGGBB" to "#RRGGBB". All colours are swapped simultaneously, so
+palettes may exchange two colours.
+"""
+
+import argparse
+import io
+import json
+import os
+import re
+import sys
+import zipfile
+
+import penfile
+from deck_writer import write_if_changed, write_zip
+from pen_journal import journal_path, load_current
+
+PALETTES = {
+    # Dark deck -> light deck; keys are the generate_pptx/.pen theme colours
+    "light": {
+        "#0A0F1C": "#FFFFFF",  # BG_DARK / BLACK
+        "#1E293B": "#F1F5F9",  # CARD_BG
+        "#0F172A": "#E2E8F0",  # DARKER_BG
+        "#22D3EE": "#0891B2",  # ACCENT
+        "#FFFFFF": "#0F172A",  # WHITE
+        "#B4BFCC": "#334155",  # GRAY_LIGHT
+        "#94A3B8": "#475569",  # GRAY_MED
+        "#728197": "#64748B",  # GRAY_DARK
+    },
+}
+
+_PPTX_COLOR = re.compile(rb'(<a:srgbClr val=")([0-9A-Fa-f]{6})(")')
+_PEN_COLOR = re.compile(r'"#([0-9A-Fa-f]{6})([0-9A-Fa-f]{2})?"')
+
+
+def load_palette(name_or_path):
+    if name_or_path in PALETTES:
+        mapping = PALETTES[name_or_path]
+    else:
+        with open(name_or_path, encoding="utf-8") as f:
+            mapping = json.load(f)
+    return {_hex(k): _hex(v) for k, v in mapping.items()}
+
+
+def _hex(color):
+    value = color.lstrip("#").upper()
+    if not re.fullmatch(r"[0-9A-F]{6}", value):
+        raise ValueError(f"palette colours must be #RRGGBB, not {color!r}")
+    return value
+
+
+def retheme_xml(data, palette):
+    """Rewrite srgbClr values in one XML part's bytes."""
+    table = {k.encode(): v.encode() for k, v in palette.items()}
+
+    def swap(m):
+        new = table.get(m.group(2).upper())
+        return m.group(1) + new + m.group(3) if new else m.group(0)
+
+    return _PPTX_COLOR.sub(swap, data)
+
+
+def retheme_pptx(data, palette):
+    src = zipfile.ZipFile(io.BytesIO(data))
+    members = {}
+    for name in src.namelist():
+        part = src.read(name)
+        if name.endswith(".xml") and name.startswith("ppt/"):
+            part = retheme_xml(part, palette)
+        members[name] = part
+    return write_zip(members)
+
+
+def retheme_pen(text, palette):
+    def swap(m):
+        new = palette.get(m.group(1).upper())
+        return f'"#{new}{m.group(2) or ""}"' if new else m.group(0)
+
+    return _PEN_COLOR.sub(swap, text)
+
+
+def retheme_file(src, dest, palette):
+    """Re-skin ``src`` into ``dest``; returns True if ``dest`` was written."""
+    if src.endswith(".pen"):
+        if os.path.exists(journal_path(src)):
+            # Journaled edits live outside the snapshot text
+            text = penfile.dumps(load_current(src))
+        else:
+            with open(src, encoding="utf-8") as f:
+                text = f.read()
+        data = retheme_pen(text, palette).encode("utf-8")
+    else:
+        with open(src, "rb") as f:
+            data = retheme_pptx(f.read(), palette)
+    return write_if_changed(dest, data)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", help=".pptx or .pen file")
+    parser.add_argument("--palette", required=True,
+                        help=f"one of {', '.join(PALETTES)} or a JSON file")
+    parser.add_argument("-o", "--output")
+    args = parser.parse_args(argv)
+    root, ext = os.path.splitext(args.source)
+    suffix = os.path.splitext(os.path.basename(args.palette))[0]
+    dest = args.output or f"{root}-{suffix}{ext}"
+    palette = load_palette(args.palette)
+    written = retheme_file(args.source, dest, palette)
+    print(f"{'Saved' if written else 'Unchanged'} {dest}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""Generate synthetic .pen documents and deck specs for scale testing.
+
+Documents are shaped and named like pitch-deck.pen - 1920x1080 slide
+frames on a 2020 px stride with gradient backgrounds, an accent top line,
+a header block h{n} (l{n}, t{n}, d{n}), a card grid grid{n} of columns
+col{n}a, col{n}b, ... holding cards b1, b2, ... (icon_font + title +
+description) and a footer sn{n} - so update_pitch_deck-style edits and the
+PPTX build can be load-tested far beyond the 14-slide deck. With
+--depth 2 --nodes-per-frame 2, slide 6 has the two-card col6a/col6b
+columns update_pitch_deck.py fills in:
+
+    python scale_gen.py pen --slides 200 --nodes-per-frame 2 -o syn/deck.pen
+    python update_pitch_deck.py syn/deck.pen
+
+    python scale_gen.py pen --slides 200 --depth 3 --nodes-per-frame 6 \\
+        -o build/scale/deck.pen
+    python scale_gen.py spec --slides 2000 --nodes-per-frame 8 --images 50 \\
+        -o build/scale/spec.json
+"""
+
+import argparse
+import json
+import os
+import random
+import string
+import struct
+import sys
+import zlib
+
+import penfile
+
+SLIDE_W, SLIDE_H, SLIDE_GAP = 1920, 1080, 100
+ICONS = ("network", "calendar-days", "git-merge", "bell", "shield", "layers",
+         "box", "cpu", "file-text", "link")
+WORDS = ("asset", "token", "provenance", "ledger", "component", "audit",
+         "compliance", "lifecycle", "anchor", "verifiable", "enterprise",
+         "supply", "chain", "record", "certificate", "composable", "graph")
+
+
+def write_png(path, width, height, rgb):
+    """Write a solid-colour RGB PNG without any imaging dependency."""
+    row = b"\x00" + bytes(rgb) * width
+    raw = zlib.compress(row * height, 9)
+
+    def chunk(kind, data):
+        return (struct.pack(">I", len(data)) + kind + data
+                + struct.pack(">I", zlib.crc32(kind + data)))
+
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height,
+                                           8, 2, 0, 0, 0)))
+        f.write(chunk(b"IDAT", raw))
+        f.write(chunk(b"IEND", b""))
+
+
+def write_images(directory, count, rng, size=(320, 200)):
+    os.makedirs(directory, exist_ok=True)
+    names = []
+    for i in range(count):
+        name = f"synthetic-{i:04d}.png"
+        write_png(os.path.join(directory, name), *size,
+                  [rng.randrange(256) for _ in range(3)])
+        names.append(name)
+    return names
+
+
+def _letter(i):
+    return string.ascii_lowercase[i] if i < 26 else str(i)
+
+
+class Generator:
+    def __init__(self, seed=0, text_length=120):
+        self.rng = random.Random(seed)
+        self.text_length = text_length
+        self.ids = set()
+        self.cards = 0
+
+    def new_id(self):
+        alphabet = string.ascii_letters + string.digits
+        while True:
+            node_id = "".join(self.rng.choice(alphabet) for _ in range(5))
+            if node_id not in self.ids:
+                self.ids.add(node_id)
+                return node_id
+
+    def words(self, length):
+        out = []
+        while sum(len(w) + 1 for w in out) < length:
+            out.append(self.rng.choice(WORDS))
+        return " ".join(out).capitalize()[:max(length, 1)]
+
+    def text(self, content, size, family="Inter", weight="normal", **extra):
+        node = {"type": "text", "id": self.new_id(), "fill": "#B4BFCC"}
+        node.update(extra)
+        node.update({"content": content, "fontFamily": family,
+                     "fontSize": size, "fontWeight": weight})
+        return node
+
+    def card(self, name, image=None):
+        node = {
+            "type": "frame", "id": self.new_id(), "name": name,
+            "width": "fill_container", "fill": "#1E293B",
+            "cornerRadius": 12, "layout": "vertical", "gap": 12,
+            "padding": 28,
+            "children": [
+                {"type": "icon_font", "id": self.new_id(),
+                 "width": 28, "height": 28,
+                 "iconFontName": self.rng.choice(ICONS),
+                 "iconFontFamily": "lucide", "fill": "#22D3EE"},
+                self.text(self.words(24), 20, weight="700",
+                          fill="#FFFFFF"),
+                self.text(self.words(self.text_length), 15,
+                          textGrowth="fixed-width", width="fill_container",
+                          lineHeight=1.5),
+            ],
+        }
+        if image:
+            node["fill"] = [node["fill"], {"type": "image", "enabled": True,
+                                           "url": f"./images/{image}",
+                                           "mode": "fill"}]
+        return node
+
+    def grid(self, depth, fanout, images, path):
+        """Children of a grid frame nested ``depth`` frame levels deep;
+        columns are named ``path`` plus a letter (col6a, col6ab, ...)."""
+        if depth <= 1:
+            cards = []
+            for _ in range(fanout):
+                self.cards += 1
+                cards.append(self.card(f"b{self.cards}",
+                                       images.pop() if images else None))
+            return cards
+        return [{
+            "type": "frame", "id": self.new_id(),
+            "name": f"{path}{_letter(i)}",
+            "width": "fill_container",
+            "layout": "vertical" if depth % 2 == 0 else "horizontal",
+            "gap": 20,
+            "children": self.grid(depth - 1, fanout, images,
+                                  f"{path}{_letter(i)}"),
+        } for i in range(fanout)]
+
+    def slide(self, index, depth, fanout, images):
+        number = f"{index + 1:02d}"
+        n = index + 1
+        self.cards = 0
+        return {
+            "type": "frame", "id": self.new_id(),
+            "x": index * (SLIDE_W + SLIDE_GAP), "y": 0,
+            "name": f"{number} - {self.words(18).title()}",
+            "clip": True, "width": SLIDE_W, "height": SLIDE_H,
+            "fill": ["#0A0F1C", {
+                "type": "gradient", "gradientType": "radial",
+                "enabled": True, "rotation": 0,
+                "size": {"width": 1.2, "height": 1.2},
+                "colors": [{"color": "#1E293B", "position": 0},
+                           {"color": "#0A0F1C00", "position": 0.7}],
+            }],
+            "layout": "none",
+            "children": [
+                {"type": "rectangle", "id": self.new_id(), "x": 0, "y": 0,
+                 "name": "topLine", "fill": {
+                     "type": "gradient", "gradientType": "linear",
+                     "enabled": True, "rotation": 0, "size": {"height": 1},
+                     "colors": [{"color": "#22D3EE00", "position": 0},
+                                {"color": "#22D3EE", "position": 0.5},
+                                {"color": "#22D3EE00", "position": 1}]},
+                 "width": SLIDE_W, "height": 3},
+                {"type": "frame", "id": self.new_id(), "x": 120, "y": 80,
+                 "name": f"h{n}", "width": 1680, "layout": "vertical",
+                 "gap": 16, "children": [
+                     self.text(self.words(14).upper(), 14,
+                               "JetBrains Mono", "700", name=f"l{n}",
+                               fill="#22D3EE", letterSpacing=2),
+                     self.text(self.words(40), 44, weight="700",
+                               name=f"t{n}", fill="#FFFFFF"),
+                     self.text(self.words(self.text_length), 18,
+                               name=f"d{n}", textGrowth="fixed-width",
+                               width=800, lineHeight=1.5),
+                 ]},
+                {"type": "frame", "id": self.new_id(), "x": 120, "y": 330,
+                 "name": f"grid{n}", "width": 1680, "height": 640,
+                 "gap": 20,
+                 "children": self.grid(depth, fanout, images, f"col{n}")},
+                self.text(number, 14, "JetBrains Mono", name=f"sn{n}",
+                          fill="#728197", x=1780, y=1010),
+            ],
+        }
+
+
+def count_nodes(nodes):
+    return sum(1 + count_nodes(n.get("children", ())) for n in nodes)
+
+
+def synthetic_pen(slides=14, depth=2, nodes_per_frame=3, images=(),
+                  text_length=120, seed=0):
+    gen = Generator(seed, text_length)
+    pool = list(images)
+    per_slide = -(-len(pool) // slides) if pool else 0
+    children = []
+    for i in range(slides):
+        mine = pool[i * per_slide:(i + 1) * per_slide]
+        children.append(gen.slide(i, depth, nodes_per_frame, mine))
+    return {"version": "2.8", "children": children}
+
+
+def synthetic_spec(slides=14, nodes_per_frame=4, images=(), text_length=120,
+                   seed=0):
+    gen = Generator(seed, text_length)
+    pool = list(images)
+    per_slide = -(-len(pool) // slides) if pool else 0
+    out = []
+    for i in range(slides):
+        out.append({
+            "label": gen.words(14).upper(),
+            "title": gen.words(40),
+            "description": gen.words(text_length),
+            "cards": [{"icon": "*", "title": gen.words(24),
+                       "desc": gen.words(text_length)}
+                      for _ in range(nodes_per_frame)],
+            "images": pool[i * per_slide:(i + 1) * per_slide],
+        })
+    return {"slides": out}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("kind", choices=("pen", "spec"))
+    parser.add_argument("--slides", type=int, default=14)
+    parser.add_argument("--depth", type=int, default=2,
+                        help="grid nesting depth (.pen only)")
+    parser.add_argument("--nodes-per-frame", type=int, default=3,
+                        help="children per grid frame / cards per slide")
+    parser.add_argument("--images", type=int, default=0)
+    parser.add_argument("--text-length", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", required=True)
+    args = parser.parse_args(argv)
+
+    out_dir = os.path.dirname(os.path.abspath(args.output))
+    os.makedirs(out_dir, exist_ok=True)
+    names = write_images(os.path.join(out_dir, "images"), args.images,
+                         random.Random(args.seed))
+
+    if args.kind == "pen":
+        doc = synthetic_pen(args.slides, args.depth, args.nodes_per_frame,
+                            names, args.text_length, args.seed)
+        penfile.save(args.output, doc)
+        print(f"Wrote {args.output}: {args.slides} slides, "
+              f"{count_nodes(doc['children']):,} nodes, {len(names)} images")
+    else:
+        paths = [os.path.join(out_dir, "images", n) for n in names]
+        spec = synthetic_spec(args.slides, args.nodes_per_frame, paths,
+                              args.text_length, args.seed)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(spec, f, indent=2)
+        print(f"Wrote {args.output}: {args.slides} slides, "
+              f"{args.slides * args.nodes_per_frame:,} cards, "
+              f"{len(names)} images")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,92 @@
+import io
+import struct
+
+import pytest
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from pptx import Presentation
+from pptx.util import Inches
+
+import buildcache
+import font_embed
+
+FAMILY = "Testface"
+
+
+def _font_bytes(weight):
+    chars = "ABC "
+    names = [".notdef"] + [f"g{ord(c)}" for c in chars]
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(names)
+    fb.setupCharacterMap({ord(c): f"g{ord(c)}" for c in chars})
+    pen = TTGlyphPen(None)
+    pen.moveTo((100, 0))
+    pen.lineTo((100, 700))
+    pen.lineTo((500, 700))
+    pen.closePath()
+    box = pen.glyph()
+    fb.setupGlyf({name: box for name in names})
+    fb.setupHorizontalMetrics({name: (600, 100) for name in names})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": FAMILY,
+                       "styleName": "Bold" if weight == 700 else "Regular"})
+    fb.setupOS2(usWeightClass=weight)
+    fb.setupPost()
+    buf = io.BytesIO()
+    fb.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def fonts(tmp_path, monkeypatch):
+    for weight, style in ((400, "Regular"), (700, "Bold")):
+        (tmp_path / f"{FAMILY}-{style}.ttf").write_bytes(_font_bytes(weight))
+    monkeypatch.setattr(font_embed, "FONT_DIRS", [str(tmp_path)])
+    monkeypatch.setattr(buildcache, "CACHE_DIR", str(tmp_path / "cache"))
+    font_embed._subset_memo.clear()
+
+
+def _deck():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    group = slide.shapes.add_group_shape()
+    box = group.shapes.add_textbox(0, 0, Inches(2), Inches(1))
+    run = box.text_frame.paragraphs[0].add_run()
+    run.text, run.font.name = "AB", FAMILY
+    table = slide.shapes.add_table(1, 1, 0, Inches(2), Inches(2),
+                                   Inches(1)).table
+    run = table.cell(0, 0).text_frame.paragraphs[0].add_run()
+    run.text, run.font.name, run.font.bold = "C", FAMILY, True
+    return prs
+
+
+def test_collect_glyphs_reaches_groups_and_tables():
+    used = font_embed.collect_glyphs(_deck())
+    assert used[(FAMILY, False)] == {"A", "B"}
+    assert used[(FAMILY, True)] == {"C"}
+
+
+def test_eot_header_wraps_font_data():
+    ttf = _font_bytes(700)
+    eot = font_embed.eot_wrap(ttf)
+    size, data_size, version, flags = struct.unpack_from("<4L", eot)
+    assert (size, data_size, version) == (len(eot), len(ttf), 0x00020001)
+    assert flags & font_embed.TTEMBED_SUBSET
+    weight, = struct.unpack_from("<L", eot, 28)
+    magic, = struct.unpack_from("<H", eot, 34)
+    assert (weight, magic) == (700, 0x504C)
+    family_size, = struct.unpack_from("<H", eot, 82)
+    assert eot[84:84 + family_size].decode("utf-16-le") == FAMILY
+    assert eot.endswith(ttf)
+
+
+def test_embedding_twice_takes_free_partnames(fonts):
+    prs = _deck()
+    assert font_embed.embed_fonts(prs) == [(FAMILY, False), (FAMILY, True)]
+    font_embed.embed_fonts(prs)
+    names = sorted(str(p.partname) for p in prs.part.package.iter_parts()
+                   if str(p.partname).startswith("/ppt/fonts/"))
+    assert names == [f"/ppt/fonts/font{n}.fntdata" for n in (1, 2, 3, 4)]
+    buf = io.BytesIO()
+    prs.save(buf)
+    Presentation(io.BytesIO(buf.getvalue()))
@@ -0,0 +1,32 @@
+import io
+import zipfile
+
+import generate_pptx
+from generate_pptx import new_presentation
+
+
+def _slide_parts(prs):
+    buf = io.BytesIO()
+    prs.save(buf)
+    return [n for n in zipfile.ZipFile(buf).namelist()
+            if n.startswith("ppt/slides/slide")]
+
+
+def test_clones_do_not_share_slides():
+    first = new_presentation()
+    first.slides.add_slide(first.slide_layouts[6])
+    second = new_presentation()
+    assert len(second.slides) == 0
+    second.slides.add_slide(second.slide_layouts[6])
+    assert _slide_parts(second) == ["ppt/slides/slide1.xml"]
+
+
+def test_lazy_state_on_the_base_does_not_leak():
+    base = generate_pptx._prepared_base()
+    assert len(base.slides) == 0
+    base.slide_masters[0].slide_layouts
+    prs = new_presentation()
+    for _ in range(2):
+        prs.slides.add_slide(prs.slide_layouts[6])
+    assert _slide_parts(prs) == ["ppt/slides/slide1.xml",
+                                 "ppt/slides/slide2.xml"]
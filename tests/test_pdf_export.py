@@ -0,0 +1,58 @@
+from pptx import Presentation
+from pptx.enum.text import MSO_ANCHOR
+from pptx.util import Inches, Pt
+
+import pdf_export
+
+
+class RecordingCanvas:
+    """Collects (text, font, size, x, y) for every drawString call."""
+
+    def __init__(self):
+        self.drawn = []
+        self.font = None
+
+    def setFont(self, name, size):
+        self.font = (name, size)
+
+    def setFillColorRGB(self, *rgb):
+        pass
+
+    def drawString(self, x, y, text):
+        self.drawn.append((text, *self.font, x, y))
+
+
+def _frame(anchor=None):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    box = slide.shapes.add_textbox(0, 0, Inches(4), Inches(2))
+    frame = box.text_frame
+    if anchor is not None:
+        frame.vertical_anchor = anchor
+    p = frame.paragraphs[0]
+    for text, size, bold in (("Big ", 24, True), ("small", 10, False)):
+        run = p.add_run()
+        run.text, run.font.size, run.font.bold = text, Pt(size), bold
+    return frame
+
+
+def _draw(frame):
+    c = RecordingCanvas()
+    pdf_export.draw_text(c, frame, 0, 144, 288, 144)
+    return c.drawn
+
+
+def test_each_run_keeps_its_font_and_size():
+    drawn = _draw(_frame())
+    assert [(text, size) for text, _, size, _, _ in drawn] == [
+        ("Big", 24), (" ", 24), ("small", 10)]
+    assert drawn[0][1] != drawn[2][1]
+    assert drawn[2][3] > drawn[0][3]
+
+
+def test_vertical_anchor_moves_the_text_down():
+    top, middle, bottom = (_draw(_frame(anchor))[0][4] for anchor in
+                           (MSO_ANCHOR.TOP, MSO_ANCHOR.MIDDLE,
+                            MSO_ANCHOR.BOTTOM))
+    assert top > middle > bottom
+    assert abs((top - middle) - (middle - bottom)) < 0.01
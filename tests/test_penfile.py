@@ -0,0 +1,26 @@
+import penfile
+
+FILL = {"type": "gradient", "colors": [{"color": "#22D3EE", "position": 0},
+                                       {"color": "#0A0F1C", "position": 1}]}
+
+
+def _doc():
+    return {"version": "2.6", "children": [
+        {"type": "frame", "id": "a", "fill": dict(FILL)},
+        {"type": "frame", "id": "b", "fill": dict(FILL)},
+    ]}
+
+
+def test_compact_round_trip():
+    doc = _doc()
+    compacted = penfile.compact_styles(doc)
+    assert penfile.STYLE_TABLE in compacted
+    assert penfile.expand_styles(compacted) == doc
+
+
+def test_expanded_styles_are_not_shared():
+    doc = penfile.loads(penfile.dumps(_doc(), compact=True))
+    first, second = doc["children"]
+    assert first["fill"] is not second["fill"]
+    first["fill"]["colors"][0]["color"] = "#FFFFFF"
+    assert second["fill"]["colors"][0]["color"] == "#22D3EE"
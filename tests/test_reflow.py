@@ -0,0 +1,48 @@
+import os
+import shutil
+
+import pytest
+
+from pen_journal import PenSession
+from reflow import parse_order, pen_slides, reflow_file
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_parse_order_ranges():
+    assert parse_order("1-3,5,4", 5) == [0, 1, 2, 4, 3]
+
+
+def test_parse_order_descending_range():
+    assert parse_order("15-6", 15) == list(range(14, 4, -1))
+
+
+@pytest.mark.parametrize("spec", ["1,1", "0-2", "3-9", "x"])
+def test_parse_order_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        parse_order(spec, 5)
+
+
+def test_parse_order_refuses_empty_unless_allowed():
+    with pytest.raises(ValueError):
+        parse_order("", 5)
+    assert parse_order("", 5, allow_empty=True) == []
+
+
+def _slide_state(session, node_id):
+    slide = session.node(node_id)
+    footer = next(c for c in slide["children"]
+                  if c.get("type") == "text" and c.get("content", "").isdigit())
+    return slide["name"][:2], footer["content"]
+
+
+def test_reflow_pen_renumbers_footers_that_are_not_last(tmp_path):
+    pen = tmp_path / "pitch-deck.pen"
+    shutil.copy(os.path.join(REPO, "pitch-deck.pen"), pen)
+    reflow_file(str(pen), "1-9,11,10,12-14")
+    session = PenSession(str(pen))
+    # Business Model's footer sits mid-list; Go-To-Market ends in a shape
+    assert _slide_state(session, "Ky6rX") == ("11", "11")
+    assert _slide_state(session, "jOmv4") == ("10", "10")
+    for number, slide in enumerate(pen_slides(session), 1):
+        assert _slide_state(session, slide["id"]) == (f"{number:02d}",) * 2
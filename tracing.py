@@ -0,0 +1,143 @@
+"""Nested trace spans for the deck pipeline, written to a local file.
+
+    import tracing
+    tracing.configure("build/trace.json")   # or BLOCKTRACE_TRACE=...
+    with tracing.span("slide.build", builder="build_title") as sp:
+        ...
+        sp.set(shapes=12)
+    tracing.close()
+
+A path ending in .jsonl gets one JSON object per finished span (name,
+start, duration, parent, attributes); anything else gets Chrome trace
+format, viewable in chrome://tracing or Perfetto. Until configure() is
+called the module-level tracer is NULL_TRACER, whose span() returns a
+shared no-op context, so instrumented code costs a function call.
+Attributes that cost something to compute go behind enabled():
+
+    if tracing.enabled():
+        sp.set(shapes=len(slide.shapes))
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+
+
+class Span:
+    __slots__ = ("name", "attrs", "start", "parent", "depth")
+
+    def __init__(self, name, attrs, parent, depth):
+        self.name = name
+        self.attrs = attrs
+        self.parent = parent
+        self.depth = depth
+        self.start = time.perf_counter_ns()
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+
+class Tracer:
+    def __init__(self, path):
+        self.path = path
+        self.chrome = not path.endswith(".jsonl")
+        self.events = []
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self._local = threading.local()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextlib.contextmanager
+    def span(self, name, **attrs):
+        stack = self._stack()
+        sp = Span(name, attrs, stack[-1].name if stack else None, len(stack))
+        stack.append(sp)
+        try:
+            yield sp
+        except BaseException as exc:
+            sp.attrs["error"] = type(exc).__name__
+            raise
+        finally:
+            stack.pop()
+            self._finish(sp, time.perf_counter_ns())
+
+    def _finish(self, sp, end):
+        start_us = (sp.start - self.origin) / 1000
+        dur_us = (end - sp.start) / 1000
+        if self.chrome:
+            self.events.append({
+                "name": sp.name, "ph": "X", "ts": round(start_us, 3),
+                "dur": round(dur_us, 3), "pid": self.pid,
+                "tid": threading.get_ident(), "args": sp.attrs})
+        else:
+            self.events.append({
+                "name": sp.name, "start_ms": round(start_us / 1000, 3),
+                "duration_ms": round(dur_us / 1000, 3),
+                "parent": sp.parent, "depth": sp.depth,
+                "attrs": sp.attrs})
+
+    def close(self):
+        if not self.events:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)),
+                    exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            if self.chrome:
+                json.dump({"traceEvents": self.events,
+                           "displayTimeUnit": "ms"}, f, default=str)
+            else:
+                for event in self.events:
+                    f.write(json.dumps(event, default=str) + "\n")
+        self.events = []
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def set(self, **attrs):
+        pass
+
+
+class _NullTracer:
+    _context = contextlib.nullcontext(_NullSpan())
+
+    def span(self, name, **attrs):
+        return self._context
+
+    def close(self):
+        pass
+
+
+NULL_TRACER = _NullTracer()
+tracer = NULL_TRACER
+
+
+def span(name, **attrs):
+    return tracer.span(name, **attrs)
+
+
+def enabled():
+    """True once configure() has started a tracer."""
+    return tracer is not NULL_TRACER
+
+
+def configure(path=None):
+    """Start tracing to ``path`` (default: $BLOCKTRACE_TRACE, if set)."""
+    global tracer
+    path = path or os.environ.get("BLOCKTRACE_TRACE")
+    if path and tracer is NULL_TRACER:
+        tracer = Tracer(path)
+        atexit.register(close)
+    return tracer
+
+
+def close():
+    tracer.close()
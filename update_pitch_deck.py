@@ -1,16 +1,20 @@
-import json
+import argparse
 import copy
 
-def update_pitch_deck():
-    file_path = '/Users/dean/Dev/block-trace/pitch-deck.pen'
-    
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+import tracing
+from memprof import NULL_PROFILER, MemoryProfiler
+from pen_content import DEFAULT_PEN
+from pen_journal import PenSession, reassign_ids
+from pen_query import PenIndex
+from reflow import pen_slides, reflow_pen
+
+def update_pitch_deck(file_path=DEFAULT_PEN, profiler=NULL_PROFILER):
     
-    # Configuration
-    slide_width = 1920
-    slide_gap = 100
-    slide_shift = slide_width + slide_gap # 2020
+    with profiler.stage("load"), tracing.span("load", path=file_path):
+        # The order below is computed from what was read, so refuse to
+        # save over edits made in the meantime rather than rebasing
+        session = PenSession(file_path, on_conflict="refuse")
+        data = session.doc
     
     # 1. Construct the new "The Platform" slide
     # We'll base it on Slide 06 (index 5) "Why Token Packs Matter" as it has a grid-like structure
@@ -21,113 +25,97 @@ def update_pitch_deck():
     
     # Deep copy a template slide to modify
     # Assuming Slide 06 (currently at index 5) is a good template
-    template_slide = copy.deepcopy(data['children'][5]) 
+    with profiler.stage("deepcopy"), tracing.span(
+            "deepcopy", slide=data['children'][5]['name']):
+        template_slide = copy.deepcopy(data['children'][5])
     
-    new_slide = template_slide
+    new_slide = reassign_ids(template_slide, set(session.nodes))
     new_slide['id'] = "new_platform_slide"
     new_slide['name'] = "06 - The Platform"
     
-    # Calculate new X position: Previous Slide X + Shift
-    prev_slide_x = data['children'][4]['x']
-    new_slide['x'] = prev_slide_x + slide_shift
-    
+    # Look parts of the copy up by selector rather than ['children'][i]
+    # chains; the template keeps its layer names (h6, col6a, ...)
+    platform = PenIndex(new_slide)
+
+    def fill_card(card, name, icon, title, description):
+        card['name'] = name
+        platform.select_one(f"#{card['id']} > icon_font")['iconFontName'] = icon
+        platform.select_one(f"#{card['id']} > text:nth(1)")['content'] = title
+        platform.select_one(f"#{card['id']} > text:nth(2)")['content'] = description
+
     # --- Update Header Content ---
-    # Structure of header seems to be children[0]
-    header = new_slide['children'][0]
+    label, title, description = platform.select("#h6 > text")
     
     # Update Label "THE PLATFORM"
-    header['children'][0]['content'] = "THE PLATFORM"
+    label['content'] = "THE PLATFORM"
     
     # Update Title "Enterprise Asset Intelligence"
-    header['children'][1]['content'] = "Enterprise Asset Intelligence"
+    title['content'] = "Enterprise Asset Intelligence"
     
     # Update Description
-    header['children'][2]['content'] = "A modern SaaS dashboard built for data-heavy workflows. Explore asset graphs, track lifecycles, and monitor certifications in real time."
+    description['content'] = "A modern SaaS dashboard built for data-heavy workflows. Explore asset graphs, track lifecycles, and monitor certifications in real time."
     
     # --- Update Content Grid ---
-    # Structure of grid seems to be children[1] -> children (columns) -> children (cards)
-    # The template (Slide 06) has 2 columns.
-    # We have 4 items:
-    # 1. Asset Graph Explorer
-    # 2. Timeline View
-    # 3. Component Dependency Map
-    # 4. Certification Validity Alerts
-    
-    # Let's try to put 2 in first col, 2 in second col.
-    
-    # Update Column 1
-    col1 = new_slide['children'][1]['children'][0]
-    # It currently has 2 cards (b1, b2). Perfect.
+    # The template (Slide 06) grid has columns col6a (b1, b2), col6b (b3, b4)
+    # and col6c (b5). We have 4 items: 2 in the first col, 2 in the second.
+    c1, c2 = platform.select("#col6a > frame")
+    c3, c4 = platform.select("#col6b > frame")
     
     # Card 1: Asset Graph Explorer (Network icon)
-    c1 = col1['children'][0]
-    c1['name'] = "prod_card_1"
-    c1['children'][0]['iconFontName'] = "network" # lucide-react 'Network'
-    c1['children'][1]['content'] = "Asset Graph Explorer"
-    c1['children'][2]['content'] = "Visualise complex relationships and dependencies across your entire asset portfolio."
+    fill_card(c1, "prod_card_1", "network", # lucide-react 'Network'
+              "Asset Graph Explorer",
+              "Visualise complex relationships and dependencies across your entire asset portfolio.")
     
     # Card 2: Timeline View (CalendarDays icon)
-    c2 = col1['children'][1]
-    c2['name'] = "prod_card_2"
-    c2['children'][0]['iconFontName'] = "calendar-days" # lucide-react 'CalendarDays'
-    c2['children'][1]['content'] = "Timeline View"
-    c2['children'][2]['content'] = "Track full lifecycle events and mutable history in a linear, auditable timeline."
-
-    # Update Column 2
-    col2 = new_slide['children'][1]['children'][1]
-    # It currently has 2 cards (b3, b4) (Wait, template had 3 in col1, 2 in col2? Let's check original)
-    # Looking at view_file output lines 2213: "col6a" has "b1", "b2". 
-    # Lines 2313: "col6b" has "b3", "b4".
-    # So 2x2. Perfect.
+    fill_card(c2, "prod_card_2", "calendar-days", # lucide-react 'CalendarDays'
+              "Timeline View",
+              "Track full lifecycle events and mutable history in a linear, auditable timeline.")
     
     # Card 3: Component Dependency Map (GitMerge icon)
-    c3 = col2['children'][0]
-    c3['name'] = "prod_card_3"
-    c3['children'][0]['iconFontName'] = "git-merge" # lucide-react 'GitMerge'
-    c3['children'][1]['content'] = "Component Dependency Map"
-    c3['children'][2]['content'] = "Trace sub-assemblies and verify BOMs down to the raw material level."
+    fill_card(c3, "prod_card_3", "git-merge", # lucide-react 'GitMerge'
+              "Component Dependency Map",
+              "Trace sub-assemblies and verify BOMs down to the raw material level.")
     
     # Card 4: Certification Validity Alerts (Bell icon)
-    c4 = col2['children'][1]
-    c4['name'] = "prod_card_4"
-    c4['children'][0]['iconFontName'] = "bell" # lucide-react 'Bell'
-    c4['children'][1]['content'] = "Certification Alerts"
-    c4['children'][2]['content'] = "Proactive monitoring of certification expiry and compliance violations."
+    fill_card(c4, "prod_card_4", "bell", # lucide-react 'Bell'
+              "Certification Alerts",
+              "Proactive monitoring of certification expiry and compliance violations.")
     
     # --- Update Slide Number Footer ---
-    # footer is likely the last child
-    footer = new_slide['children'][-1]
+    footer = platform.select_one("> text:last")
     footer['content'] = "06"
     
-    # 2. Shift subsequent slides and update their numbering
-    for i in range(insert_index, len(data['children'])):
-        slide = data['children'][i]
-        slide['x'] += slide_shift
-        
-        # Update Name "06 - ..." -> "07 - ..."
-        # format is usually "DD - Name"
-        name_parts = slide['name'].split(' - ')
-        if len(name_parts) > 1 and name_parts[0].isdigit():
-            old_num = int(name_parts[0])
-            new_num = old_num + 1
-            slide['name'] = f"{new_num:02d} - {name_parts[1]}"
-            
-        # Update Footer Number
-        # Assuming footer is always the last child and is a text node with the number
-        if slide['children'] and slide['children'][-1]['type'] == 'text':
-            footer_node = slide['children'][-1]
-            if footer_node['content'].isdigit():
-                footer_num = int(footer_node['content'])
-                footer_node['content'] = f"{footer_num + 1:02d}"
-                
-    # 3. Insert the new slide
-    data['children'].insert(insert_index, new_slide)
-    
-    # 4. Save
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    # 2. Insert the new slide, then lay the deck out again: x positions,
+    # "NN - " names and footer numbers all follow the new order
+    order = [slide['id'] for slide in pen_slides(session)]
+    order.insert(insert_index, new_slide['id'])
+    with tracing.span("insert", slide=new_slide['name'],
+                      children=len(new_slide['children'])):
+        session.insert(None, insert_index, new_slide)
+    with tracing.span("reflow", first=insert_index) as sp:
+        sp.set(ops=reflow_pen(session, order))
+    
+    # 3. Save (appends the new ops to pitch-deck.pen.journal)
+    with profiler.stage("save"), tracing.span("save", path=file_path) as sp:
+        sp.set(ops=len(session.pending), bytes=session.save())
         
     print("Successfully updated pitch-deck.pen")
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Insert the Platform slide into pitch-deck.pen.")
+    parser.add_argument("pen", nargs="?", default=DEFAULT_PEN)
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="print a per-stage tracemalloc report")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="write stage spans here (.jsonl for JSON lines, "
+                             "anything else Chrome trace format)")
+    args = parser.parse_args(argv)
+    profiler = MemoryProfiler() if args.profile_memory else NULL_PROFILER
+    tracing.configure(args.trace)
+    update_pitch_deck(args.pen, profiler)
+    profiler.report()
+    tracing.close()
+
 if __name__ == "__main__":
-    update_pitch_deck()
+    main()